@@ -81,13 +81,13 @@ class AnimatedCharacter(GameObject):
     def is_sitting(self):
         return self.character.is_sitting
 
-    def stand_up(self, platforms):
+    def stand_up(self, world):
         """Делегирование вставание Character"""
-        self.character.stand_up(platforms)
+        self.character.stand_up(world)
 
-    def apply_physics(self, game_objects, screen_width, screen_height):
+    def apply_physics(self, world, screen_width, screen_height, left_bound=0):
         """Делегирование физики Character"""
-        self.character.apply_physics(game_objects, screen_width, screen_height)
+        self.character.apply_physics(world, screen_width, screen_height, left_bound)
 
     def update(self):
         """Обновление состояния объекта"""
@@ -97,6 +97,10 @@ class AnimatedCharacter(GameObject):
         """Отрисовка объекта на поверхности"""
         self.animated_object.draw(surface, camera_offset)
 
+    def get_draw_state(self):
+        """Текущий кадр анимации и направление взгляда"""
+        return self.animated_object.current_action, self.animated_object.frame, self.animated_object.direction
+
     def check_collision(self, other_rect: pygame.Rect) -> bool:
         """Проверка коллизии с другим объектом"""
         return self.character.rect.colliderect(other_rect)
\ No newline at end of file
@@ -2,12 +2,14 @@ import pygame
 from Characters.action import Action
 from Characters.character import Character
 from custom_logging import Logger
+from levels.assets import asset_cache
 
 class AnimatedObject:
    def __init__(self, character: Character):
       self.character = character
       self.animation_speed = 100  # ms per frame
-      self.frames = {}  # Хранит кадры для каждого действия
+      self.frames = {}  # Хранит кадры для каждого действия (взгляд вправо)
+      self.mirrored_frames = {}  # Отражённые кадры для каждого действия (взгляд влево)
       self.current_action = Action.IDLE
       self.prev_action = None  # Добавлено для отслеживания предыдущего действия
       self.frame = 0
@@ -21,21 +23,15 @@ class AnimatedObject:
       }
 
    def load_action_frames(self, action: Action, file_path: str, frame_count: int, sit_frames: bool = False):
-      """Загружает кадры для конкретного действия"""
-      sprite_sheet = pygame.image.load(file_path).convert_alpha()
-      frame_width = sprite_sheet.get_width() // frame_count
-      frame_height = sprite_sheet.get_height()
-
-      frames = []
-      for i in range(frame_count):
-         frame = sprite_sheet.subsurface(pygame.Rect(i * frame_width, 0, frame_width, frame_height))
-         if sit_frames:
-            frame = pygame.transform.scale(frame, (self.character.width, self.character.sit_height))
-         else:
-            frame = pygame.transform.scale(frame, (self.character.width, self.character.height))
-         frames.append(frame)
+      """Загружает кадры для конкретного действия (нарезка и масштабирование - один раз на процесс)"""
+      if sit_frames:
+         size = (self.character.width, self.character.sit_height)
+      else:
+         size = (self.character.width, self.character.height)
 
-      self.frames[action] = frames
+      self.frames[action] = asset_cache.load_frames(file_path, frame_count, size)
+      # Отражённые кадры тоже готовятся заранее, а не в каждом кадре отрисовки
+      self.mirrored_frames[action] = asset_cache.load_frames(file_path, frame_count, size, flip=True)
 
    def update_animation(self):
       """Обновляет кадр анимации и проверяет звуковые триггеры"""
@@ -88,17 +84,13 @@ class AnimatedObject:
       player_rect = self.character.rect.move(camera_offset[0], camera_offset[1])
 
       if self.current_action in self.frames:
-
-
-         frames = self.frames[self.current_action]
-         frame = frames[self.frame]
-
          # Отражение при смене направления
          if self.character.direction != self.direction and self.character.direction != 0:
             self.direction = self.character.direction
 
-         if self.direction == -1:
-            frame = pygame.transform.flip(frame, True, False)
+         # Готовый набор кадров для текущего направления
+         frames = self.mirrored_frames if self.direction == -1 else self.frames
+         frame = frames[self.current_action][self.frame]
 
 
          # Отрисовываем спрайт персонажа
@@ -3,7 +3,7 @@ from typing import cast
 
 from Characters.action import Action
 from Characters.type_object import ObjectType
-from levels.levels import Platform, MovingPlatformVertical
+from levels.levels import MovingPlatformVertical
 from custom_logging import Logger
 
 class Character:
@@ -64,8 +64,8 @@ class Character:
          self.is_sitting = True
          self.current_action = Action.SIT
 
-   def can_stand_up(self, platforms):
-      """Проверка, можно ли встать в текущем месте"""
+   def can_stand_up(self, world):
+      """Проверка, можно ли встать в текущем месте (world - уровень с методом query)"""
       if not self.is_sitting:
          return True
 
@@ -77,19 +77,18 @@ class Character:
          self.original_height
       )
 
-      # Проверяем столкновение со всеми НЕпроходимыми платформами
-      for platform in platforms:
-         if platform.object_type in (ObjectType.PLATFORM, ObjectType.MOVING_PLATFORM):  # Только обычные платформы
-            if stand_rect.colliderect(platform.rect):
-               return False
+      # Проверяем столкновение с НЕпроходимыми платформами и лифтами рядом с игроком
+      for platform in world.query_supports(stand_rect):
+         if stand_rect.colliderect(platform.rect):
+            return False
       return True
 
-   def stand_up(self, platforms):
+   def stand_up(self, world):
       """Пытается встать, если есть место"""
       if not self.is_sitting:
          return True
 
-      if not self.can_stand_up(platforms):
+      if not self.can_stand_up(world):
          return False
 
       # Восстанавливаем высоту, сохраняя позицию низа
@@ -120,7 +119,31 @@ class Character:
       """
       return rect2.left <= rect1.center[0] <= rect2.right
 
-   def apply_physics(self, game_objects, screen_width, screen_height):
+   def get_broadphase_rect(self) -> pygame.Rect:
+      """
+      Область, до которой персонаж может дотянуться за один шаг физики.
+
+      Включает вертикальное смещение за кадр, горизонтальный шаг и рост при вставании.
+      """
+      velocity_y = self.velocity_y + self.gravity
+      swept = self.rect.union(self.rect.move(0, velocity_y))
+      return swept.inflate(2 * (abs(self.speed) + 1), 2 * self.original_height)
+
+   def apply_physics(self, world, screen_width, screen_height, left_bound=0):
+      """
+      Шаг физики персонажа.
+
+      :param world: Уровень; опоры рядом с персонажем - world.query_supports(rect) и сетка world.occupancy
+      :param screen_width: Правая граница уровня (ограничение по горизонтали)
+      :param screen_height: Высота уровня
+      :param left_bound: Левая граница уровня (у бесконечного уровня сдвигается вместе с окном)
+      """
+      # Кандидаты на столкновение - только опоры (платформы, стены, лифты) рядом с персонажем
+      broadphase_rect = self.get_broadphase_rect()
+      occupancy = world.occupancy  # Неподвижные опоры и люки в них
+      solids = occupancy.query(broadphase_rect)  # Нужны обоим проходам - ищем один раз
+      game_objects = world.query_supports(broadphase_rect, solids)
+
       # Гравитация и вертикальное движение
       prev_rect = self.rect.copy()  # Запоминаем позицию до движения
       self.velocity_y += self.gravity
@@ -128,8 +151,8 @@ class Character:
       self.on_ground = False
       self.on_lift = False
       # Ограничение по горизонтали
-      if self.rect.left < 0:
-         self.rect.left = 0
+      if self.rect.left < left_bound:
+         self.rect.left = left_bound
       if self.rect.right > screen_width:
          self.rect.right = screen_width
 
@@ -143,13 +166,8 @@ class Character:
             # Платформы (физические коллизии)
             if obj.object_type is ObjectType.PLATFORM:
 
-               platform = cast(Platform, obj)  # Явное приведение типа
-               in_hole = False
-               holes = getattr(platform, 'holes', [])  #берём люки с платформы если они есть.
-               for hole in holes:
-                  if self.is_centr_inside_horizontally(self.rect, hole.rect):
-                     in_hole = True
-                     break
+               # Центр над люком платформы - проваливаемся (люк по столбцу из сетки занятости)
+               in_hole = occupancy.hole_at(obj, self.rect.centerx) is not None
                if not prev_rect.colliderect(obj.rect) and not in_hole:
 
                   if self.velocity_y > 0:  # Падение вниз
@@ -161,7 +179,7 @@ class Character:
                      self.rect.top = obj.rect.bottom
                      self.velocity_y = 0
 
-            if obj.object_type is ObjectType.MOVING_PLATFORM:
+            elif obj.object_type is ObjectType.MOVING_PLATFORM:
 
                mov_platform = cast(MovingPlatformVertical, obj)  # Явное приведение типа
                if self.is_centr_inside_horizontally(self.rect, mov_platform.rect):
@@ -181,14 +199,6 @@ class Character:
                      #self.velocity_y = 0
                      pass
 
-            # Враги (тxриггер)
-            elif obj.object_type == ObjectType.ENEMY:
-               if self.velocity_y > 0:  # Если падаем НА врага
-                  pass
-                  # self.take_damage(10)
-               elif self.velocity_y < 0:  # Если прыгаем ВО врага
-                  self.velocity_y = -self.jump_force // 2  # Отскок
-
       # Проверка уровня земли (даже если нет платформ)
       if self.rect.bottom >= self.ground_level:
          self.rect.bottom = self.ground_level
@@ -196,52 +206,33 @@ class Character:
          self.on_ground = True
 
       # Горизонтальное движение и коллизии
-      prev_x = self.rect.x  # Запоминаем позицию до движения
       self.rect.x += self.speed * self.direction
 
-      # Проверка горизонтальных коллизий
-      for obj in game_objects:
+      # Проверка горизонтальных коллизий - движение блокируют только платформы и стены
+      # (враги - в корзине опасностей, касание с ними обрабатывает уровень)
+      for obj in solids:
          if self.rect.colliderect(obj.rect):
-            # Блокировка движения через платформы
-            if obj.object_type == ObjectType.PLATFORM:
-
-               platform = cast(Platform, obj)  # Явное приведение типа
-               in_hole = False
-               holes = getattr(platform, 'holes', [])  # берём люки с платформы если они есть.
-               for hole in holes:
-                  if self.is_centr_inside_horizontally(prev_rect, hole.rect):
-                     in_hole = True
-                     if self.direction == 1:  # Вправо
-                        if self.rect.right > hole.rect.right:
-                           self.rect.right = hole.rect.right
-                     elif self.direction == -1:  # Влево
-                        if self.rect.left < hole.rect.left:
-                           self.rect.left = hole.rect.left
-                     break
-               if not in_hole:
-                  if self.direction == 1:  # Вправо
-                     self.rect.right = obj.rect.left
-
-                  elif self.direction == -1:  # Влево
-                     self.rect.left = obj.rect.right
-
-            # Горизонтальный контакт с врагом
-            elif obj.object_type == ObjectType.ENEMY:
-               #self.take_damage(20)
-               self.rect.x = prev_x  # Отмена движения
-      # Отдельный проход для триггеров (монетки, бонусы)
-      for obj in game_objects[:]:  # Копия списка для безопасного удаления
-         if self.rect.colliderect(obj.rect):
-            if obj.object_type == ObjectType.COIN:
-               #self.collect_coin(1)
-               game_objects.remove(obj)
-            # elif obj.object_type == "health_pack":
-            #    #self.heal(25)
-            #    game_objects.remove(obj)
+            hole = occupancy.hole_at(obj, prev_rect.centerx)
+            in_hole = hole is not None
+            if in_hole:
+               # Внутри люка - упираемся в его края
+               if self.direction == 1:  # Вправо
+                  if self.rect.right > hole.rect.right:
+                     self.rect.right = hole.rect.right
+               elif self.direction == -1:  # Влево
+                  if self.rect.left < hole.rect.left:
+                     self.rect.left = hole.rect.left
+            else:
+               if self.direction == 1:  # Вправо
+                  self.rect.right = obj.rect.left
+
+               elif self.direction == -1:  # Влево
+                  self.rect.left = obj.rect.right
+      # Монеты и другие бонусы собирает уровень (Level.collect_bonuses) - физике они не нужны
 
       # Автоматический подъем при движении/прыжке
       if self.is_sitting and (not self.on_ground or abs(self.velocity_y) > 0):
-         self.stand_up(game_objects)
+         self.stand_up(world)
       # Автоматический сброс анимации прыжка при приземлении
       if self.on_ground:
          if self.current_action in (Action.JUMP, Action.FALL):
@@ -257,5 +248,5 @@ class Character:
       after_rect = self.rect
 
       if abs(prev_rect.x - after_rect.x) > self.width or abs(prev_rect.y - after_rect.y) > self.height :
-         Logger().debug(f"prev_rect: {prev_rect} after_rect: {after_rect}: {(prev_rect.x - after_rect.x)}")
+         Logger().debug("prev_rect: %s after_rect: %s: %s", prev_rect, after_rect, prev_rect.x - after_rect.x)
          Logger().error("Слишком больше смещение")
\ No newline at end of file
@@ -55,4 +55,24 @@ class ObjectType(Enum):
             ObjectType.COIN,
             ObjectType.ARTIFACT,
    #         ObjectType.CHECKPOINT
-        ]
\ No newline at end of file
+        ]
+
+    @property
+    def bucket(self):
+        """Корзина объектов уровня (levels.buckets), в которой лежат объекты этого типа (None - ни в какой)"""
+        return _BUCKETS.get(self)
+
+
+# Тип объекта -> корзина объектов уровня: физика и триггеры перебирают только нужную корзину
+_BUCKETS = {
+    ObjectType.PLATFORM: "solids",
+    ObjectType.PASSABLE_PLATFORM: "solids",
+    ObjectType.OBSTACLE: "solids",
+    ObjectType.MOVING_PLATFORM: "lifts",
+    ObjectType.ENEMY: "hazards",
+    ObjectType.SPIKE: "hazards",
+    ObjectType.CIRCULAR_SAW: "hazards",
+    ObjectType.COIN: "collectibles",
+    ObjectType.ARTIFACT: "collectibles",
+    ObjectType.PORTAL: "triggers",
+}
@@ -0,0 +1,120 @@
+"""
+Память уровней без окна: сколько байт занимают игровые объекты уровня и их поверхности.
+
+Запуск из корня репозитория:
+    python -m benchmarks.memory              # все уровни с зерном по умолчанию
+    python -m benchmarks.memory --seed 7     # другое зерно
+    python -m benchmarks.memory --root DIR   # уровни другой версии игры (например, git worktree)
+
+Объекты - размер экземпляров (с __dict__, если он есть) и их rect. Поверхности -
+пиксели всех поверхностей, на которые ссылаются объекты; общая поверхность
+(один спрайт на много объектов) считается один раз. Объекты измеряются
+интроспекцией, поэтому тот же скрипт меряет и версию до __slots__ и общих
+вариантов спрайтов - так получаются числа «до» и «после».
+"""
+import argparse
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+import pygame
+
+DEFAULT_SEED = 1234
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    """Объём пикселей поверхности в байтах"""
+    width, height = surface.get_size()
+    return width * height * surface.get_bytesize()
+
+
+def get_attribute_values(obj) -> list:
+    """Значения атрибутов объекта (из __slots__ всех классов и из __dict__)"""
+    values = []
+    for klass in type(obj).__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ("__dict__", "__weakref__") and hasattr(obj, name):
+                values.append(getattr(obj, name))
+    values.extend(getattr(obj, "__dict__", {}).values())
+    return values
+
+
+def get_surfaces(obj) -> list:
+    """Поверхности, на которые ссылается объект (напрямую или списком кадров)"""
+    surfaces = []
+    for value in get_attribute_values(obj):
+        if isinstance(value, pygame.Surface):
+            surfaces.append(value)
+        elif isinstance(value, (list, tuple)):
+            surfaces.extend(item for item in value if isinstance(item, pygame.Surface))
+    return surfaces
+
+
+def measure_level(level) -> dict:
+    """Объекты уровня (вместе с люками платформ) и байты, которые они занимают"""
+    objects = level.get_all_game_objects() + [hole for platform in level.platforms for hole in platform.holes]
+    object_bytes = 0
+    surfaces = {}
+    for obj in objects:
+        object_bytes += sys.getsizeof(obj) + sys.getsizeof(obj.rect)
+        if hasattr(obj, "__dict__"):
+            object_bytes += sys.getsizeof(obj.__dict__)
+        for surface in get_surfaces(obj):
+            surfaces[id(surface)] = surface
+
+    pixel_bytes = sum(surface_bytes(surface) for surface in surfaces.values())
+    return {
+        "objects": len(objects),
+        "object_bytes": object_bytes,
+        "surfaces": len(surfaces),
+        "surface_bytes": pixel_bytes,
+        "total_bytes": object_bytes + pixel_bytes,
+    }
+
+
+def load_levels(root: str):
+    """Модуль уровней из дерева root (пути к ресурсам относительные - работаем из него)"""
+    sys.path.insert(0, root)
+    os.chdir(root)
+
+    from custom_logging import Logger
+
+    # У версий до Logger.is_initialized проверяем реализацию напрямую
+    if hasattr(Logger, "is_initialized"):
+        initialized = Logger.is_initialized()
+    else:
+        initialized = Logger._logger_impl is not None
+    if not initialized:
+        Logger().initialize()
+
+    import levels.levels
+    return levels.levels
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Память уровней: объекты и поверхности")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Зерно генерации уровней")
+    parser.add_argument("--root", default=ROOT, help="Корень версии игры, уровни которой измерять")
+    args = parser.parse_args(argv)
+
+    levels = load_levels(os.path.abspath(args.root))
+    pygame.init()
+    pygame.display.set_mode((levels.SCREEN_WIDTH, levels.SCREEN_HEIGHT))
+    levels.preload()
+
+    print(f"{'уровень':<10}{'объекты':>9}{'байт объектов':>15}{'поверхности':>13}{'байт пикселей':>15}{'всего':>12}")
+    for level_class in (levels.Level1, levels.Level2, levels.Level3):
+        stats = measure_level(level_class(seed=args.seed))
+        print(f"{level_class.__name__:<10}{stats['objects']:>9}{stats['object_bytes']:>15}"
+              f"{stats['surfaces']:>13}{stats['surface_bytes']:>15}{stats['total_bytes']:>12}")
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,280 @@
+"""
+Замеры производительности без окна (SDL_VIDEODRIVER=dummy).
+
+Запуск из корня репозитория:
+    python -m benchmarks.run                      # замер и сравнение с benchmarks/baseline.json
+    python -m benchmarks.run --update-baseline    # сохранить результаты как новую базу
+    python -m benchmarks.run --only physics draw  # только выбранные замеры
+
+Все результаты - операции в секунду (больше - лучше). Уровни строятся
+с одним и тем же зерном, поэтому нагрузка от запуска к запуску одинакова.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pygame
+
+from custom_logging import Logger
+from levels.levels import Level1, Level2, Level3, LEVEL_WIDTH, SCREEN_WIDTH, SCREEN_HEIGHT, preload
+from levels.camera import Camera
+from Characters.Hero.hero import Hero
+from game.display import DisplayUpdater
+from game.session import GameSession
+
+DEFAULT_SEED = 1234
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "baseline.json")
+DEFAULT_TOLERANCE = 0.15  # Допустимое падение относительно базы (15%)
+DEFAULT_RETRIES = 3  # Сколько раз перемерить замеры, похожие на регрессию
+BASELINE_PASSES = 3  # База - медиана нескольких полных проходов, а не самый удачный из них
+
+
+class BenchHero(Hero):
+    """Герой без паузы в 1 секунду при потере жизни (она бы съела весь замер)"""
+
+    def lose_life(self):
+        if self.lives > 0:
+            self.lives -= 1
+
+
+class BenchSession(GameSession):
+    """Сессия без звука и пауз"""
+
+    hero_class = BenchHero
+
+
+class ScriptedKeys:
+    """Состояние клавиш для кадра сценария: бег вправо/влево по 60 кадров и прыжок каждые 40 кадров"""
+
+    def __init__(self, frame: int):
+        self.pressed = {
+            pygame.K_d: (frame // 60) % 2 == 0,
+            pygame.K_a: (frame // 60) % 2 == 1,
+            pygame.K_SPACE: frame % 40 == 0,
+        }
+
+    def __getitem__(self, key) -> bool:
+        return self.pressed.get(key, False)
+
+
+def seed_all(seed: int):
+    """Зерно для всего, что ещё берёт глобальный random (уровни получают своё зерно явно)"""
+    random.seed(seed)
+
+
+def measure(jobs: dict, repeats: int) -> dict:
+    """
+    Лучшее число операций в секунду для каждого замера.
+
+    Повторы идут по кругу: сначала по одному прогону всех замеров, потом следующий круг.
+    Так медленный период на общей машине портит по одному повтору у разных замеров,
+    а не все повторы одного.
+
+    :param jobs: имя замера -> (функция, сколько операций она выполняет)
+    :param repeats: число кругов
+    """
+    rates = {name: [] for name in jobs}
+    for _ in range(repeats):
+        for name, (fn, count) in jobs.items():
+            start = time.perf_counter()
+            fn()
+            rates[name].append(count / (time.perf_counter() - start))
+    return {name: max(values) for name, values in rates.items()}  # Лучший повтор меньше всего зависит от фоновой нагрузки
+
+
+def bench_generation(seed: int) -> dict:
+    """Сколько уровней каждого типа строится в секунду (генерацией и из снимка)"""
+    jobs = {}
+    count = 30
+    for level_class in (Level1, Level2, Level3):
+
+        def run(level_class=level_class):
+            for _ in range(count):
+                level_class(seed=seed)
+
+        jobs[f"generate_{level_class.__name__.lower()}"] = (run, count)
+
+    snapshot = Level1(seed=seed).to_snapshot()
+
+    def restore():
+        for _ in range(count):
+            Level1(seed=seed, snapshot=snapshot)
+
+    jobs["restore_level1"] = (restore, count)
+    return jobs
+
+
+def bench_physics(seed: int) -> dict:
+    """Шаги Character.apply_physics в секунду на сгенерированном уровне"""
+    level = Level1(seed=seed)
+    start_pos = (100, SCREEN_HEIGHT - 150)
+    steps = 5000
+
+    def run():
+        hero = BenchHero(start_pos)
+        for frame in range(steps):
+            keys = ScriptedKeys(frame)
+            hero.move(1 if keys[pygame.K_d] else -1)
+            if keys[pygame.K_SPACE] and hero.on_ground:
+                hero.jump()
+            hero.update()
+            hero.apply_physics(level, LEVEL_WIDTH, SCREEN_HEIGHT)
+            if hero.rect.top > SCREEN_HEIGHT:
+                hero.teleport(start_pos)
+
+    return {"physics_steps": (run, steps)}
+
+
+def bench_draw(screen: pygame.Surface, seed: int) -> dict:
+    """Кадров Level.draw в секунду при проходе камеры через весь уровень"""
+    level = Level1(seed=seed)
+    camera = Camera(SCREEN_WIDTH, SCREEN_HEIGHT)
+    frames = 600
+    target = pygame.Rect(0, 0, 1, 1)
+
+    def run():
+        for frame in range(frames):
+            target.centerx = frame * LEVEL_WIDTH // frames
+            camera.follow(target, LEVEL_WIDTH)
+            level.draw(screen, camera)
+
+    return {"level_draw": (run, frames)}
+
+
+def bench_full_frame(screen: pygame.Surface, seed: int) -> dict:
+    """Полных кадров в секунду (ввод, шаг симуляции, отрисовка, вывод) по сценарию"""
+    frames = 600
+
+    def run():
+        seed_all(seed)
+        session = BenchSession(seed=seed)
+        display = DisplayUpdater()
+        for frame in range(frames):
+            session.apply_input(ScriptedKeys(frame))
+            session.tick()
+            if session.game_over:
+                session.restart()
+            screen.fill((20, 30, 15))
+            session.draw(screen, 1.0, display)
+            display.present()
+
+    return {"full_frame": (run, frames)}
+
+
+BENCHMARKS = {
+    "generation": lambda screen, seed: bench_generation(seed),
+    "physics": lambda screen, seed: bench_physics(seed),
+    "draw": bench_draw,
+    "frame": bench_full_frame,
+}
+
+
+def regressions(results: dict, baseline: dict, tolerance: float) -> list:
+    """Имена замеров, упавших относительно базы больше чем на tolerance"""
+    return [name for name, value in results.items()
+            if name in baseline and value / baseline[name] - 1.0 < -tolerance]
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> bool:
+    """
+    Печатает сравнение с базой.
+
+    :return: False, если хоть один замер упал больше чем на tolerance
+    """
+    failed = regressions(results, baseline, tolerance)
+    print(f"{'замер':<22}{'база':>12}{'сейчас':>12}{'изм.':>9}")
+    for name, value in results.items():
+        base_value = baseline.get(name)
+        if base_value is None:
+            print(f"{name:<22}{'-':>12}{value:>12.1f}{'':>9}")
+            continue
+        mark = "  РЕГРЕССИЯ" if name in failed else ""
+        print(f"{name:<22}{base_value:>12.1f}{value:>12.1f}{value / base_value - 1.0:>+9.1%}{mark}")
+    return not failed
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Замеры производительности игры без окна")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="Какие замеры выполнить")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Зерно генерации уровней")
+    parser.add_argument("--repeats", type=int, default=7, help="Кругов по всем замерам (берётся лучший повтор)")
+    parser.add_argument("--out", help="Куда сохранить результаты (JSON)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Файл базовых результатов")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Допустимое падение относительно базы (0.1 = 10%%)")
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES,
+                        help="Сколько раз перемерить замеры, упавшие ниже базы")
+    parser.add_argument("--update-baseline", action="store_true", help="Сохранить результаты как базу")
+    args = parser.parse_args(argv)
+
+    os.chdir(ROOT)  # Пути к ресурсам относительные
+    if not Logger.is_initialized():
+        Logger().initialize()
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    preload()
+
+    jobs = {}
+    for name in args.only or BENCHMARKS:
+        jobs.update(BENCHMARKS[name](screen, args.seed))
+    if args.update_baseline:
+        passes = [measure(jobs, args.repeats) for _ in range(BASELINE_PASSES)]
+        results = {name: statistics.median(result[name] for result in passes) for name in jobs}
+    else:
+        results = measure(jobs, args.repeats)
+
+    baseline = {}
+    if not args.update_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+    for _ in range(args.retries):
+        # Падение на общей машине чаще всего - фоновая нагрузка: перемеряем только упавшие замеры,
+        # настоящая регрессия останется и после повтора
+        failed = regressions(results, baseline, args.tolerance)
+        if not failed:
+            break
+        print(f"перемеряю: {', '.join(failed)}")
+        retry = measure({name: jobs[name] for name in failed}, args.repeats)
+        results.update({name: max(results[name], value) for name, value in retry.items()})
+
+    report = {
+        "meta": {
+            "seed": args.seed,
+            "repeats": args.repeats,
+            "passes": BASELINE_PASSES if args.update_baseline else 1,
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "machine": platform.machine(),
+            "unit": "ops/s",
+        },
+        "results": {name: round(value, 2) for name, value in results.items()},
+    }
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"База сохранена в {args.baseline}")
+        return 0
+
+    ok = compare(report["results"], baseline, args.tolerance)
+    pygame.quit()
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
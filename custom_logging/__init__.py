@@ -1,5 +1,6 @@
 from .logger import Logger
 from .interfaces import ILogger
 from .debug_logger import DebugLogger
+from .async_logger import AsyncLogger
 
-__all__ = ["Logger", "ILogger", "DebugLogger"]
\ No newline at end of file
+__all__ = ["Logger", "ILogger", "DebugLogger", "AsyncLogger"]
\ No newline at end of file
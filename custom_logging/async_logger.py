@@ -0,0 +1,139 @@
+# custom_logging/async_logger.py
+
+import atexit
+import logging
+import threading
+from collections import deque
+from .logging_config import LoggingConfig
+from .interfaces import ILogger
+from .debug_logger import create_handlers
+
+DROP_OLDEST = "drop_oldest"  # Переполнение: выбросить самую старую запись
+BLOCK = "block"  # Переполнение: ждать, пока фоновый поток освободит место
+
+
+class AsyncLogger(ILogger):
+    """
+    Логгер, который не пишет на игровом потоке.
+
+    Игровой поток только создаёт LogRecord (без форматирования) и кладёт его
+    в ограниченный кольцевой буфер; форматирование и запись в консоль/файл
+    выполняет фоновый поток. Аргументы %-сообщений форматируются позже -
+    передавайте неизменяемые значения (кортежи, числа, строки).
+    """
+
+    def __init__(self, queue_size: int = None, overflow_policy: str = None):
+        """
+        :param queue_size: Ёмкость буфера (по умолчанию LoggingConfig.QUEUE_SIZE)
+        :param overflow_policy: DROP_OLDEST или BLOCK (по умолчанию LoggingConfig.OVERFLOW_POLICY)
+        """
+        self.queue_size = queue_size or LoggingConfig.QUEUE_SIZE
+        self.overflow_policy = overflow_policy or LoggingConfig.OVERFLOW_POLICY
+        if self.overflow_policy not in (DROP_OLDEST, BLOCK):
+            raise ValueError(f"Неизвестная политика переполнения: {self.overflow_policy}")
+
+        self.logger = logging.getLogger("AsyncLogger")
+        self.logger.setLevel(LoggingConfig.LEVEL)
+        self.logger.propagate = False
+        self.handlers = create_handlers()
+
+        self.records = deque()
+        self.dropped = 0  # Сколько записей выброшено при переполнении
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+        self.running = True
+        self.writing = False  # Фоновый поток пишет забранную пачку
+
+        self.thread = threading.Thread(target=self._run, name="AsyncLogger", daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def debug(self, message: str, *args) -> None:
+        self._enqueue(logging.DEBUG, message, args)
+
+    def info(self, message: str, *args) -> None:
+        self._enqueue(logging.INFO, message, args)
+
+    def warning(self, message: str, *args) -> None:
+        self._enqueue(logging.WARNING, message, args)
+
+    def error(self, message: str, *args) -> None:
+        self._enqueue(logging.ERROR, message, args)
+
+    def critical(self, message: str, *args) -> None:
+        self._enqueue(logging.CRITICAL, message, args)
+
+    def is_enabled_for(self, level: int) -> bool:
+        return self.logger.isEnabledFor(level)
+
+    def flush(self) -> None:
+        """Ждёт, пока фоновый поток запишет всё, что уже в буфере"""
+        with self.lock:
+            while (self.records or self.writing) and self.running:
+                self.not_full.wait(0.1)
+
+    def close(self) -> None:
+        """Дописывает буфер и останавливает фоновый поток"""
+        with self.lock:
+            if not self.running:
+                return
+            self.running = False
+            self.not_empty.notify()
+            self.not_full.notify_all()
+        self.thread.join()
+
+        if self.dropped:
+            self._write(self.logger.makeRecord(
+                self.logger.name, logging.WARNING, __file__, 0,
+                "AsyncLogger: выброшено записей при переполнении: %s", (self.dropped,), None
+            ))
+        for handler in self.handlers:
+            handler.flush()
+
+    def _enqueue(self, level: int, message: str, args: tuple) -> None:
+        if not self.logger.isEnabledFor(level):
+            return
+        record = self.logger.makeRecord(self.logger.name, level, "(unknown file)", 0, message, args, None)
+
+        with self.lock:
+            if not self.running:
+                self._write(record)  # После close() пишем сразу, чтобы не потерять сообщение
+                return
+            if len(self.records) >= self.queue_size:
+                if self.overflow_policy == DROP_OLDEST:
+                    self.records.popleft()
+                    self.dropped += 1
+                else:
+                    while len(self.records) >= self.queue_size and self.running:
+                        self.not_full.wait()
+                    if not self.running:
+                        self._write(record)
+                        return
+            self.records.append(record)
+            self.not_empty.notify()
+
+    def _run(self) -> None:
+        """Фоновый поток: забирает записи пачками и пишет их вне блокировки"""
+        while True:
+            with self.lock:
+                while not self.records and self.running:
+                    self.not_empty.wait()
+                batch = list(self.records)
+                self.records.clear()
+                self.writing = bool(batch)
+                self.not_full.notify_all()
+                if not batch and not self.running:
+                    return
+
+            for record in batch:
+                self._write(record)
+
+            with self.lock:
+                self.writing = False
+                self.not_full.notify_all()
+
+    def _write(self, record: logging.LogRecord) -> None:
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
@@ -26,39 +26,51 @@ class ColoredFormatter(logging.Formatter):
         return f"{color}{original_formatter}{Style.RESET_ALL}"
 
 
+def create_handlers() -> list:
+    """Обработчики (консоль/файл) согласно LoggingConfig"""
+    formatter = ColoredFormatter(LoggingConfig.FORMAT)
+    handlers = []
+
+    if LoggingConfig.LOG_TO_CONSOLE:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(formatter)
+        handlers.append(console_handler)
+
+    if LoggingConfig.LOG_TO_FILE:
+        file_handler = RotatingFileHandler(
+            LoggingConfig.FILENAME,
+            maxBytes=LoggingConfig.MAX_BYTES,
+            backupCount=LoggingConfig.BACKUP_COUNT,
+            encoding='utf-8'
+        )
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+
+    return handlers
+
+
 class DebugLogger(ILogger):
     def __init__(self):
         self.logger = logging.getLogger("DebugLogger")
         self.logger.setLevel(LoggingConfig.LEVEL)
 
-        formatter = ColoredFormatter(LoggingConfig.FORMAT)
-
-        if LoggingConfig.LOG_TO_CONSOLE:
-            console_handler = logging.StreamHandler()
-            console_handler.setFormatter(formatter)
-            self.logger.addHandler(console_handler)
+        for handler in create_handlers():
+            self.logger.addHandler(handler)
 
-        if LoggingConfig.LOG_TO_FILE:
-            file_handler = RotatingFileHandler(
-                LoggingConfig.FILENAME,
-                maxBytes=LoggingConfig.MAX_BYTES,
-                backupCount=LoggingConfig.BACKUP_COUNT,
-                encoding='utf-8'
-            )
-            file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
+    def debug(self, message: str, *args) -> None:
+        self.logger.debug(message, *args)
 
-    def debug(self, message: str) -> None:
-        self.logger.debug(message)
+    def info(self, message: str, *args) -> None:
+        self.logger.info(message, *args)
 
-    def info(self, message: str) -> None:
-        self.logger.info(message)
+    def warning(self, message: str, *args) -> None:
+        self.logger.warning(message, *args)
 
-    def warning(self, message: str) -> None:
-        self.logger.warning(message)
+    def error(self, message: str, *args) -> None:
+        self.logger.error(message, *args)
 
-    def error(self, message: str) -> None:
-        self.logger.error(message)
+    def critical(self, message: str, *args) -> None:
+        self.logger.critical(message, *args)
 
-    def critical(self, message: str) -> None:
-        self.logger.critical(message)
\ No newline at end of file
+    def is_enabled_for(self, level: int) -> bool:
+        return self.logger.isEnabledFor(level)
\ No newline at end of file
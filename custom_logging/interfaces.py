@@ -5,21 +5,25 @@ from abc import ABC, abstractmethod
 
 class ILogger(ABC):
     @abstractmethod
-    def debug(self, message: str) -> None:
+    def debug(self, message: str, *args) -> None:
         pass
 
     @abstractmethod
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args) -> None:
         pass
 
     @abstractmethod
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args) -> None:
         pass
 
     @abstractmethod
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args) -> None:
         pass
 
     @abstractmethod
-    def critical(self, message: str) -> None:
-        pass
\ No newline at end of file
+    def critical(self, message: str, *args) -> None:
+        pass
+
+    def is_enabled_for(self, level: int) -> bool:
+        """Будут ли записаны сообщения уровня level (logging.DEBUG ... logging.CRITICAL)"""
+        return True
@@ -1,10 +1,22 @@
 # custom_logging/logger.py
+import logging
+from typing import Callable, Union
+
 from .interfaces import ILogger
 from .debug_logger import DebugLogger
+from .async_logger import AsyncLogger
+from .logging_config import LoggingConfig
+
+# Сообщение: строка (с %-аргументами) или функция, которая строит строку только при записи
+Message = Union[str, Callable[[], str]]
+
 
 class Logger:
     _instance = None
     _logger_impl: ILogger = None
+    # Минимальный записываемый уровень (кэш is_enabled_for реализации).
+    # До инициализации 0 - вызовы доходят до проверки и падают с исключением.
+    _min_level: int = logging.NOTSET
 
     def __new__(cls):
         if not cls._instance:
@@ -16,31 +28,67 @@ class Logger:
         if cls._logger_impl is not None:
             raise Exception("Logger уже инициализирован!")
         if implementation is None:
-            cls._logger_impl = DebugLogger()
+            cls._logger_impl = AsyncLogger() if LoggingConfig.ASYNC else DebugLogger()
         else:
             cls._logger_impl = implementation
+        cls.refresh_level()
 
-    def debug(self, message: str) -> None:
-        if not self._logger_impl:
-            raise Exception("Logger не инициализирован!")
-        self._logger_impl.debug(message)
+    @classmethod
+    def is_initialized(cls) -> bool:
+        """Задана ли уже реализация (повторный initialize бросает исключение)"""
+        return cls._logger_impl is not None
 
-    def info(self, message: str) -> None:
-        if not self._logger_impl:
-            raise Exception("Logger не инициализирован!")
-        self._logger_impl.info(message)
+    @classmethod
+    def refresh_level(cls) -> None:
+        """Перечитывает уровень реализации (если он поменялся после initialize)"""
+        impl = cls._logger_impl
+        cls._min_level = next(
+            (level for level in (logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR, logging.CRITICAL)
+             if impl.is_enabled_for(level)),
+            logging.CRITICAL + 1
+        )
 
-    def warning(self, message: str) -> None:
-        if not self._logger_impl:
-            raise Exception("Logger не инициализирован!")
-        self._logger_impl.warning(message)
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        Будет ли записано сообщение уровня level.
 
-    def error(self, message: str) -> None:
-        if not self._logger_impl:
-            raise Exception("Logger не инициализирован!")
-        self._logger_impl.error(message)
+        Для дорогих сообщений: if Logger().is_enabled_for(logging.DEBUG): ...
+        """
+        return level >= self._min_level
+
+    def debug(self, message: Message, *args) -> None:
+        if self._min_level > logging.DEBUG:
+            return
+        self._log(self._implementation().debug, message, args)
+
+    def info(self, message: Message, *args) -> None:
+        if self._min_level > logging.INFO:
+            return
+        self._log(self._implementation().info, message, args)
 
-    def critical(self, message: str) -> None:
+    def warning(self, message: Message, *args) -> None:
+        if self._min_level > logging.WARNING:
+            return
+        self._log(self._implementation().warning, message, args)
+
+    def error(self, message: Message, *args) -> None:
+        if self._min_level > logging.ERROR:
+            return
+        self._log(self._implementation().error, message, args)
+
+    def critical(self, message: Message, *args) -> None:
+        if self._min_level > logging.CRITICAL:
+            return
+        self._log(self._implementation().critical, message, args)
+
+    def _implementation(self) -> ILogger:
         if not self._logger_impl:
             raise Exception("Logger не инициализирован!")
-        self._logger_impl.critical(message)
\ No newline at end of file
+        return self._logger_impl
+
+    @staticmethod
+    def _log(write: Callable, message: Message, args: tuple) -> None:
+        """Передаёт сообщение реализации, вызывая отложенное сообщение только сейчас"""
+        if callable(message):
+            message = message()
+        write(message, *args)
@@ -6,4 +6,9 @@ class LoggingConfig:
     FILENAME = "debug.log"
     FORMAT = "[%(asctime)s] [%(levelname)s] %(message)s"
     MAX_BYTES = 1024 * 1024  # 1MB
-    BACKUP_COUNT = 5  # Количество backup-файлов
\ No newline at end of file
+    BACKUP_COUNT = 5  # Количество backup-файлов
+
+    # Асинхронная запись (AsyncLogger): форматирование и вывод в фоновом потоке
+    ASYNC = False
+    QUEUE_SIZE = 4096  # Ёмкость кольцевого буфера записей
+    OVERFLOW_POLICY = "drop_oldest"  # При переполнении: "drop_oldest" - выбросить старую запись, "block" - ждать
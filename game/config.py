@@ -0,0 +1,13 @@
+# game/config.py
+class GameConfig:
+    DIRTY_RECTS = False  # Обновлять на экране только изменившиеся области (иначе - полный flip)
+
+    # Игровой цикл
+    SIMULATION_RATE = 60  # Шагов симуляции в секунду (физика настроена на 60 шагов)
+    RENDER_FPS = 60  # Ограничение частоты кадров отрисовки (0 - без ограничения)
+    MAX_FRAME_TIME = 250  # Максимальное время кадра в мс, учитываемое симуляцией (защита от "спирали смерти")
+    UNTHROTTLED = False  # Ровно один шаг симуляции на кадр без ожидания (для замеров и headless-прогонов)
+
+    # Профилирование (F3 - таблица замеров на экране)
+    PROFILING = False  # Замерять время зон кадра с самого запуска
+    PROFILE_DUMP = "profile.json"  # Куда сохранить замеры при выходе (если они были)
@@ -0,0 +1,85 @@
+import pygame
+from typing import Dict, Hashable, List, Tuple
+
+
+class DisplayUpdater:
+    """
+    Вывод готового кадра на экран.
+
+    В обычном режиме - pygame.display.flip(). В режиме грязных прямоугольников
+    объекты и HUD сообщают свои экранные области через track(), и на экран
+    отправляются только изменившиеся области. При смене сцены (прокрутка камеры,
+    пауза, смена уровня, меню) выполняется полный flip.
+    """
+
+    def __init__(self, dirty_rects: bool = False):
+        """
+        :param dirty_rects: Включить режим обновления только изменившихся областей
+        """
+        self.dirty_rects = dirty_rects
+        self.full_update = True  # Первый кадр всегда выводится целиком
+        self.scene = None  # Ключ сцены прошлого кадра
+        self.rects: List[pygame.Rect] = []  # Изменившиеся области текущего кадра
+        self.tracked: Dict[Hashable, Tuple[pygame.Rect, object]] = {}  # Что было на экране в прошлом кадре
+        self.seen: Dict[Hashable, Tuple[pygame.Rect, object]] = {}  # Что нарисовано в текущем кадре
+
+    def set_scene(self, scene: Hashable):
+        """Запоминает ключ сцены; при его изменении кадр выводится целиком"""
+        if scene != self.scene:
+            self.scene = scene
+            self.full_update = True
+
+    def needs_redraw(self, static: bool) -> bool:
+        """
+        Нужно ли рисовать кадр.
+
+        Неподвижный экран (меню, пауза, конец уровня) в режиме грязных прямоугольников
+        рисуется только один раз после смены сцены.
+        """
+        return not (self.dirty_rects and static and not self.full_update)
+
+    def mark(self, rect: pygame.Rect):
+        """Помечает экранную область как изменившуюся"""
+        self.rects.append(pygame.Rect(rect))
+
+    def mark_full(self):
+        """Следующий вывод кадра будет полным"""
+        self.full_update = True
+
+    def track(self, key: Hashable, rect: pygame.Rect, state: object = None):
+        """
+        Сообщает, где объект нарисован в этом кадре.
+
+        Область помечается изменившейся, если объект сдвинулся или сменил состояние
+        (кадр анимации, угол поворота, текст).
+
+        :param key: Ключ объекта (сам объект или строка для элементов HUD)
+        :param rect: Экранная область, занятая объектом
+        :param state: Всё, что влияет на вид объекта помимо позиции
+        """
+        if not self.dirty_rects:
+            return
+        self.seen[key] = (rect, state)
+        previous = self.tracked.get(key)
+        if previous is None:
+            self.rects.append(rect)
+        elif previous[0] != rect or previous[1] != state:
+            self.rects.append(previous[0])
+            self.rects.append(rect)
+
+    def present(self):
+        """Выводит кадр на экран"""
+        if not self.dirty_rects or self.full_update:
+            pygame.display.flip()
+        else:
+            # Объекты, пропавшие с экрана (собранные монеты и т.п.)
+            for key, (rect, _) in self.tracked.items():
+                if key not in self.seen:
+                    self.rects.append(rect)
+            if self.rects:
+                pygame.display.update(self.rects)
+
+        self.full_update = False
+        self.tracked = self.seen
+        self.seen = {}
+        self.rects = []
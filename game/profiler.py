@@ -0,0 +1,173 @@
+import json
+import time
+import pygame
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+
+class ScopeStats:
+    """Статистика времени одной зоны замера (в миллисекундах)"""
+
+    def __init__(self, window: int):
+        """
+        :param window: Сколько последних замеров хранить для p99
+        """
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.last = 0.0
+        self.samples: Deque[float] = deque(maxlen=window)
+
+    def add(self, ms: float):
+        self.count += 1
+        self.total += ms
+        self.last = ms
+        if ms < self.min:
+            self.min = ms
+        if ms > self.max:
+            self.max = ms
+        self.samples.append(ms)
+
+    @property
+    def avg(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def p99(self) -> float:
+        """99-й перцентиль по последним замерам"""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "min": round(self.min, 4) if self.count else 0.0,
+            "avg": round(self.avg, 4),
+            "p99": round(self.p99, 4),
+            "max": round(self.max, 4),
+        }
+
+
+class _Scope:
+    """Замер одной зоны: with profiler.scope("name"): ..."""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: 'Profiler', name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, (time.perf_counter() - self.start) * 1000.0)
+        return False
+
+
+class _NullScope:
+    """Заглушка для выключенного профилировщика - ничего не замеряет"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class Profiler:
+    """
+    Замеры времени по именованным зонам кадра (ввод, обновление, физика, отрисовка...).
+
+    Выключенный профилировщик возвращает общую пустую зону, поэтому
+    замеры в игровом цикле почти ничего не стоят.
+    """
+
+    def __init__(self, enabled: bool = False, window: int = 600):
+        """
+        :param enabled: Сразу включить замеры
+        :param window: Сколько последних замеров каждой зоны хранить для p99 (600 - 10 секунд при 60 FPS)
+        """
+        self.enabled = enabled
+        self.window = window
+        self.show_overlay = False
+        self.scopes: Dict[str, ScopeStats] = {}  # Имя зоны -> статистика (в порядке первого замера)
+
+    def scope(self, name: str):
+        """Контекстный менеджер замера зоны"""
+        if not self.enabled:
+            return _NULL_SCOPE
+        return _Scope(self, name)
+
+    def add(self, name: str, ms: float):
+        """Добавляет замер зоны вручную"""
+        stats = self.scopes.get(name)
+        if stats is None:
+            stats = self.scopes[name] = ScopeStats(self.window)
+        stats.add(ms)
+
+    def toggle_overlay(self):
+        """Показывает/скрывает таблицу замеров (замеры включаются вместе с ней)"""
+        self.show_overlay = not self.show_overlay
+        if self.show_overlay:
+            self.enabled = True
+
+    def reset(self):
+        """Сбрасывает накопленную статистику"""
+        self.scopes.clear()
+
+    def report(self) -> Dict[str, dict]:
+        """Статистика по всем зонам: min/avg/p99/max в мс"""
+        return {name: stats.as_dict() for name, stats in self.scopes.items()}
+
+    def dump(self, path: str) -> bool:
+        """
+        Сохраняет статистику в JSON.
+
+        :return: False, если замеров не было
+        """
+        if not self.scopes:
+            return False
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"unit": "ms", "scopes": self.report()}, f, ensure_ascii=False, indent=2)
+        return True
+
+    def draw_overlay(self, surface: pygame.Surface, font: pygame.font.Font,
+                     position=(20, 160)) -> Optional[pygame.Rect]:
+        """
+        Рисует таблицу замеров поверх кадра.
+
+        :return: Экранная область таблицы (None, если таблица скрыта)
+        """
+        if not self.show_overlay:
+            return None
+
+        lines: List[str] = ["зона            avg     p99     max"]
+        for name, stats in self.scopes.items():
+            lines.append(f"{name:<14} {stats.avg:6.2f}  {stats.p99:6.2f}  {stats.max:6.2f}")
+
+        rendered = [font.render(line, True, (255, 255, 0)) for line in lines]
+        line_height = font.get_linesize()
+        width = max(text.get_width() for text in rendered) + 10
+        area = pygame.Rect(position[0], position[1], width, line_height * len(rendered) + 10)
+
+        background = pygame.Surface(area.size, pygame.SRCALPHA)
+        background.fill((0, 0, 0, 160))
+        surface.blit(background, area)
+        for i, text in enumerate(rendered):
+            surface.blit(text, (area.x + 5, area.y + 5 + i * line_height))
+        return area
+
+
+# Единый профилировщик на весь процесс
+profiler = Profiler()
@@ -0,0 +1,126 @@
+import gzip
+import json
+import pygame
+from typing import Dict, List, Optional, Tuple
+
+REPLAY_VERSION = 1
+
+# Клавиши, которые влияют на симуляцию (GameSession.apply_input); бит i маски - RECORDED_KEYS[i]
+RECORDED_KEYS = (pygame.K_a, pygame.K_d, pygame.K_s, pygame.K_SPACE)
+
+
+def keys_to_mask(keys) -> int:
+    """Состояние записываемых клавиш в виде битовой маски"""
+    mask = 0
+    for bit, key in enumerate(RECORDED_KEYS):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+
+class KeyState:
+    """Состояние клавиш из маски (подставляется вместо pygame.key.get_pressed())"""
+
+    def __init__(self, mask: int):
+        self.mask = mask
+
+    def __getitem__(self, key) -> bool:
+        try:
+            return bool(self.mask & (1 << RECORDED_KEYS.index(key)))
+        except ValueError:
+            return False
+
+
+class InputRecorder:
+    """
+    Запись ввода игровой сессии по шагам симуляции.
+
+    Для каждого шага хранится маска клавиш (сжатая в серии одинаковых значений),
+    команды игрока (пауза, рестарт, переход на уровень...) - с номером шага,
+    перед которым они выполнены. Вместе с зерном уровней этого достаточно,
+    чтобы воспроизвести сессию шаг в шаг.
+    """
+
+    def __init__(self, seed: int, debug_mode: bool, simulation_rate: int, endless: bool = False):
+        """
+        :param seed: Зерно генерации уровней сессии
+        :param debug_mode: Сессия начата с отладочного уровня
+        :param simulation_rate: Шагов симуляции в секунду
+        :param endless: Сессия - бесконечный забег
+        """
+        self.seed = seed
+        self.debug_mode = debug_mode
+        self.endless = endless
+        self.simulation_rate = simulation_rate
+        self.runs: List[List[int]] = []  # Серии [маска, количество шагов]
+        self.commands: List[Tuple[int, str]] = []  # (номер шага, команда)
+        self.ticks = 0
+
+    def record_keys(self, keys):
+        """Записывает клавиши очередного шага"""
+        mask = keys_to_mask(keys)
+        if self.runs and self.runs[-1][0] == mask:
+            self.runs[-1][1] += 1
+        else:
+            self.runs.append([mask, 1])
+        self.ticks += 1
+
+    def record_command(self, command: str):
+        """Записывает команду перед текущим шагом"""
+        self.commands.append((self.ticks, command))
+
+    def save(self, path: str, final_state: Optional[dict] = None):
+        """
+        Сохраняет запись (gzip JSON).
+
+        :param final_state: Состояние в конце записи - при воспроизведении с ним сверяется результат
+        """
+        data = {
+            "version": REPLAY_VERSION,
+            "seed": self.seed,
+            "debug_mode": self.debug_mode,
+            "endless": self.endless,
+            "simulation_rate": self.simulation_rate,
+            "ticks": self.ticks,
+            "keys": self.runs,
+            "commands": self.commands,
+            "final": final_state,
+        }
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+
+class InputPlayer:
+    """Воспроизведение записи InputRecorder: ввод и команды для каждого шага"""
+
+    def __init__(self, data: dict):
+        if data.get("version") != REPLAY_VERSION:
+            raise ValueError(f"Неподдерживаемая версия записи: {data.get('version')}")
+        self.seed: int = data["seed"]
+        self.debug_mode: bool = data["debug_mode"]
+        self.endless: bool = data.get("endless", False)  # В ранних записях поля нет
+        self.simulation_rate: int = data["simulation_rate"]
+        self.ticks: int = data["ticks"]
+        self.final_state: Optional[dict] = data.get("final")
+
+        self.masks: List[int] = []
+        for mask, count in data["keys"]:
+            self.masks.extend([mask] * count)
+        self.commands: Dict[int, List[str]] = {}
+        for tick, command in data["commands"]:
+            self.commands.setdefault(tick, []).append(command)
+
+    @classmethod
+    def load(cls, path: str) -> 'InputPlayer':
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def finished(self, tick: int) -> bool:
+        """Запись закончилась к шагу tick"""
+        return tick >= self.ticks
+
+    def keys_for(self, tick: int) -> KeyState:
+        return KeyState(self.masks[tick])
+
+    def commands_for(self, tick: int) -> List[str]:
+        return self.commands.get(tick, [])
@@ -0,0 +1,262 @@
+import pygame
+import random
+from typing import Optional, Tuple
+
+from levels.levels import LevelManager, SCREEN_WIDTH, SCREEN_HEIGHT
+from levels.camera import Camera
+from Characters.Hero.hero import Hero
+from game.profiler import profiler
+from game.config import GameConfig
+
+LEVEL_COMPLETE_DELAY = 3000  # Через сколько мс после финиша загружается следующий уровень
+
+
+class GameSession:
+    """
+    Игровая сессия: менеджер уровней, герой, камера и один шаг симуляции.
+
+    Не зависит от окна и цикла событий - main.py вызывает tick() с фиксированным
+    шагом и draw() с коэффициентом интерполяции между двумя последними шагами.
+    """
+
+    hero_class = Hero  # Класс героя (подклассы сессии могут подменить)
+
+    def __init__(self, debug_mode: bool = False, sound_manager=None, seed: Optional[int] = None, recorder=None,
+                 endless: bool = False):
+        """
+        :param debug_mode: Начать с отладочного уровня
+        :param sound_manager: SoundManager для звуков (None - без звука)
+        :param seed: Зерно генерации уровней (None - случайное)
+        :param recorder: InputRecorder для записи ввода (None - без записи)
+        :param endless: Бесконечный забег вместо обычных уровней
+        """
+        self.debug_mode = debug_mode
+        self.endless = endless
+        self.sound_manager = sound_manager
+        self.seed = seed if seed is not None else random.randrange(1 << 31)
+        self.recorder = recorder
+        self.tick_count = 0  # Шагов симуляции с начала сессии (часы для таймеров игры)
+        # Снимки случайного зерна больше не понадобятся - на диск пишем только для заданного
+        self.level_manager = LevelManager(debug_mode=debug_mode, seed=self.seed, endless=endless,
+                                          persist_snapshots=seed is not None)
+        self.camera = Camera(SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.player = None
+        self.start_pos = (0, 0)
+        self.game_over = False
+        self.paused = False
+        self.finished = False  # Все уровни пройдены
+        self.player_prev_position = (0, 0)  # Позиция героя до последнего шага (для интерполяции)
+
+        self.spawn_player()
+        self.level_manager.current_level.remove_start_portal()
+
+    @property
+    def level(self):
+        """Текущий уровень"""
+        return self.level_manager.current_level
+
+    @property
+    def frozen(self) -> bool:
+        """Симуляция стоит: пауза, конец игры или пройденный уровень"""
+        return self.paused or self.game_over or self.level.completed
+
+    def get_start_position(self) -> Tuple[int, int]:
+        """Точка появления героя у стартового портала"""
+        start_portal = next((p for p in self.level.portals if not p.is_finish), None)
+        if start_portal:
+            return start_portal.rect.x + 30, start_portal.rect.y - 50
+        return 100, SCREEN_HEIGHT - 150
+
+    def spawn_player(self):
+        """Создаёт нового героя у стартового портала"""
+        self.start_pos = self.get_start_position()
+        self.player = self.hero_class(self.start_pos)
+        self.snap()
+
+    def snap(self):
+        """Сбрасывает интерполяцию (после телепорта или смены уровня)"""
+        self.player_prev_position = self.player.rect.topleft
+        self.follow_player()
+        self.camera.prev_offset = self.camera.offset
+
+    def follow_player(self):
+        """Сдвигает камеру за героем в границах уровня и сообщает уровню новую видимую область"""
+        left, right = self.level.bounds
+        self.camera.follow(self.player.rect, right, left)
+        self.level.set_view(self.camera.view_rect)
+
+    def handle_command(self, command: str) -> bool:
+        """
+        Команда игрока между шагами симуляции (записывается вместе с вводом).
+
+        :param command: "pause", "toggle_debug", "next_level" или "restart"
+        :return: Команда выполнена
+        """
+        if command == "pause":
+            self.paused = not self.paused
+        elif command == "toggle_debug":
+            self.toggle_debug()
+        elif command == "next_level" and self.level.completed:
+            self.next_level()
+        elif command == "restart" and self.game_over:
+            self.restart()
+        else:
+            return False
+
+        if self.recorder is not None:
+            self.recorder.record_command(command)
+        return True
+
+    def toggle_debug(self):
+        """Переключает отладочный уровень (F1)"""
+        self.debug_mode = not self.debug_mode
+        self.level_manager.reset(debug_mode=self.debug_mode)
+        self.spawn_player()
+
+    def restart(self):
+        """Рестарт после конца игры (R)"""
+        self.level_manager.reset()
+        self.spawn_player()
+        self.level.portal_remove_timer = None
+        self.level.remove_start_portal()
+        self.game_over = False
+
+    def next_level(self, respawn: bool = True) -> bool:
+        """
+        Переход на следующий уровень.
+
+        :param respawn: Создать нового героя (иначе - телепортировать текущего)
+        :return: False, если уровни закончились
+        """
+        if not self.level_manager.next_level():
+            self.finished = True
+            return False
+
+        if respawn:
+            self.spawn_player()
+        else:
+            self.start_pos = self.get_start_position()
+            self.player.teleport(self.start_pos)
+            self.snap()
+        return True
+
+    def apply_input(self, keys):
+        """
+        Управление героем.
+
+        :param keys: Состояние клавиш (pygame.key.get_pressed() или совместимый объект)
+        """
+        if self.recorder is not None:
+            self.recorder.record_keys(keys)
+
+        player = self.player
+        if keys[pygame.K_s]:
+            player.sit_down()
+        elif player.is_sitting():
+            player.stand_up(self.level)
+
+        if keys[pygame.K_a]:
+            player.move(-1)
+        elif keys[pygame.K_d]:
+            player.move(1)
+        else:
+            player.move(0)
+
+        if keys[pygame.K_SPACE] and player.on_ground:
+            self.play_sound('jump')
+            player.jump()
+
+    def tick(self):
+        """Один шаг симуляции"""
+        level = self.level
+        player = self.player
+
+        if not level.completed and not self.game_over and not self.paused:
+            self.player_prev_position = player.rect.topleft
+
+            # Обновление игры
+            with profiler.scope("level_update"):
+                self.level_manager.update(player_rect=player.rect)
+            with profiler.scope("hero_update"):
+                player.update()
+            with profiler.scope("physics"):
+                left, right = level.bounds
+                player.apply_physics(level, right, SCREEN_HEIGHT, left)
+
+            if player.rect.top > SCREEN_HEIGHT:
+                self.game_over = True
+
+            if not level.start_portal_removed:
+                level.remove_start_portal()
+
+            # Обработка столкновений
+            with profiler.scope("collisions"):
+                hit = level.check_hazard_collision(player.rect) or level.check_fall_into_pit(player.rect)
+            if hit:
+                self.play_sound('death')
+                player.lose_life()
+                if not player.is_live():
+                    self.game_over = True
+                player.teleport(level.get_respawn_position(self.start_pos))
+                self.player_prev_position = player.rect.topleft
+
+            # Сбор бонусов
+            with profiler.scope("collection"):
+                collected_points = level.collect_bonuses(player.rect)
+                level.collect_artifacts(player.rect)
+            if collected_points:
+                self.play_sound('coin')
+            level.score += collected_points
+
+            if level.check_finish(player.rect):
+                level.completed = True
+                level.completion_tick = self.tick_count
+
+            self.follow_player()
+        elif level.completed and not self.game_over:
+            delay_ticks = LEVEL_COMPLETE_DELAY * GameConfig.SIMULATION_RATE // 1000
+            if self.tick_count - level.completion_tick > delay_ticks:
+                self.next_level(respawn=False)
+
+        self.tick_count += 1
+
+    def get_state(self) -> dict:
+        """Краткое состояние сессии (для сверки воспроизведения с записью)"""
+        return {
+            "tick": self.tick_count,
+            "level": self.level_manager.current_level_num,
+            "player": list(self.player.rect.topleft),
+            "score": self.level_manager.total_score + self.level.score,
+            "lives": self.player.get_lives()[0],
+            "game_over": self.game_over,
+        }
+
+    def get_render_camera(self, alpha: float = 1.0) -> Camera:
+        """Камера, с которой рисуется кадр (интерполирована между шагами симуляции)"""
+        return self.camera.interpolated(1.0 if self.frozen else alpha)
+
+    def draw(self, surface: pygame.Surface, alpha: float = 1.0, display=None):
+        """
+        Отрисовка уровня и героя.
+
+        :param surface: Экран
+        :param alpha: Доля времени между предыдущим и последним шагом симуляции (1.0 - без интерполяции)
+        :param display: DisplayUpdater для режима грязных прямоугольников
+        """
+        if self.frozen:
+            alpha = 1.0  # Между шагами ничего не двигалось
+        camera = self.get_render_camera(alpha)
+        self.level.draw(surface, camera, display, alpha)
+
+        # Смещение героя между предыдущей и текущей позицией
+        prev_x, prev_y = self.player_prev_position
+        offset = (camera.offset[0] + round((prev_x - self.player.rect.x) * (1 - alpha)),
+                  camera.offset[1] + round((prev_y - self.player.rect.y) * (1 - alpha)))
+        self.player.draw(surface, offset)
+        if display is not None:
+            display.track(self.player, self.player.rect.move(offset), self.player.get_draw_state())
+
+    def play_sound(self, name: str):
+        """Проигрывает звук, если звук подключён"""
+        if self.sound_manager is not None:
+            self.sound_manager.play_sound(name)
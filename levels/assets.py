@@ -0,0 +1,237 @@
+import pygame
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Union
+
+from custom_logging import Logger
+
+Size = Tuple[int, int]  # Размер изображения (ширина, высота)
+Flip = Tuple[bool, bool]  # Отражение по горизонтали и по вертикали
+Asset = Union[pygame.Surface, Tuple[pygame.Surface, ...]]  # Изображение или набор кадров
+
+
+def surface_bytes(asset: Asset) -> int:
+    """Объём пикселей изображения (или набора кадров) в байтах"""
+    if isinstance(asset, pygame.Surface):
+        width, height = asset.get_size()
+        return width * height * asset.get_bytesize()
+    return sum(surface_bytes(frame) for frame in asset)
+
+
+class AssetCache:
+    """
+    Общий на весь процесс кэш уже загруженных, сконвертированных и масштабированных изображений.
+
+    Ключ - (путь, целевой размер, флаги). Объём кэша ограничен в байтах пикселей,
+    при переполнении вытесняются давно не использованные записи (LRU).
+    Кэшем можно пользоваться из фонового потока сборки уровней.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        """
+        :param max_bytes: Максимальный объём пикселей в кэше
+        """
+        self.max_bytes = max_bytes
+        self.entries: "OrderedDict[Hashable, Tuple[Asset, int]]" = OrderedDict()  # Ключ -> (изображение, байты)
+        self.bytes = 0
+        self.lock = threading.RLock()  # Загрузчики могут обращаться к кэшу повторно (кадры -> лист)
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, path: str, size: Optional[Size], flags: tuple, loader: Callable[[], Asset]) -> Asset:
+        """
+        Возвращает изображение из кэша или загружает его через loader.
+
+        :param path: Путь к файлу
+        :param size: Целевой размер (None - исходный)
+        :param flags: Дополнительные параметры, влияющие на результат (альфа, отражение, нарезка)
+        :param loader: Функция загрузки при промахе
+        """
+        # Изображения, загруженные до создания окна, не сконвертированы - храним их отдельно
+        key = (path, size, flags, pygame.display.get_surface() is not None)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                self.entries.move_to_end(key)
+                return entry[0]
+
+            self.misses += 1
+            asset = loader()
+            asset_bytes = surface_bytes(asset)
+            self.entries[key] = (asset, asset_bytes)
+            self.bytes += asset_bytes
+            self._evict()
+            return asset
+
+    def load_image(self, path: str, size: Optional[Size] = None, alpha: bool = True) -> pygame.Surface:
+        """Загружает изображение с диска (один раз) и при необходимости масштабирует"""
+        def loader():
+            image = self._convert(pygame.image.load(path), alpha)
+            if size is not None and image.get_size() != size:
+                image = pygame.transform.scale(image, size)
+            return image
+
+        return self.get(path, size, ("alpha" if alpha else "opaque",), loader)
+
+    def load_frames(self, path: str, frame_count: int, size: Size, flip: bool = False) -> Tuple[pygame.Surface, ...]:
+        """
+        Нарезает горизонтальный спрайт-лист на кадры одинакового размера.
+
+        :param path: Путь к спрайт-листу
+        :param frame_count: Количество кадров в листе
+        :param size: Размер, к которому масштабируется каждый кадр
+        :param flip: Отразить кадры по горизонтали
+        """
+        def loader():
+            if flip:
+                return tuple(pygame.transform.flip(frame, True, False)
+                             for frame in self.load_frames(path, frame_count, size))
+
+            sprite_sheet = self.load_image(path)
+            frame_width = sprite_sheet.get_width() // frame_count
+            frame_height = sprite_sheet.get_height()
+            return tuple(
+                pygame.transform.scale(
+                    sprite_sheet.subsurface(pygame.Rect(i * frame_width, 0, frame_width, frame_height)),
+                    size
+                )
+                for i in range(frame_count)
+            )
+
+        return self.get(path, size, ("frames", frame_count, flip), loader)
+
+    def clear(self):
+        """Полностью очищает кэш"""
+        with self.lock:
+            self.entries.clear()
+            self.bytes = 0
+
+    @property
+    def stats(self) -> dict:
+        """Счётчики кэша"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def _evict(self):
+        """Вытесняет самые старые записи, пока кэш не уложится в лимит (последняя запись остаётся)"""
+        while self.bytes > self.max_bytes and len(self.entries) > 1:
+            key, (_, asset_bytes) = self.entries.popitem(last=False)
+            self.bytes -= asset_bytes
+            self.evictions += 1
+            Logger().debug("Кэш ресурсов: вытеснен %s (%s байт)", key[0], asset_bytes)
+
+    @staticmethod
+    def _convert(image: pygame.Surface, alpha: bool) -> pygame.Surface:
+        """Конвертирует в формат экрана, если окно уже создано"""
+        if pygame.display.get_surface() is None:
+            return image
+        return image.convert_alpha() if alpha else image.convert()
+
+
+# Единый кэш на весь процесс
+asset_cache = AssetCache()
+
+
+class SpriteRegistry:
+    """
+    Реестр именованных спрайтов, которые загружаются при первом обращении.
+
+    Импорт модулей с игровыми объектами ничего не читает с диска; игра может
+    загрузить всё заранее через preload() (например, за экраном загрузки).
+
+    Масштабированные, повёрнутые и отражённые варианты спрайтов (get_variant) -
+    приспособленцы: одинаковый вид у любого числа объектов - одна поверхность.
+    """
+
+    def __init__(self):
+        self.loaders: Dict[str, Callable[[], Any]] = {}  # Имя -> функция загрузки
+        self.sprites: Dict[str, Tuple[Any, bool]] = {}  # Имя -> (спрайт, загружен ли после создания окна)
+        # (имя, размер, поворот, отражение) -> (исходный спрайт, вариант)
+        self.variants: Dict[Tuple[str, Optional[Size], int, Flip], Tuple[Any, pygame.Surface]] = {}
+        self.lock = threading.RLock()  # Спрайты запрашивает и фоновый поток сборки уровней
+
+    def register(self, name: str, loader: Callable[[], Any]):
+        """Регистрирует спрайт (или набор кадров) без загрузки"""
+        self.loaders[name] = loader
+        self.sprites.pop(name, None)
+
+    def get(self, name: str) -> Any:
+        """Возвращает спрайт, загружая его при первом обращении"""
+        display_ready = pygame.display.get_surface() is not None
+        with self.lock:
+            entry = self.sprites.get(name)
+            # Спрайт, загруженный до создания окна, перезагружаем в формате экрана
+            if entry is None or (display_ready and not entry[1]):
+                entry = (self.loaders[name](), display_ready)
+                self.sprites[name] = entry
+            return entry[0]
+
+    def get_variant(self, name: str, size: Optional[Size] = None, rotation: int = 0,
+                    flip: Flip = (False, False)) -> pygame.Surface:
+        """
+        Вариант спрайта (один на все объекты с таким видом).
+
+        Спрайт масштабируется до size, затем поворачивается на rotation градусов
+        (против часовой стрелки, как pygame.transform.rotate) и отражается.
+        Результат общий - рисовать поверх него нельзя. Новый вариант строится
+        вне блокировки реестра: если его попросил фоновый поток сборки уровня,
+        главный поток (отрисовка) этого не ждёт.
+
+        :param name: Имя спрайта
+        :param size: Размер до поворота (None - исходный)
+        :param rotation: Угол поворота в градусах
+        :param flip: Отражение по горизонтали и по вертикали
+        """
+        sprite = self.get(name)
+        key = (name, size, rotation % 360, flip)
+        with self.lock:
+            entry = self.variants.get(key)
+        if entry is not None and entry[0] is sprite:  # Исходный спрайт не перезагружен
+            return entry[1]
+
+        variant = sprite
+        if size is not None and variant.get_size() != size:
+            variant = pygame.transform.scale(variant, size)
+        if rotation % 360:
+            variant = pygame.transform.rotate(variant, rotation)
+        if any(flip):
+            variant = pygame.transform.flip(variant, *flip)
+
+        with self.lock:
+            entry = self.variants.get(key)
+            if entry is None or entry[0] is not sprite:  # Общим становится первый построенный вариант
+                entry = (sprite, variant)
+                self.variants[key] = entry
+            return entry[1]
+
+    def get_scaled(self, name: str, size: Size) -> pygame.Surface:
+        """Спрайт, масштабированный до size (общий - рисовать поверх него нельзя)"""
+        return self.get_variant(name, size)
+
+    def preload(self):
+        """Загружает все зарегистрированные спрайты"""
+        for name in self.loaders:
+            self.get(name)
+
+    def is_loaded(self, name: str) -> bool:
+        """Загружен ли уже спрайт"""
+        return name in self.sprites
+
+    @property
+    def stats(self) -> dict:
+        """Загруженные спрайты и варианты с объёмом их пикселей"""
+        with self.lock:
+            return {
+                "sprites": len(self.sprites),
+                "variants": len(self.variants),
+                "variant_bytes": sum(surface_bytes(variant) for _, variant in self.variants.values()),
+            }
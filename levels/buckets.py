@@ -0,0 +1,108 @@
+import pygame
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+from levels.spatial_hash import SpatialHash
+
+# Корзины объектов уровня (ObjectType.bucket)
+BUCKETS = (
+    "solids",  # Платформы, стены, балки - опора и преграда для героя
+    "lifts",  # Лифты - опора, которая двигается
+    "hazards",  # Шипы, пилы, враги - потеря жизни при касании
+    "collectibles",  # Монеты и артефакты
+    "triggers",  # Порталы
+)
+
+
+class ObjectBuckets:
+    """
+    Объекты уровня, разложенные по корзинам по типу объекта.
+
+    У каждой корзины своя сетка поиска, поэтому физика и триггеры проверяют
+    только объекты нужного вида. Списки объектов корзин (view) собираются
+    один раз и кэшируются до ближайшего добавления или удаления объекта:
+    каждое изменение увеличивает version. Все результаты - в порядке
+    регистрации объектов, сколько бы корзин ни участвовало.
+    """
+
+    def __init__(self, cell_size: int = 128):
+        """
+        :param cell_size: Размер ячейки сеток поиска в пикселях
+        """
+        self.indexes: Dict[str, SpatialHash] = {name: SpatialHash(cell_size) for name in BUCKETS}
+        self.index_of: Dict[Hashable, SpatialHash] = {}  # Объект -> сетка его корзины
+        self.order: Dict[Hashable, int] = {}  # Объект -> порядковый номер регистрации
+        self.next_order = 0
+        self.version = 0  # Номер изменения набора объектов
+        self.views: Dict[Tuple[str, ...], Tuple[int, List]] = {}  # Корзины -> (version, объекты)
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def __contains__(self, obj) -> bool:
+        return obj in self.order
+
+    def insert(self, obj):
+        """Регистрирует объект в корзине его типа (объекты без корзины не регистрируются)"""
+        bucket = obj.object_type.bucket
+        if bucket is None or obj in self.order:
+            return
+        index = self.indexes[bucket]
+        index.insert(obj)
+        self.index_of[obj] = index
+        self.order[obj] = self.next_order
+        self.next_order += 1
+        self.version += 1
+
+    def remove(self, obj):
+        """Убирает объект (если он зарегистрирован)"""
+        index = self.index_of.pop(obj, None)
+        if index is None:
+            return
+        index.remove(obj)
+        del self.order[obj]
+        self.version += 1
+
+    def update(self, obj):
+        """Пересчитывает ячейки объекта после его перемещения (набор объектов не меняется)"""
+        index = self.index_of.get(obj)
+        if index is not None:
+            index.update(obj)
+
+    def query(self, rect: pygame.Rect, buckets: Optional[Sequence[str]] = None) -> List:
+        """
+        Объекты корзин из ячеек, которые пересекает прямоугольник (кандидаты для точной проверки).
+
+        :param buckets: Имена корзин (None - все)
+        """
+        if buckets is None:
+            buckets = BUCKETS
+        if len(buckets) == 1:
+            return self.indexes[buckets[0]].query(rect)
+        found = set()
+        for name in buckets:
+            self.indexes[name].find(rect, found)
+        return sorted(found, key=self.order.__getitem__)
+
+    def view(self, buckets: Optional[Sequence[str]] = None) -> List:
+        """
+        Все объекты корзин одним списком (общий - изменять нельзя).
+
+        :param buckets: Имена корзин (None - все)
+        """
+        key = tuple(buckets) if buckets is not None else BUCKETS
+        entry = self.views.get(key)
+        if entry is None or entry[0] != self.version:
+            objects = [obj for name in key for obj in self.indexes[name].order]
+            objects.sort(key=self.order.__getitem__)
+            entry = (self.version, objects)
+            self.views[key] = entry
+        return entry[1]
+
+    def clear(self):
+        """Удаляет все объекты"""
+        for index in self.indexes.values():
+            index.clear()
+        self.index_of.clear()
+        self.order.clear()
+        self.views.clear()
+        self.version += 1
@@ -0,0 +1,54 @@
+import pygame
+
+
+class Camera:
+    """Камера: смещение уровня относительно экрана и видимая область"""
+
+    def __init__(self, width: int, height: int):
+        """
+        Инициализация камеры.
+
+        :param width: Ширина видимой области (ширина экрана)
+        :param height: Высота видимой области (высота экрана)
+        """
+        self.width = width
+        self.height = height
+        self.offset = (0, 0)  # Смещение уровня при отрисовке на экран
+        self.prev_offset = (0, 0)  # Смещение до последнего шага симуляции (для интерполяции)
+
+    def follow(self, target_rect: pygame.Rect, level_width: int, level_left: int = 0):
+        """
+        Центрирует камеру по горизонтали на цели, не выходя за границы уровня.
+
+        :param level_width: Правая граница уровня
+        :param level_left: Левая граница уровня (у бесконечного уровня сдвигается вместе с окном)
+        """
+        offset_x = self.width // 2 - target_rect.centerx
+        offset_x = max(min(offset_x, -level_left), self.width - level_width)
+        self.prev_offset = self.offset
+        self.offset = (offset_x, 0)
+
+    def interpolated(self, alpha: float) -> 'Camera':
+        """
+        Камера в момент между двумя последними шагами симуляции.
+
+        :param alpha: 0.0 - предыдущий шаг, 1.0 - последний шаг
+        """
+        camera = Camera(self.width, self.height)
+        camera.offset = tuple(round(prev + (cur - prev) * alpha)
+                              for prev, cur in zip(self.prev_offset, self.offset))
+        camera.prev_offset = camera.offset
+        return camera
+
+    @property
+    def view_rect(self) -> pygame.Rect:
+        """Видимая область в координатах уровня"""
+        return pygame.Rect(-self.offset[0], -self.offset[1], self.width, self.height)
+
+    def is_visible(self, rect: pygame.Rect, margin: int = 0) -> bool:
+        """Проверяет, попадает ли прямоугольник (в координатах уровня) в видимую область"""
+        return self.view_rect.inflate(margin * 2, margin * 2).colliderect(rect)
+
+    def apply(self, rect: pygame.Rect) -> pygame.Rect:
+        """Переводит прямоугольник из координат уровня в экранные координаты"""
+        return rect.move(self.offset)
@@ -0,0 +1,295 @@
+import bisect
+import heapq
+from array import array
+from functools import lru_cache
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Колонки хранилища: горячие данные подвижных объектов уровня
+COLUMNS = (
+    "speed", "direction",  # Скорость и направление движения (пилы, лифты)
+    "original_y", "move_range",  # Центр и размах движения пилы
+    "lower_y", "upper_y",  # Границы движения лифта
+    "angle",  # Угол поворота (пилы, артефакты)
+    "updated_at",  # Шаг уровня, на котором сущность обновлялась последний раз
+)
+
+
+class Column:
+    """
+    Атрибут объекта, который хранится в колонке EntityStore.
+
+    Пока объект не добавлен в хранилище (генерация, пул), значение лежит в самом
+    объекте; после EntityStore.add объект становится лёгким представлением своего слота.
+    """
+
+    def __init__(self, column: Optional[str] = None):
+        """
+        :param column: Имя колонки (по умолчанию - имя атрибута)
+        """
+        self.column = column
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+        self.local = "_" + name  # Где значение лежит вне хранилища
+        if self.column is None:
+            self.column = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        store = obj.store
+        if store is None:
+            return getattr(obj, self.local)
+        return store.columns[self.column][obj.slot]
+
+    def __set__(self, obj, value):
+        store = obj.store
+        if store is None:
+            setattr(obj, self.local, value)
+        else:
+            store.columns[self.column][obj.slot] = value
+
+
+# Шаги систем. Один шаг компонента - одна функция: её вызывают и EntityStore.run,
+# и догоняющий advance объектов, поэтому пропущенные шаги догоняются ровно так же.
+
+def lift_step(y: int, direction: int, speed: int, lower_y: int, upper_y: int) -> Tuple[int, int]:
+    """Лифт: вверх-вниз между upper_y и lower_y. (y, направление) -> следующие"""
+    y += speed * direction
+    if y >= lower_y:
+        direction = -1
+    elif y <= upper_y:
+        direction = 1
+    return y, direction
+
+
+def saw_step(offset: int, direction: int, speed: int, move_range: int) -> Tuple[int, int]:
+    """Пила: вверх-вниз на move_range от исходной высоты. (смещение, направление) -> следующие"""
+    offset += speed * direction
+    if offset > move_range:
+        direction = -1
+    elif offset < -move_range:
+        direction = 1
+    return offset, direction
+
+
+def rotation_step(angle: int, step: int, steps: int = 1) -> int:
+    """Вращение (пилы, артефакты): угол через steps шагов"""
+    return (angle + step * steps) % 360
+
+
+@lru_cache(maxsize=None)
+def get_columns(cls) -> Tuple[Column, ...]:
+    """Атрибуты-колонки класса (с учётом базовых классов)"""
+    columns = {}
+    for klass in reversed(cls.__mro__):
+        for name, value in vars(klass).items():
+            if isinstance(value, Column):
+                columns[name] = value
+    return tuple(columns.values())
+
+
+class Component:
+    """Слоты сущностей с одним компонентом, упорядоченные по X - выборка полосы уровня двоичным поиском"""
+
+    def __init__(self):
+        self.xs: List[int] = []
+        self.slots: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def add(self, x: int, slot: int):
+        i = bisect.bisect_right(self.xs, x)
+        self.xs.insert(i, x)
+        self.slots.insert(i, slot)
+
+    def extend(self, items: Iterable[Tuple[int, int]]):
+        """
+        Добавляет пачку (x, слот): пачка сортируется и сливается с уже упорядоченными за один проход.
+
+        Порядок тот же, что у add по одному: при равных X новые слоты - после старых и в порядке пачки.
+        """
+        batch = sorted(items, key=itemgetter(0))
+        if not batch:
+            return
+        if len(batch) == 1:
+            self.add(*batch[0])
+        elif not self.xs or batch[0][0] >= self.xs[-1]:
+            self.xs.extend(x for x, _ in batch)
+            self.slots.extend(slot for _, slot in batch)
+        else:
+            merged = list(heapq.merge(zip(self.xs, self.slots), batch, key=itemgetter(0)))
+            self.xs = [x for x, _ in merged]
+            self.slots = [slot for _, slot in merged]
+
+    def remove(self, x: int, slot: int):
+        i = bisect.bisect_left(self.xs, x)
+        while self.slots[i] != slot:
+            i += 1
+        del self.xs[i]
+        del self.slots[i]
+
+    def select(self, left: Optional[int], right: Optional[int]) -> List[int]:
+        """Слоты с X в [left, right) (None - все)"""
+        if left is None:
+            return self.slots
+        return self.slots[bisect.bisect_left(self.xs, left):bisect.bisect_left(self.xs, right)]
+
+
+class EntityStore:
+    """
+    Хранилище горячих данных подвижных объектов уровня (ECS).
+
+    Данные лежат в колонках-массивах, одна сущность - один слот во всех колонках.
+    Системы (run) проходят по слотам своего компонента в узкой полосе уровня,
+    без вызова update() у каждого объекта. Сами объекты остаются лёгкими
+    представлениями: их атрибуты-колонки (Column) читают и пишут слот.
+    Объекты не двигаются по X, поэтому компоненты упорядочены по X один раз.
+    """
+
+    def __init__(self):
+        self.columns: Dict[str, array] = {name: array("q") for name in COLUMNS}
+        self.objects: List = []  # Слот -> объект (None - свободный слот)
+        self.free: List[int] = []  # Свободные слоты
+        self.entities = Component()  # Все сущности (для догоняющих шагов)
+        self.components: Dict[str, Component] = {}  # Имя компонента -> его сущности
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def add(self, obj, tick: int):
+        """
+        Переносит атрибуты-колонки объекта в слот.
+
+        :param tick: Текущий шаг уровня (с него объект начинает обновляться)
+        """
+        self.add_many((obj,), tick)
+
+    def add_many(self, objects: Iterable, tick: int):
+        """
+        Переносит в слоты пачку объектов (построение уровня, новый участок).
+
+        Компоненты упорядочиваются одним слиянием на пачку, а не вставкой каждого слота.
+
+        :param tick: Текущий шаг уровня (с него объекты начинают обновляться)
+        """
+        entities = []
+        components: Dict[str, List[Tuple[int, int]]] = {}
+        for obj in objects:
+            slot = self._take_slot(obj, tick)
+            x = obj.rect.x
+            entities.append((x, slot))
+            for name in obj.components:
+                components.setdefault(name, []).append((x, slot))
+
+        self.entities.extend(entities)
+        for name, items in components.items():
+            self.components.setdefault(name, Component()).extend(items)
+
+    def _take_slot(self, obj, tick: int) -> int:
+        """Занимает слот и переносит в него колонки объекта"""
+        if self.free:
+            slot = self.free.pop()
+        else:
+            slot = len(self.objects)
+            self.objects.append(None)
+            for column in self.columns.values():
+                column.append(0)
+
+        values = [(column.column, getattr(obj, column.name)) for column in get_columns(type(obj))]
+        for column in get_columns(type(obj)):
+            delattr(obj, column.local)
+        obj.store = self
+        obj.slot = slot
+        for name, value in values:
+            self.columns[name][slot] = value
+        self.columns["updated_at"][slot] = tick
+        self.objects[slot] = obj
+        return slot
+
+    def remove(self, obj):
+        """Возвращает атрибуты-колонки в объект и освобождает слот"""
+        if obj.store is not self:
+            return
+        slot = obj.slot
+        values = [(column, getattr(obj, column.name)) for column in get_columns(type(obj))]
+        x = obj.rect.x
+        self.entities.remove(x, slot)
+        for name in obj.components:
+            self.components[name].remove(x, slot)
+
+        obj.store = None
+        obj.slot = -1
+        for column, value in values:
+            setattr(obj, column.local, value)
+        self.objects[slot] = None
+        self.free.append(slot)
+
+    def select(self, component: str, left: Optional[int] = None, right: Optional[int] = None) -> List[int]:
+        """Слоты компонента в полосе [left, right) по X (None - все)"""
+        found = self.components.get(component)
+        return found.select(left, right) if found is not None else []
+
+    def catch_up(self, tick: int, left: Optional[int], right: Optional[int], moved: Callable):
+        """
+        Догоняет до шага tick сущности полосы, которые обновлялись раньше (были вне области активности).
+
+        :param moved: Вызывается для объекта, который мог сдвинуться (обновление сетки коллизий)
+        """
+        updated_at = self.columns["updated_at"]
+        objects = self.objects
+        for slot in self.entities.select(left, right):
+            missed = tick - updated_at[slot]
+            if missed > 0:
+                obj = objects[slot]
+                obj.advance(missed)
+                obj.prev_position = obj.rect.topleft
+                updated_at[slot] = tick
+                moved(obj)
+
+    def run(self, tick: int, left: Optional[int], right: Optional[int], moved: Callable):
+        """
+        Один шаг всех систем для сущностей полосы [left, right) по X.
+
+        Сущности должны быть догнаны до шага tick - 1 (catch_up).
+
+        :param tick: Номер шага
+        :param moved: Вызывается для сдвинувшегося объекта (обновление сетки коллизий)
+        """
+        columns = self.columns
+        objects = self.objects
+        updated_at = columns["updated_at"]
+        for slot in self.entities.select(left, right):
+            updated_at[slot] = tick
+
+        speed = columns["speed"]
+        direction = columns["direction"]
+        angle = columns["angle"]
+
+        # Лифты: вверх-вниз между upper_y и lower_y
+        lower_y = columns["lower_y"]
+        upper_y = columns["upper_y"]
+        for slot in self.select("lift", left, right):
+            obj = objects[slot]
+            rect = obj.rect
+            obj.prev_position = rect.topleft
+            rect.y, direction[slot] = lift_step(rect.y, direction[slot], speed[slot], lower_y[slot], upper_y[slot])
+            moved(obj)
+
+        # Пилы: вверх-вниз на move_range от original_y и вращение
+        original_y = columns["original_y"]
+        move_range = columns["move_range"]
+        for slot in self.select("saw", left, right):
+            obj = objects[slot]
+            rect = obj.rect
+            obj.prev_position = rect.topleft
+            offset, direction[slot] = saw_step(rect.y - original_y[slot], direction[slot], speed[slot], move_range[slot])
+            rect.y = original_y[slot] + offset
+            angle[slot] = rotation_step(angle[slot], obj.ROTATION_STEP)
+            moved(obj)
+
+        # Артефакты: вращение
+        for slot in self.select("artifact", left, right):
+            angle[slot] = rotation_step(angle[slot], objects[slot].ROTATION_STEP)
@@ -0,0 +1,66 @@
+from typing import Dict, Generic, Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+
+class IndexedList(Generic[T]):
+    """
+    Список объектов с удалением за O(1).
+
+    Каждый объект помнит свою позицию в плотном массиве; при удалении на его
+    место переносится последний объект (swap-remove). Порядок обхода после
+    удалений меняется, зато сбор монеты не сдвигает весь список. Дескриптор
+    элемента - сам объект, он остаётся действительным, пока объект в списке.
+    """
+
+    def __init__(self, items: Iterable[T] = ()):
+        self.items: List[T] = []
+        self.positions: Dict[T, int] = {}  # Объект -> позиция в items
+        self.extend(items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.items)
+
+    def __contains__(self, obj) -> bool:
+        return obj in self.positions
+
+    def __getitem__(self, index: int) -> T:
+        return self.items[index]
+
+    def append(self, obj: T):
+        """Добавляет объект в конец (повторно тот же объект не добавляется)"""
+        if obj in self.positions:
+            return
+        self.positions[obj] = len(self.items)
+        self.items.append(obj)
+
+    def extend(self, objects: Iterable[T]):
+        for obj in objects:
+            self.append(obj)
+
+    def remove(self, obj: T):
+        """Удаляет объект за O(1); ValueError, если его нет"""
+        if not self.discard(obj):
+            raise ValueError(f"{obj!r} нет в списке")
+
+    def discard(self, obj: T) -> bool:
+        """
+        Удаляет объект, если он есть.
+
+        :return: Был ли объект в списке
+        """
+        position = self.positions.pop(obj, None)
+        if position is None:
+            return False
+        last = self.items.pop()
+        if last is not obj:
+            self.items[position] = last
+            self.positions[last] = position
+        return True
+
+    def clear(self):
+        self.items.clear()
+        self.positions.clear()
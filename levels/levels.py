@@ -1,9 +1,23 @@
 import pygame
 import random
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Dict, List, Tuple, Optional
 from Characters.type_object import ObjectType
 from custom_logging import Logger
+from levels.camera import Camera
+from levels.static_layer import StaticLayer
+from levels.buckets import ObjectBuckets
+from levels.occupancy import OccupancyGrid
+from levels.sprite_cache import rotation_atlas
+from levels.assets import asset_cache, SpriteRegistry
+from levels.snapshot import level_snapshots
+from levels.placement import PlacementGrid, SpacingLine
+from levels.pool import ObjectPool
+from levels.indexed_list import IndexedList
+from levels.periodic import advance_periodic
+from levels.entities import Column, EntityStore, lift_step, saw_step, rotation_step
 import os
 
 # Константы
@@ -13,6 +27,23 @@ LEVEL_WIDTH = SCREEN_WIDTH * 5  # Ширина уровня (в 5 раза бо
 PLATFORM_HEIGHT = 30  # Высота платформы
 PLATFORM_COUNT = 3  # Количество уровней платформ
 PLATFORM_GAP = 200  # Расстояние между платформами
+DRAW_MARGIN = 32  # Запас видимой области для объектов, выходящих за свой rect (вращение)
+STATIC_CHUNK_WIDTH = 512  # Ширина чанка статического слоя
+STATIC_CHUNK_CAPACITY = 8  # Сколько чанков статического слоя держать в памяти
+SPATIAL_CELL_SIZE = 128  # Размер ячейки сетки для поиска коллизий
+OCCUPANCY_TILE_SIZE = 32  # Размер клетки сетки занятости неподвижной геометрии
+ACTIVITY_MARGIN = SCREEN_WIDTH // 2  # Запас области активности вокруг видимой области
+PLACEMENT_CELL_SIZE = 128  # Размер ячейки сетки занятых областей при генерации
+PLACEMENT_CLEARANCE = 50  # Отступ вокруг объекта при расстановке (зазор между объектами - 100)
+PLACEMENT_ATTEMPTS = 10  # Случайных попыток до полного перебора свободных мест
+COIN_CLEARANCE = 5  # Отступ вокруг монеты при расстановке (монеты мелкие, им хватает малого зазора)
+COINS_PER_PLATFORM = 30  # Монет над каждой платформой
+ENDLESS_LEVEL = -1  # Номер бесконечного уровня в LevelManager
+ENDLESS_CHUNK_WIDTH = SCREEN_WIDTH  # Ширина участка бесконечного уровня
+ENDLESS_LOOKAHEAD = 2 * ENDLESS_CHUNK_WIDTH  # Насколько участки строятся впереди видимой области
+ENDLESS_KEEP_BEHIND = ENDLESS_CHUNK_WIDTH  # Насколько участки остаются позади видимой области
+ENDLESS_SAFE_ZONE = 300  # Начало каждого участка без ям и препятствий (туда возвращается герой)
+ENDLESS_HAZARD_SPACING = 250  # Минимальное расстояние по X между препятствиями одной платформы участка
 
 # Типы для аннотаций
 Color = Tuple[int, int, int]  # Цвет в формате RGB
@@ -24,27 +55,29 @@ Size = Tuple[int, int]  # Размер объекта (ширина, высот
 
 
 def load_sprite(name: str, default_color: tuple) -> pygame.Surface:
-    """Безопасная загрузка спрайтов с проверкой инициализации"""
-    try:
-        if not pygame.get_init():
-            pygame.init()
-            pygame.display.set_mode((1, 1))  # Минимальный дисплей
+    """Безопасная загрузка спрайтов с проверкой инициализации (через общий кэш ресурсов)"""
+    path = os.path.join("assets", "imgs", name)
+
+    def loader() -> pygame.Surface:
+        try:
+            Logger().debug(lambda: f"Пытаюсь загрузить {path}, существует? {os.path.exists(path)}")
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"Файл {path} не найден")
 
-        path = os.path.join("assets", "imgs", name)
-        Logger().debug(f"Пытаюсь загрузить {path}, существует? {os.path.exists(path)}")
-        if not os.path.exists(path):
-            raise FileNotFoundError(f"Файл {path} не найден")
+            sprite = pygame.image.load(path)
+            Logger().debug("✅ Успешно загружен %s, размер %s", name, sprite.get_size())
+            # Без окна конвертировать некуда - оставляем исходный формат
+            return sprite.convert_alpha() if pygame.display.get_surface() is not None else sprite
 
-        sprite = pygame.image.load(path)
-        Logger().debug(f"✅ Успешно загружен {name}, размер {sprite.get_size()}")
-        return sprite.convert_alpha() if pygame.display.get_init() else sprite
+        except Exception as e:
+            Logger().debug("Ошибка загрузки %s: %s", name, e)
+            size = (SCREEN_WIDTH, SCREEN_HEIGHT) if name == "level_1.png" else (32, 32)
+            stub = pygame.Surface(size)
+            stub.fill(default_color)
+            return stub
 
-    except Exception as e:
-        Logger().debug(f"Ошибка загрузки {name}: {e}")
-        size = (SCREEN_WIDTH, SCREEN_HEIGHT) if name == "level_1.png" else (32, 32)
-        stub = pygame.Surface(size)
-        stub.fill(default_color)
-        return stub
+    # Заглушка для отсутствующего файла тоже кэшируется - повторно диск не трогаем
+    return asset_cache.get(path, None, ("sprite", default_color), loader)
 
 
 def load_coin_frames():
@@ -73,64 +106,95 @@ def load_coin_frames():
     return frames
 
 
-coin_animation_frames = load_coin_frames()
+def get_filled_surface(size: Size, color: Color) -> pygame.Surface:
+    """Залитая цветом поверхность (одна на размер и цвет, рисовать поверх нельзя)"""
+    def loader() -> pygame.Surface:
+        surface = pygame.Surface(size)
+        surface.fill(color)
+        return surface
 
+    return asset_cache.get("fill", size, ("fill", color), loader)
 
-# Загружаем оригинальный фон
-original_bg = load_sprite("fon_1.jpg", (20, 30, 15))
 
-# Создаем склеенный фон (7x ширины с чередованием оригинальной и отраженной картинки)
-bg_width, bg_height = original_bg.get_size()
-stitched_bg = pygame.Surface((bg_width * 7, bg_height))
+def build_background() -> pygame.Surface:
+    """Склеенный фон (7x ширины с чередованием оригинальной и отраженной картинки)"""
+    original_bg = load_sprite("fon_1.jpg", (20, 30, 15))
+    bg_width, bg_height = original_bg.get_size()
+    stitched_bg = pygame.Surface((bg_width * 7, bg_height))
+    flipped_bg = pygame.transform.flip(original_bg, True, False)
 
-# Флаг для чередования оригинальной и отраженной картинки
-for i in range(7):
-    if i % 2 == 0:
-        # Оригинальная картинка
-        stitched_bg.blit(original_bg, (i * bg_width, 0))
-    else:
-        # Отраженная по горизонтали картинка
-        flipped_bg = pygame.transform.flip(original_bg, True, False)
-        stitched_bg.blit(flipped_bg, (i * bg_width, 0))
+    for i in range(7):
+        # Чередуем оригинальную и отраженную по горизонтали картинку
+        stitched_bg.blit(original_bg if i % 2 == 0 else flipped_bg, (i * bg_width, 0))
+    return stitched_bg
 
-background_sprite = stitched_bg
 
-# Загружаем оригинальный спрайт платформы
-original_pf = load_sprite("tile_1.png", (100, 100, 100))  # Исходный спрайт
-pf_width, pf_height = original_pf.get_size()
-platform_sprite = original_pf  # Используем оригинальный размер спрайта
-
-# Загружаем оригинальный спрайт вертикальной платформы
-original_vpf = load_sprite("tile_10.png", (100, 100, 100))  # Исходный спрайт
-vpf_width, vpf_height = original_vpf.get_size()
-vertical_platform_sprite = original_vpf  # Используем оригинальный размер спрайта
+def build_saw_sprite() -> pygame.Surface:
+    """Спрайт дисковой пилы (при отсутствии файла рисуется заглушка)"""
+    try:
+        sprite = pygame.image.load("assets/images/circular_saw.png").convert_alpha()
+        return pygame.transform.scale(sprite, (50, 50))
+    except:
+        # Создаем временный спрайт, если загрузка не удалась
+        sprite = pygame.Surface((50, 50), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (255, 0, 0), (25, 25), 25)
+        pygame.draw.circle(sprite, (200, 200, 200), (25, 25), 20)
+        return sprite
+
+
+# Спрайты уровня загружаются при первом обращении (sprites.get), а не при импорте модуля
+sprites = SpriteRegistry()
+sprites.register("background", build_background)
+sprites.register("level_background", lambda: load_sprite("level_1.png", (20, 30, 15)))
+sprites.register("platform", lambda: load_sprite("tile_1.png", (100, 100, 100)))
+sprites.register("vertical_platform", lambda: load_sprite("tile_10.png", (120, 120, 120)))
+sprites.register("horizontal_platform", lambda: load_sprite("tile_1.png", (120, 120, 120)))
+sprites.register("spike", lambda: load_sprite("spike_1.png", (139, 0, 0)))
+sprites.register("moving_platform", lambda: load_sprite("moving_platform.png", (150, 75, 0)))
+sprites.register("saw", build_saw_sprite)
+sprites.register("artifact", lambda: pygame.transform.scale(load_sprite("artifact.png", (255, 215, 0)), (40, 40)))
+sprites.register("portal", lambda: load_sprite("door.png", (0, 255, 0)))
+# Кадры анимации монеты
+sprites.register("coin_frames", lambda: [
+    load_sprite("coin.png", (255, 215, 0)),
+    load_sprite("coin_1.png", (255, 215, 0)),  # Желтый как цвет по умолчанию
+    load_sprite("coin_2.png", (255, 215, 0)),
+    load_sprite("coin_3.png", (255, 215, 0))
+])
 
-# Загружаем оригинальный спрайт горизонтальной платформы
-original_gpf = load_sprite("tile_10.png", (100, 100, 100))  # Исходный спрайт
-vpf_width, gpf_height = original_gpf.get_size()
-vertical_platform_sprite = original_gpf  # Используем оригинальный размер спрайта
 
-# coin_sprite = load_sprite("coin.png", (255, 215, 0))
-spike_sprite = load_sprite("spike_1.png", (139, 0, 0))
-moving_platform_sprite = load_sprite("moving_platform.png", (150, 75, 0))
-saw_sprite = load_sprite("saw.png", (200, 200, 200))
-artifact_sprite = load_sprite("artifact.png", (255, 215, 0))
-portal_sprite = load_sprite("door.png", (0, 255, 0))
-vertical_platform_sprite = load_sprite("tile_10.png", (120, 120, 120))
-horizontal_platform_sprite = load_sprite("tile_1.png", (120, 120, 120))
+# Варианты спрайтов, которые создают объекты уровней: (имя, размер, поворот)
+SPRITE_VARIANTS = (
+    ("moving_platform", (100, 30), 0),  # Лифт отладочного уровня
+    ("moving_platform", (100, 40), 0),  # Лифт в люках обычных и бесконечного уровней
+    ("spike", (48, 48), 0),  # Шипы на полу (масштаб 1.5)
+    ("spike", (48, 48), -90),  # Шипы на стене
+    ("portal", (50, 100), 0),
+)
 
 
-# Загрузка кадров анимации монеты
-coin_animation_frames = [
-load_sprite("coin.png", (255, 215, 0)),
-    load_sprite("coin_1.png", (255, 215, 0)),  # Желтый как цвет по умолчанию
-    load_sprite("coin_2.png", (255, 215, 0)),
-    load_sprite("coin_3.png", (255, 215, 0))
+def preload():
+    """Загружает все спрайты уровней, их варианты и атласы поворотов (вызывается за экраном загрузки)"""
+    sprites.preload()
+    for name, size, rotation in SPRITE_VARIANTS:
+        sprites.get_variant(name, size, rotation)
+    rotation_atlas.get_frames(sprites.get("saw"), CircularSaw.ROTATION_STEP)
+    rotation_atlas.get_frames(sprites.get("artifact"), Artifact.ROTATION_STEP)
 
-]
 
 class GameObject(ABC):
-    """Базовый класс для всех игровых объектов"""
+    """
+    Базовый класс для всех игровых объектов.
+
+    Объектов на уровне тысячи, поэтому классы иерархии объявляют __slots__
+    (без __dict__ у каждого экземпляра), а спрайты берут общими из реестра sprites.
+    """
+
+    __slots__ = ("rect", "is_active", "object_type", "prev_position",
+                 "store", "slot")  # store, slot - хранилище (EntityStore), в слоте которого лежат колонки объекта
+
+    is_static = False  # Объект никогда не двигается и не меняет вид (рисуется в статический слой)
+    components: Tuple[str, ...] = ()  # Системы EntityStore, которые обновляют объект (пусто - не сущность)
 
     def __init__(self, position: Position, size: Size, obj_type: ObjectType):
         """
@@ -140,9 +204,12 @@ class GameObject(ABC):
         :param size: Размер объекта (ширина, высота)
         :param obj_type: Тип объекта
         """
+        self.store: Optional[EntityStore] = None  # Объект пока не в хранилище - колонки лежат в нём самом
+        self.slot = -1
         self.rect = pygame.Rect(position[0], position[1], size[0], size[1])  # Прямоугольник объекта
         self.is_active = True  # Флаг активности объекта
         self.object_type = obj_type  # Тип объекта
+        self.prev_position = self.rect.topleft  # Позиция до последнего шага симуляции (для интерполяции)
 
     @abstractmethod
     def update(self):
@@ -150,18 +217,60 @@ class GameObject(ABC):
         pass
 
     @abstractmethod
-    def draw(self, surface: pygame.Surface):
-        """Отрисовка объекта на поверхности"""
+    def draw(self, surface: pygame.Surface, camera_offset: Position = (0, 0)):
+        """
+        Отрисовка объекта на поверхности.
+
+        :param surface: Поверхность для отрисовки (обычно экран)
+        :param camera_offset: Смещение камеры (координаты уровня -> координаты поверхности)
+        """
         pass
 
+    def advance(self, steps: int):
+        """
+        Догоняет пропущенные шаги обновления (объект был вне области активности уровня).
+
+        По умолчанию шаги выполняются по одному; периодические объекты считают состояние сразу.
+        """
+        for _ in range(steps):
+            self.update()
+
+    def reset(self, position: Position):
+        """Возвращает объект из пула (ObjectPool) в исходное состояние на новой позиции"""
+        self.rect.topleft = position
+        self.prev_position = self.rect.topleft
+        self.is_active = True
+
     def check_collision(self, other_rect: pygame.Rect) -> bool:
         """Проверка коллизии с другим объектом"""
         return self.rect.colliderect(other_rect)
 
+    def get_draw_rect(self, camera_offset: Position = (0, 0)) -> pygame.Rect:
+        """Экранная область, которую объект закрашивает при отрисовке"""
+        return self.rect.move(camera_offset)
+
+    def get_draw_state(self):
+        """Состояние, от которого зависит вид объекта помимо позиции (для грязных прямоугольников)"""
+        return None
+
+    def get_interpolated_offset(self, camera_offset: Position, alpha: float) -> Position:
+        """
+        Смещение для отрисовки объекта между предыдущей и текущей позицией.
+
+        :param camera_offset: Смещение камеры
+        :param alpha: 0.0 - предыдущий шаг симуляции, 1.0 - последний шаг
+        """
+        if alpha >= 1.0:
+            return camera_offset
+        return (camera_offset[0] + round((self.prev_position[0] - self.rect.x) * (1.0 - alpha)),
+                camera_offset[1] + round((self.prev_position[1] - self.rect.y) * (1.0 - alpha)))
+
 
 class Bonus(GameObject):
     """Базовый класс бонусов"""
 
+    __slots__ = ("points",)
+
     def __init__(self, position: Position, size: Size, points: int, obj_type: ObjectType):
         """
         Инициализация бонуса.
@@ -181,9 +290,21 @@ class Bonus(GameObject):
 
 
 class Coin(Bonus):
+    """
+    Монета.
+
+    Все монеты анимируются синхронно по общим часам: кадр считается при отрисовке,
+    поэтому монеты не обновляются каждый шаг и сколько их ни было - шаг уровня не дорожает.
+    """
+
+    __slots__ = ("frames", "sprite_offset_x", "sprite_offset_y")
+
+    FRAME_TIME = 150  # Смена кадра анимации (мс)
+
     def __init__(self, position: Position):
         # Загружаем первый кадр для определения базового размера
-        base_frame = coin_animation_frames[0]
+        frames = sprites.get("coin_frames")
+        base_frame = frames[0]
         sprite_width, sprite_height = base_frame.get_size()
 
         # Создаем хитбокс ПРОПОРЦИОНАЛЬНО спрайту
@@ -192,33 +313,44 @@ class Coin(Bonus):
 
         super().__init__(position, (hitbox_width, hitbox_height), 100, ObjectType.COIN)
 
-        self.frames = coin_animation_frames
-        self.current_frame = 0
-        self.animation_speed = 0.15
-        self.last_update = pygame.time.get_ticks()
+        self.frames = frames
 
         # Центрируем хитбокс относительно спрайта
         self.sprite_offset_x = (hitbox_width - sprite_width) // 2
         self.sprite_offset_y = (hitbox_height - sprite_height) // 2
 
+    @staticmethod
+    def get_hitbox_size() -> Size:
+        """Размер хитбокса монеты (по первому кадру анимации) - нужен генератору до создания монеты"""
+        sprite_width, sprite_height = sprites.get("coin_frames")[0].get_size()
+        return max(7, sprite_width), sprite_height  # Минимальная ширина 7 пикселей
+
+    @property
+    def current_frame(self) -> int:
+        """Кадр анимации по общим часам"""
+        return pygame.time.get_ticks() // self.FRAME_TIME % len(self.frames)
+
     def update(self):
-        now = pygame.time.get_ticks()
-        if now - self.last_update > self.animation_speed * 1000:
-            self.current_frame = (self.current_frame + 1) % len(self.frames)
-            self.last_update = now
+        """Кадр считается по часам при отрисовке - обновлять нечего"""
+        pass
+
+    def get_draw_state(self):
+        return self.current_frame
 
-    def draw(self, surface: pygame.Surface):
+    def draw(self, surface: pygame.Surface, camera_offset: Position = (0, 0)):
         current_sprite = self.frames[self.current_frame]
         # Позиция отрисовки с учетом смещения
         surface.blit(current_sprite,
-                     (self.rect.x + self.sprite_offset_x,
-                      self.rect.y + self.sprite_offset_y))
+                     (self.rect.x + self.sprite_offset_x + camera_offset[0],
+                      self.rect.y + self.sprite_offset_y + camera_offset[1]))
 
 
 
 class Obstacle(GameObject):
     """Базовый класс препятствий"""
 
+    __slots__ = ()
+
     def __init__(self, position: Position, size: Size, obj_type: ObjectType):
         """
         Инициализация препятствия.
@@ -233,6 +365,11 @@ class Obstacle(GameObject):
 class Hole(GameObject):
     """Класс люка без привязки к лифту"""
 
+    __slots__ = ("platform",)
+
+    is_static = True
+    COLOR = (0, 5, 5)  # Цвет провала (люк - просто залитый прямоугольник, своей поверхности нет)
+
     def __init__(self, platform: 'Platform', width: int, position_x: int):
         super().__init__(
             (platform.rect.x + position_x, platform.rect.y),
@@ -240,21 +377,22 @@ class Hole(GameObject):
             ObjectType.HOLE
         )
         self.platform = platform
-        self.sprite = pygame.Surface((width, PLATFORM_HEIGHT))
-        self.sprite.fill((0, 5, 5))
 
     def update(self):
         """Реализация абстрактного метода - люк не требует обновления"""
         pass
 
-    def draw(self, surface: pygame.Surface):
+    def draw(self, surface: pygame.Surface, camera_offset: Position = (0, 0)):
         """Реализация абстрактного метода"""
-        surface.blit(self.sprite, self.rect)
+        # fill не обрезает прямоугольник с отрицательными координатами - обрезаем сами
+        surface.fill(self.COLOR, self.rect.move(camera_offset).clip(surface.get_clip()))
 
 
 class HoleWithLift(Hole):
     """Люк с автоматически движущимся лифтом"""
 
+    __slots__ = ("lift",)
+
     def __init__(self, platform: 'Platform', width: int, position_x: int, lift_height: int = 30):
         """
         :param platform: Родительская платформа
@@ -286,21 +424,20 @@ class HoleWithLift(Hole):
             self.lift.rect.centerx = self.rect.centerx
             self.lift.update()
 
-    def draw(self, surface: pygame.Surface):
-        """Отрисовка люка и лифта"""
-        super().draw(surface)  # Рисуем сам люк
-        if self.lift:
-            self.lift.draw(surface)  # Рисуем лифт
+    def draw(self, surface: pygame.Surface, camera_offset: Position = (0, 0)):
+        """Отрисовка люка (лифт рисуется уровнем как препятствие, люк - в статическом слое)"""
+        super().draw(surface, camera_offset)
 
 
 class Platform(GameObject):
     """Платформа с возможностью создания отверстий"""
 
+    __slots__ = ("holes", "has_vertical_wall")
+
+    is_static = True
 
     def __init__(self, position: Position, width: int):
         super().__init__(position, (width, PLATFORM_HEIGHT), ObjectType.PLATFORM)
-        self.sprite = platform_sprite
-        self.sprite = pygame.transform.scale(self.sprite, (width, PLATFORM_HEIGHT))
         self.holes = []
         self.has_vertical_wall = False
 
@@ -308,6 +445,11 @@ class Platform(GameObject):
         """Обновление состояния платформы (пустая реализация, так как платформа статична)"""
         pass
 
+    def reset(self, position: Position):
+        super().reset(position)
+        self.holes = []
+        self.has_vertical_wall = False
+
     def add_hole(self, width: int, position_x: int) -> Hole:
         """Добавляет отверстие в платформе"""
         hole = Hole(self, width, position_x)
@@ -315,34 +457,50 @@ class Platform(GameObject):
         return hole
 
 
-    def draw(self, surface: pygame.Surface):
-        """Отрисовка платформы со склеенным спрайтом"""
+    def draw(self, surface: pygame.Surface, camera_offset: Position = (0, 0)):
+        """Отрисовка платформы со склеенным спрайтом (только видимые тайлы)"""
         # Получаем размеры оригинального спрайта платформы
+        platform_sprite = sprites.get("platform")
         sprite_width, sprite_height = platform_sprite.get_size()
 
-        # Вычисляем сколько раз нужно повторить спрайт
-        repeat_count = 200
+        # Вычисляем сколько раз нужно повторить спрайт (не дальше правого края платформы)
+        repeat_count = min(200, -(-self.rect.width // sprite_width))
+
+        # Диапазон тайлов, попадающих в область отрисовки поверхности
+        clip = surface.get_clip()
+        screen_x = self.rect.x + camera_offset[0]
+        first = max(0, (clip.left - screen_x) // sprite_width)
+        last = min(repeat_count, (clip.right - screen_x) // sprite_width + 1)
 
         # Рисуем склеенные спрайты
-        for i in range(repeat_count):
-            surface.blit(platform_sprite, (self.rect.x + i * sprite_width, self.rect.y))
+        y = self.rect.y + camera_offset[1]
+        for i in range(first, last):
+            surface.blit(platform_sprite, (screen_x + i * sprite_width, y))
 
         # Отрисовка отверстий
         for hole in self.holes:
-            hole.draw(surface)
+            hole.draw(surface, camera_offset)
 
 
 class MovingPlatformVertical(Obstacle):
     """Вертикально движущаяся платформа (лифт)"""
 
+    __slots__ = ("sprite", "_speed", "_direction", "_lower_y", "_upper_y")  # _* - колонки вне хранилища
+
+    components = ("lift",)
+
+    speed = Column()
+    direction = Column()
+    lower_y = Column()
+    upper_y = Column()
+
     def __init__(self, position: Position, height: int):
         """
         :param position: Начальная позиция (x, y)
         :param height: Высота платформы
         """
         super().__init__(position, (100, height), ObjectType.MOVING_PLATFORM)
-        self.sprite = moving_platform_sprite
-        self.sprite = pygame.transform.scale(self.sprite, (100, height))
+        self.sprite = sprites.get_scaled("moving_platform", (100, height))
 
         # Границы движения
         self.lower_y = position[1]  # Нижняя граница (начальная позиция)
@@ -352,23 +510,33 @@ class MovingPlatformVertical(Obstacle):
         self.rect.y = position[1]
 
     def update(self):
-        """Обновление позиции лифта"""
-        self.rect.y += self.speed * self.direction
+        """Один шаг лифта вне хранилища (в хранилище лифты двигает система lift)"""
+        self.advance(1)
 
-        # Проверка границ и смена направления
-        if self.rect.y >= self.lower_y:
-            self.direction = -1  # Двигаемся вверх
-        elif self.rect.y <= self.upper_y:
-            self.direction = 1  # Двигаемся вниз
+    def advance(self, steps: int):
+        """Позиция через steps шагов по закэшированной траектории (относительно верхней границы)"""
+        speed, lower_y, upper_y = self.speed, self.lower_y, self.upper_y
 
-    def draw(self, surface: pygame.Surface):
+        def step(state):
+            y, direction = lift_step(state[0] + upper_y, state[1], speed, lower_y, upper_y)
+            return y - upper_y, direction
+
+        key = ("lift", self.speed, self.lower_y - upper_y)
+        offset, self.direction = advance_periodic(key, step, (self.rect.y - upper_y, self.direction), steps)
+        self.rect.y = offset + upper_y
+
+    def draw(self, surface: pygame.Surface, camera_offset: Position = (0, 0)):
         """Отрисовка лифта"""
-        surface.blit(self.sprite, self.rect)
+        surface.blit(self.sprite, self.rect.move(camera_offset))
 
 
 class StaticVerticalPlatform(Obstacle):
     """Статичная вертикальная платформа (стена/колонна)"""
 
+    __slots__ = ("original_sprite", "tile_height")
+
+    is_static = True
+
     def __init__(self, position: Position, height: int):
         """
         Инициализация вертикальной платформы.
@@ -378,40 +546,45 @@ class StaticVerticalPlatform(Obstacle):
         """
         super().__init__(position, (30, 100), ObjectType.PLATFORM)
         # Оригинальный спрайт без масштабирования
-        self.original_sprite = vertical_platform_sprite
+        self.original_sprite = sprites.get("vertical_platform")
         self.tile_height = self.original_sprite.get_height()  # Высота одного тайла
 
     def update(self):
         """Обновление состояния (пустое, так как платформа статична)"""
         pass
 
-    def draw(self, surface: pygame.Surface):
+    def draw(self, surface: pygame.Surface, camera_offset: Position = (0, 0)):
         """Отрисовка с повторением текстуры по вертикали"""
+        rect = self.rect.move(camera_offset)
         # Сколько целых тайлов помещается
-        full_tiles = self.rect.height // self.tile_height
+        full_tiles = rect.height // self.tile_height
         # Остаток (последний неполный тайл)
-        remainder = self.rect.height % self.tile_height
+        remainder = rect.height % self.tile_height
 
         # Рисуем целые тайлы
         for i in range(full_tiles):
             surface.blit(self.original_sprite,
-                         (self.rect.x,
-                          self.rect.y + i * self.tile_height))
+                         (rect.x,
+                          rect.y + i * self.tile_height))
 
         # Рисуем остаток (если есть)
         if remainder > 0:
             # Вырезаем нужную часть из спрайта
-            partial_tile = pygame.Surface((self.rect.width, remainder), pygame.SRCALPHA)
+            partial_tile = pygame.Surface((rect.width, remainder), pygame.SRCALPHA)
             partial_tile.blit(self.original_sprite, (0, 0),
-                              (0, 0, self.rect.width, remainder))
+                              (0, 0, rect.width, remainder))
             surface.blit(partial_tile,
-                         (self.rect.x,
-                          self.rect.y + full_tiles * self.tile_height))
+                         (rect.x,
+                          rect.y + full_tiles * self.tile_height))
 
 
 class StaticHorizontalPlatform(Obstacle):
     """Статичная горизонтальная платформа (балка/перемычка)"""
 
+    __slots__ = ("original_sprite", "tile_height")
+
+    is_static = True
+
     def __init__(self, position: Position, width: int):
         """
         Инициализация горизонтальной платформы.
@@ -421,40 +594,45 @@ class StaticHorizontalPlatform(Obstacle):
         """
         super().__init__(position, (width, 20), ObjectType.PLATFORM)
         # Оригинальный спрайт без масштабирования
-        self.original_sprite = horizontal_platform_sprite
+        self.original_sprite = sprites.get("horizontal_platform")
         self.tile_height = self.original_sprite.get_height()  # Высота одного тайла
 
     def update(self):
         """Обновление состояния (пустое, так как платформа статична)"""
         pass
 
-    def draw(self, surface: pygame.Surface):
+    def draw(self, surface: pygame.Surface, camera_offset: Position = (0, 0)):
         """Отрисовка с повторением текстуры по горизонтали"""
+        rect = self.rect.move(camera_offset)
         # Получаем ширину одного тайла из спрайта
         tile_width = self.original_sprite.get_width()
         # Сколько целых тайлов помещается
-        full_tiles = self.rect.width // tile_width
+        full_tiles = rect.width // tile_width
         # Остаток (последний неполный тайл)
-        remainder = self.rect.width % tile_width
+        remainder = rect.width % tile_width
 
         # Рисуем целые тайлы
         for i in range(full_tiles):
             surface.blit(self.original_sprite,
-                    (self.rect.x + i * tile_width,  # X увеличивается вправо
-                     self.rect.y))                  # Y остается постоянным
+                    (rect.x + i * tile_width,  # X увеличивается вправо
+                     rect.y))                  # Y остается постоянным
 
         # Рисуем остаток (если есть)
         if remainder > 0:
             # Вырезаем нужную часть из спрайта
-            partial_tile = pygame.Surface((self.rect.width, remainder), pygame.SRCALPHA)
+            partial_tile = pygame.Surface((rect.width, remainder), pygame.SRCALPHA)
             partial_tile.blit(self.original_sprite, (0, 0),
-                              (0, 0, remainder, self.rect.height))
+                              (0, 0, remainder, rect.height))
             surface.blit(partial_tile,
-                         (self.rect.x + full_tiles * tile_width,  # Позиция остатка
-                          self.rect.y))
+                         (rect.x + full_tiles * tile_width,  # Позиция остатка
+                          rect.y))
 
 
 class Spike(Obstacle):
+    __slots__ = ("is_floor_spike", "scale", "sprite")
+
+    is_static = True
+
     def __init__(self, position: Position, is_floor_spike: bool = True, scale: float = 1.5):
         """
         :param position: Позиция шипов (x, y)
@@ -466,25 +644,12 @@ class Spike(Obstacle):
         scaled_size = int(base_size * scale)
         size = (scaled_size, scaled_size)
         super().__init__(position, size, ObjectType.SPIKE)
+        self.is_floor_spike = is_floor_spike
+        self.scale = scale
 
-        # Загружаем оригинальный спрайт
-        original_sprite = spike_sprite
-        self.original_sprite = spike_sprite
-        self.scaled_sprite = pygame.transform.scale(
-            self.original_sprite,
-            (scaled_size, scaled_size)
-        )
-
-        # Трансформируем спрайт в зависимости от ориентации
-        if is_floor_spike:
-            # Шипы на полу (нормальная ориентация)
-            self.sprite = pygame.transform.scale(original_sprite, (scaled_size, scaled_size))
-        else:
-            # Шипы на стене (повернуты на 90 градусов)
-            self.scaled_sprite = pygame.transform.rotate(self.scaled_sprite, -90)
-
-            self.sprite = self.scaled_sprite
-            self.rect = self.sprite.get_rect(topleft=position)
+        # Шипы на полу - в нормальной ориентации, на стене - повернуты на 90 градусов.
+        # Спрайт общий для всех шипов такого размера и ориентации
+        self.sprite = sprites.get_variant("spike", (scaled_size, scaled_size), 0 if is_floor_spike else -90)
 
         # Хитбокс должен соответствовать спрайту
         self.rect = self.sprite.get_rect(topleft=position)
@@ -493,14 +658,26 @@ class Spike(Obstacle):
         """Обновление состояния шипов (пустое, так как шипы не движутся)"""
         pass
 
-    def draw(self, surface: pygame.Surface):
+    def draw(self, surface: pygame.Surface, camera_offset: Position = (0, 0)):
         """Отрисовка шипов на поверхности"""
-        surface.blit(self.sprite, self.rect)
+        surface.blit(self.sprite, self.rect.move(camera_offset))
 
 
 class CircularSaw(Obstacle):
     """Дисковая пила"""
 
+    __slots__ = ("sprite", "_original_y", "_move_range", "_speed", "_direction",
+                 "_rotation_angle")  # _* - колонки вне хранилища
+
+    ROTATION_STEP = 10  # Шаг вращения за кадр (градусы)
+    components = ("saw",)
+
+    original_y = Column()
+    move_range = Column()
+    speed = Column()
+    direction = Column()
+    rotation_angle = Column("angle")
+
     def __init__(self, position: Position, move_range: int):
         """
         Инициализация дисковой пилы.
@@ -508,15 +685,8 @@ class CircularSaw(Obstacle):
         :param position: Позиция пилы (x, y)
         :param move_range: Диапазон движения пилы
         """
-        # Загружаем спрайт внутри класса
-        try:
-            self.sprite = pygame.image.load("assets/images/circular_saw.png").convert_alpha()
-            self.sprite = pygame.transform.scale(self.sprite, (50, 50))
-        except:
-            # Создаем временный спрайт, если загрузка не удалась
-            self.sprite = pygame.Surface((50, 50), pygame.SRCALPHA)
-            pygame.draw.circle(self.sprite, (255, 0, 0), (25, 25), 25)
-            pygame.draw.circle(self.sprite, (200, 200, 200), (25, 25), 20)
+        # Спрайт общий для всех пил - атлас поворотов строится один раз
+        self.sprite = sprites.get("saw")
 
         super().__init__(position, (50, 50), ObjectType.CIRCULAR_SAW)
         self.original_y = position[1]
@@ -525,27 +695,54 @@ class CircularSaw(Obstacle):
         self.direction = 1
         self.rotation_angle = 0
 
+    def reset(self, position: Position, move_range: int):
+        super().reset(position)
+        self.original_y = position[1]
+        self.move_range = move_range
+        self.speed = 3
+        self.direction = 1
+        self.rotation_angle = 0
+
     def update(self):
-        """Обновление состояния пилы"""
-        self.rect.y += self.speed * self.direction
-        if self.rect.y > self.original_y + self.move_range:
-            self.direction = -1
-        elif self.rect.y < self.original_y - self.move_range:
-            self.direction = 1
+        """Один шаг пилы вне хранилища (в хранилище пилы двигает система saw)"""
+        self.advance(1)
+
+    def advance(self, steps: int):
+        """Позиция и угол через steps шагов: движение - по закэшированной траектории, угол - формулой"""
+        speed, move_range = self.speed, self.move_range
+
+        def step(state):
+            return saw_step(state[0], state[1], speed, move_range)
+
+        key = ("saw", speed, move_range)
+        offset, self.direction = advance_periodic(key, step, (self.rect.y - self.original_y, self.direction), steps)
+        self.rect.y = self.original_y + offset
+        self.rotation_angle = rotation_step(self.rotation_angle, self.ROTATION_STEP, steps)
 
-        # Обновляем угол вращения
-        self.rotation_angle = (self.rotation_angle + 10) % 360
+    def get_draw_rect(self, camera_offset: Position = (0, 0)) -> pygame.Rect:
+        """Повёрнутый спрайт выходит за пределы хитбокса"""
+        return self.rect.move(camera_offset).inflate(DRAW_MARGIN, DRAW_MARGIN)
 
-    def draw(self, surface: pygame.Surface):
-        """Отрисовка пилы с вращением"""
-        rotated_sprite = pygame.transform.rotate(self.sprite, self.rotation_angle)
-        new_rect = rotated_sprite.get_rect(center=self.rect.center)
-        surface.blit(rotated_sprite, new_rect.topleft)
+    def get_draw_state(self):
+        return self.rotation_angle
+
+    def draw(self, surface: pygame.Surface, camera_offset: Position = (0, 0)):
+        """Отрисовка пилы с вращением (кадр из общего атласа поворотов)"""
+        rotated_sprite, (dx, dy) = rotation_atlas.get(self.sprite, self.rotation_angle, self.ROTATION_STEP)
+        center_x, center_y = self.rect.center
+        surface.blit(rotated_sprite, (center_x + dx + camera_offset[0], center_y + dy + camera_offset[1]))
 
 
 class Artifact(Bonus):
     """Артефакт - специальный бонус"""
 
+    __slots__ = ("sprite", "_animation_angle")  # _animation_angle - колонка вне хранилища
+
+    ROTATION_STEP = 2  # Шаг вращения за кадр (градусы)
+    components = ("artifact",)
+
+    animation_angle = Column("angle")
+
     def __init__(self, position: Position):
         """
         Инициализация артефакта.
@@ -553,25 +750,36 @@ class Artifact(Bonus):
         :param position: Позиция артефакта (x, y)
         """
         super().__init__(position, (40, 40), 1000, ObjectType.ARTIFACT)
-        self.sprite = artifact_sprite
-        self.sprite = pygame.transform.scale(self.sprite, (40, 40))
+        self.sprite = sprites.get("artifact")  # Масштабированный спрайт, общий для всех артефактов
         self.animation_angle = 0  # Угол анимации
 
     def update(self):
-        """Обновление состояния артефакта"""
-        self.animation_angle = (self.animation_angle + 2) % 360  # Изменение угла анимации
+        """Один шаг артефакта вне хранилища (в хранилище артефакты вращает система artifact)"""
+        self.advance(1)
+
+    def advance(self, steps: int):
+        self.animation_angle = rotation_step(self.animation_angle, self.ROTATION_STEP, steps)
+
+    def get_draw_rect(self, camera_offset: Position = (0, 0)) -> pygame.Rect:
+        """Повёрнутый спрайт выходит за пределы хитбокса"""
+        return self.rect.move(camera_offset).inflate(DRAW_MARGIN, DRAW_MARGIN)
+
+    def get_draw_state(self):
+        return self.animation_angle
 
-    def draw(self, surface: pygame.Surface):
+    def draw(self, surface: pygame.Surface, camera_offset: Position = (0, 0)):
         """Отрисовка артефакта на поверхности"""
-        # Вращаем спрайт артефакта
-        rotated_sprite = pygame.transform.rotate(self.sprite, self.animation_angle)
-        new_rect = rotated_sprite.get_rect(center=self.rect.center)
-        surface.blit(rotated_sprite, new_rect.topleft)
+        # Повёрнутый кадр берём из общего атласа
+        rotated_sprite, (dx, dy) = rotation_atlas.get(self.sprite, self.animation_angle, self.ROTATION_STEP)
+        center_x, center_y = self.rect.center
+        surface.blit(rotated_sprite, (center_x + dx + camera_offset[0], center_y + dy + camera_offset[1]))
 
 
 class Portal(GameObject):
     """Класс, представляющий портал в игре. Может быть входным или выходным."""
 
+    __slots__ = ("sprite", "is_exit", "is_finish", "disappear_timer", "visible", "color", "disappear_alpha")
+
     def __init__(self, position: Position, is_exit: bool):
         """
         Инициализация портала.
@@ -580,7 +788,6 @@ class Portal(GameObject):
         :param is_exit: Флаг, является ли портал выходом
         """
         super().__init__(position, (50, 100), ObjectType.PORTAL)
-        self.sprite = portal_sprite
         self.is_exit = is_exit  # True - выходной портал, False - входной
         self.is_finish = is_exit  # Синоним для совместимости с существующим кодом
         self.disappear_timer = None  # Таймер исчезновения
@@ -589,14 +796,12 @@ class Portal(GameObject):
         self.disappear_alpha = 255  # Полностью непрозрачный
 
         try:
-            self.sprite = portal_sprite
-            self.sprite = pygame.transform.scale(self.sprite, (50, 100))
+            self.sprite = sprites.get_scaled("portal", (50, 100))
             Logger().debug(f"Портал: изображение успешно загружено, размер {self.sprite.get_size()}")
         except Exception as e:
             Logger().debug(f"Ошибка загрузки изображения портала: {e}")
-            # Создаем заглушку
-            self.sprite = pygame.Surface((50, 100), pygame.SRCALPHA)
-            self.sprite.fill((0, 255, 0) if is_exit else (255, 0, 0))
+            # Заглушка общая для всех порталов того же цвета
+            self.sprite = get_filled_surface((50, 100), self.color)
             Logger().debug("Создана заглушка для портала")
 
     def disappear_after(self, milliseconds: int):
@@ -609,44 +814,50 @@ class Portal(GameObject):
             progress = (pygame.time.get_ticks() - self.disappear_timer) / self.disappear_delay
             self.disappear_alpha = max(0, 255 - int(255 * progress))
 
+    def get_draw_state(self):
+        return self.visible, self.disappear_alpha
 
 
-    def draw(self, surface: pygame.Surface):
+    def draw(self, surface: pygame.Surface, camera_offset: Position = (0, 0)):
         """Отрисовка портала"""
-        Logger().debug(f"Отрисовка портала: pos={self.rect.topleft}, видимый={self.disappear_alpha > 0}")
+        Logger().debug("Отрисовка портала: pos=%s, видимый=%s", self.rect.topleft, self.disappear_alpha > 0)
         if self.visible:
+            screen_rect = self.rect.move(camera_offset)
             if self.sprite:
-                Logger().debug(f"✅ sprite существует, размер: {self.sprite.get_size()}")
-                surface.blit(self.sprite, self.rect)  # <-- Здесь рисуем
+                Logger().debug(lambda: f"✅ sprite существует, размер: {self.sprite.get_size()}")
+                surface.blit(self.sprite, screen_rect)  # <-- Здесь рисуем
             else:
                 Logger().debug("❌ Ошибка: sprite = None, рисуем заглушку")
                 s = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
                 pygame.draw.rect(s, (*self.color, self.disappear_alpha), (0, 0, self.rect.width, self.rect.height))
-                surface.blit(s, self.rect)
+                surface.blit(s, screen_rect)
 
 
 class Level(ABC):
     """Абстрактный базовый класс уровня"""
 
-    def __init__(self, level_num: int):
-
-        if not pygame.display.get_init():
-            pygame.init()
-            pygame.display.set_mode((1, 1))
-
-            # Теперь безопасно загружаем спрайты
-        self.background = load_sprite("level_1.png", (20, 30, 15))
-        Logger().debug(f"Размер фона: {self.background.get_size()}")  # Должно быть (1280, 960)
+    cacheable = True  # Раскладку можно сохранить снимком (to_snapshot) и восстановить из него
 
+    def __init__(self, level_num: int, seed: Optional[int] = None, snapshot: Optional[dict] = None):
         """
         Инициализация уровня.
 
         :param level_num: Номер уровня
+        :param seed: Зерно генерации (None - случайный уровень)
+        :param snapshot: Снимок раскладки (to_snapshot) - уровень восстанавливается из него без генерации
         """
+        self.background = sprites.get("level_background")
+        Logger().debug(lambda: f"Размер фона: {self.background.get_size()}")  # Должно быть (1280, 960)
+
         self.level_num = level_num  # Номер уровня
+        self.seed = seed  # Зерно генерации
+        self.rng = random.Random(seed)  # Собственный генератор уровня (не трогает глобальный random)
         self.width = LEVEL_WIDTH  # Ширина уровня
         self.height = SCREEN_HEIGHT  # Высота уровня
         self.completed = False  # Флаг завершения уровня
+        self.completion_tick = 0  # Шаг симуляции, на котором уровень пройден
+        self.tick = 0  # Сколько раз уровень обновлялся
+        self.activity_area: Optional[pygame.Rect] = None  # Где объекты обновляются (None - везде)
         self.score = 0  # Счет
         self.artifacts_collected = 0  # Количество собранных артефактов
         self.artifacts_required = level_num  # Требуемое количество артефактов
@@ -654,51 +865,260 @@ class Level(ABC):
         self.portal_remove_timer = None
         self.portal_remove_delay = 3000  # 3 секунды в миллисекундах
 
+        # Занятые области для расстановки объектов без наложений
+        self.placement = PlacementGrid(PLACEMENT_CELL_SIZE, PLACEMENT_CLEARANCE)
+
         # Игровые объекты
         self.platforms: List[Platform] = []  # Список платформ
         self.obstacles: List[Obstacle] = []  # Список препятствий
-        self.bonuses: List[Bonus] = []  # Список бонусов
+        self.bonuses: IndexedList[Bonus] = IndexedList()  # Бонусы (собранный удаляется за O(1))
         self.artifacts: List[Artifact] = []  # Список артефактов
         self.portals: List[Portal] = []  # Список порталов
 
-        # Генерация уровня
-        self.generate_level()
-
-        # Будем хранить занятые позиции (x, y)
-        self.used_positions = []
+        # Генерация уровня (или восстановление из снимка)
+        if snapshot is not None:
+            self.load_snapshot(snapshot)
+        else:
+            self.generate_level()
+
+        # Объекты по корзинам (платформы, лифты, опасности, бонусы, порталы) с сеткой поиска в каждой
+        self.buckets = ObjectBuckets(SPATIAL_CELL_SIZE)
+        # Горячие данные подвижных объектов в колонках; обновляются системами хранилища
+        self.entities = EntityStore()
+        self.index_objects([*self.platforms, *self.obstacles, *self.bonuses, *self.artifacts, *self.portals])
+        # Неподвижные опоры и люки - растром: физика ищет их без перебора объектов
+        self.occupancy: Optional[OccupancyGrid] = None
+        self.rebuild_occupancy()
+
+        # Кэш неподвижной геометрии: чанки строятся лениво по мере приближения камеры
+        self.static_layer = StaticLayer(self.height, sprites.get("background"), STATIC_CHUNK_WIDTH, STATIC_CHUNK_CAPACITY,
+                                        self.width)
+        self.static_layer.set_objects(self.get_static_objects())
 
     @abstractmethod
     def generate_level(self):
         """Генерация элементов уровня"""
         pass
 
-    def is_position_valid(self, x: int, y: int, width: int, height: int) -> bool:
-        """Проверяет, что новая позиция не пересекается с существующими объектами"""
-        new_rect = pygame.Rect(x, y, width, height).inflate(100, 100)  # Добавляем отступы
-        for (used_x, used_y, used_w, used_h) in self.used_positions:
-            existing_rect = pygame.Rect(used_x, used_y, used_w, used_h).inflate(100, 100)
-            if new_rect.colliderect(existing_rect):
-                return False
-        return True
+    def to_snapshot(self) -> dict:
+        """
+        Раскладка уровня (платформы, люки, препятствия, монеты, артефакты, порталы) в виде JSON-совместимого словаря.
+
+        Снимается сразу после генерации; препятствия хранятся в исходном порядке.
+        """
+        lifts = {}  # Лифт -> (номер платформы, номер люка)
+        platforms = []
+        for i, platform in enumerate(self.platforms):
+            holes = []
+            for j, hole in enumerate(platform.holes):
+                lift = getattr(hole, "lift", None)
+                holes.append([hole.rect.x - platform.rect.x, hole.rect.width,
+                              lift.rect.height if lift is not None else None])
+                if lift is not None:
+                    lifts[lift] = (i, j)
+            platforms.append([platform.rect.x, platform.rect.y, platform.rect.width, holes])
+
+        obstacles = []
+        for obstacle in self.obstacles:
+            if obstacle in lifts:
+                obstacles.append(["lift", *lifts[obstacle], obstacle.speed])
+            elif isinstance(obstacle, Spike):
+                obstacles.append(["spike", obstacle.rect.x, obstacle.rect.y, obstacle.is_floor_spike, obstacle.scale])
+            elif isinstance(obstacle, CircularSaw):
+                obstacles.append(["saw", obstacle.rect.x, obstacle.original_y, obstacle.move_range])
+            elif isinstance(obstacle, StaticVerticalPlatform):
+                obstacles.append(["wall", obstacle.rect.x, obstacle.rect.y, obstacle.rect.height])
+            elif isinstance(obstacle, StaticHorizontalPlatform):
+                obstacles.append(["beam", obstacle.rect.x, obstacle.rect.y, obstacle.rect.width])
+            else:
+                raise ValueError(f"Препятствие {type(obstacle).__name__} не поддерживается снимком уровня")
+
+        return {
+            "class": type(self).__name__,
+            "level_num": self.level_num,
+            "seed": self.seed,
+            "width": self.width,
+            "height": self.height,
+            "artifacts_required": self.artifacts_required,
+            "platforms": platforms,
+            "obstacles": obstacles,
+            "coins": [list(bonus.rect.topleft) for bonus in self.bonuses],
+            "artifacts": [list(artifact.rect.topleft) for artifact in self.artifacts],
+            "portals": [[portal.rect.x, portal.rect.y, portal.is_exit, portal.visible] for portal in self.portals],
+        }
 
-    def get_valid_position(self, width: int, height: int, platform: Platform = None) -> tuple:
-        """Генерирует валидную позицию с привязкой к платформе (если указана)"""
-        max_attempts = 100
-        for _ in range(max_attempts):
-            if platform:
-                x = random.randint(50, self.width - width - 50)
-                y = random.randint(platform.rect.top - 300, platform.rect.top - 50)
+    def load_snapshot(self, snapshot: dict):
+        """Восстанавливает раскладку уровня из to_snapshot() вместо generate_level()"""
+        self.width = snapshot["width"]
+        self.height = snapshot["height"]
+        self.artifacts_required = snapshot["artifacts_required"]
+
+        self.platforms = []
+        for x, y, width, holes in snapshot["platforms"]:
+            platform = Platform((x, y), width)
+            for position_x, hole_width, lift_height in holes:
+                if lift_height is None:
+                    platform.holes.append(Hole(platform, hole_width, position_x))
+                else:
+                    platform.holes.append(HoleWithLift(platform, hole_width, position_x, lift_height))
+            self.platforms.append(platform)
+
+        self.obstacles = []
+        for kind, *args in snapshot["obstacles"]:
+            if kind == "lift":
+                platform_num, hole_num, speed = args
+                lift = self.platforms[platform_num].holes[hole_num].lift
+                lift.speed = speed
+                self.obstacles.append(lift)
+            elif kind == "spike":
+                x, y, is_floor_spike, scale = args
+                self.obstacles.append(Spike((x, y), is_floor_spike, scale))
+            elif kind == "saw":
+                x, y, move_range = args
+                self.obstacles.append(CircularSaw((x, y), move_range))
+            elif kind == "wall":
+                x, y, height = args
+                self.obstacles.append(StaticVerticalPlatform((x, y), height))
+            elif kind == "beam":
+                x, y, width = args
+                self.obstacles.append(StaticHorizontalPlatform((x, y), width))
             else:
-                x = random.randint(50, self.width - width - 50)
-                y = random.randint(50, self.height - height - 50)
+                raise ValueError(f"Неизвестное препятствие в снимке уровня: {kind}")
+
+        self.bonuses = IndexedList(Coin((x, y)) for x, y in snapshot["coins"])
+        self.artifacts = [Artifact((x, y)) for x, y in snapshot["artifacts"]]
+        self.portals = []
+        for x, y, is_exit, visible in snapshot["portals"]:
+            portal = Portal((x, y), is_exit)
+            portal.visible = visible
+            self.portals.append(portal)
 
-            if self.is_position_valid(x, y, width, height):
-                self.used_positions.append((x, y, width, height))
-                return (x, y)
+    def is_position_valid(self, x: int, y: int, width: int, height: int) -> bool:
+        """Проверяет, что новая позиция не пересекается с существующими объектами (с отступами)"""
+        return self.placement.fits(pygame.Rect(x, y, width, height))
+
+    def get_valid_position(self, size: Size, x_range: Tuple[int, int], y_range: Tuple[int, int],
+                           required: bool = False, attempts: int = PLACEMENT_ATTEMPTS,
+                           clearance: Optional[int] = None) -> Optional[Position]:
+        """
+        Генерирует позицию без наложения на расставленные объекты (с отступами) и занимает её.
+
+        :param size: Размер области, которую занимает объект
+        :param x_range: Допустимый диапазон x левого верхнего угла (включительно)
+        :param y_range: Допустимый диапазон y левого верхнего угла (включительно)
+        :param required: Обязательный объект (портал, артефакт) - если места нет, ставится
+                         в случайную точку диапазона без проверки наложений
+        :param attempts: Случайных попыток до полного перебора (перебор найдёт место, если оно есть)
+        :param clearance: Отступ вокруг объекта (по умолчанию - PLACEMENT_CLEARANCE)
+        :return: Позиция или None, если свободного места не осталось
+        """
+        position = self.placement.find_position(self.rng, size, x_range, y_range, attempts, clearance)
+        if position is None and required:
+            position = self.rng.randint(*x_range), self.rng.randint(*y_range)
+            self.placement.add(pygame.Rect(position, size), clearance)
+        return position
+
+    def get_saw_position(self, x_range: Tuple[int, int], y: int, move_range: int) -> Optional[Position]:
+        """Позиция пилы на высоте y: занимается вся полоса, которую пила проходит вверх-вниз"""
+        position = self.get_valid_position((50, 50 + 2 * move_range), x_range, (y - move_range, y - move_range))
+        if position is None:
+            return None
+        return position[0], y
+
+    @property
+    def bounds(self) -> Tuple[int, int]:
+        """Границы уровня по X (left, right) для физики и камеры"""
+        return 0, self.width
+
+    def set_view(self, view: pygame.Rect):
+        """
+        Сообщает уровню видимую область после шага камеры.
+
+        Вокруг неё - область активности: объекты дальше не обновляются, а при
+        возвращении догоняют пропущенные шаги (GameObject.advance). Объекты, попавшие
+        в область сейчас (например, после телепорта героя), догоняют сразу, до отрисовки.
+        """
+        self.activity_area = view.inflate(ACTIVITY_MARGIN * 2, ACTIVITY_MARGIN * 2)
+        self.entities.catch_up(self.tick, *self.get_activity_range(), self.buckets.update)
+
+    def get_respawn_position(self, start_pos: Position) -> Position:
+        """Куда вернуть героя после потери жизни (обычно - к стартовому порталу)"""
+        return start_pos
+
+    def get_static_objects(self) -> List[GameObject]:
+        """Неподвижные объекты уровня (платформы вместе с люками, стены, шипы)"""
+        return self.platforms + [obstacle for obstacle in self.obstacles if obstacle.is_static]
+
+    def invalidate_static_layer(self):
+        """Пересобирает список статических объектов и сбрасывает чанки статического слоя"""
+        self.static_layer.set_objects(self.get_static_objects())
+
+    def rebuild_occupancy(self):
+        """Растрирует неподвижные опоры (платформы с люками, стены, балки) в сетку занятости"""
+        left, right = self.bounds
+        solids = [solid for solid in self.get_view("solids") if solid.is_static]
+        self.occupancy = OccupancyGrid(solids, pygame.Rect(left, 0, right - left, self.height), OCCUPANCY_TILE_SIZE)
+
+    def add_hole(self, platform: Platform, hole: Hole):
+        """Добавляет люк в платформу после генерации уровня"""
+        platform.holes.append(hole)
+        if isinstance(hole, HoleWithLift):
+            self.obstacles.append(hole.lift)
+            self.index_object(hole.lift)
+        self.invalidate_static_layer()
+        self.rebuild_occupancy()
+
+    def add_obstacle(self, obstacle: Obstacle):
+        """Добавляет препятствие (например, стену) после генерации уровня"""
+        self.obstacles.append(obstacle)
+        self.index_object(obstacle)
+        if obstacle.is_static:
+            self.invalidate_static_layer()
+            self.rebuild_occupancy()
+
+    def index_object(self, obj: GameObject):
+        """Регистрирует объект в корзине его типа (и в хранилище сущностей, если его обновляют системы)"""
+        self.index_objects((obj,))
+
+    def index_objects(self, objects: List[GameObject]):
+        """Регистрирует пачку объектов (сущности попадают в хранилище одной пачкой)"""
+        for obj in objects:
+            self.buckets.insert(obj)
+        self.entities.add_many([obj for obj in objects if obj.components], self.tick)
+
+    def unindex_object(self, obj: GameObject):
+        self.buckets.remove(obj)
+        self.entities.remove(obj)
+
+    def query(self, rect: pygame.Rect, *buckets: str) -> List[GameObject]:
+        """
+        Объекты уровня рядом с прямоугольником (кандидаты для проверки коллизий).
+
+        :param rect: Область поиска в координатах уровня
+        :param buckets: Корзины объектов ("solids", "lifts", "hazards", "collectibles", "triggers"; без них - все)
+        :return: Объекты из ячеек сетки, которые пересекает область, в порядке регистрации
+        """
+        return self.buckets.query(rect, buckets or None)
+
+    def query_supports(self, rect: pygame.Rect, solids: Optional[List[GameObject]] = None) -> List[GameObject]:
+        """
+        Опоры рядом с прямоугольником: неподвижные - из сетки занятости, лифты - из своей корзины.
 
-        # Если не нашли идеальную позицию, возвращаем случайную с большими отступами
-        return (random.randint(100, self.width - width - 100),
-                random.randint(100, self.height - height - 100))
+        :param solids: Уже найденные неподвижные опоры для этого прямоугольника (occupancy.query)
+        :return: Кандидаты для точной проверки в порядке регистрации
+        """
+        if solids is None:
+            solids = self.occupancy.query(rect)
+        lifts = self.buckets.query(rect, ("lifts",))
+        if not lifts:
+            return solids
+        if not solids:
+            return lifts
+        return sorted(solids + lifts, key=self.buckets.order.__getitem__)
+
+    def get_view(self, *buckets: str) -> List[GameObject]:
+        """Все объекты корзин одним списком (кэшируется до добавления или удаления объекта; изменять нельзя)"""
+        return self.buckets.view(buckets or None)
 
     def remove_start_portal(self):
         """Устанавливает таймер удаления стартового портала через 3 секунды"""
@@ -709,6 +1129,7 @@ class Level(ABC):
 
                     # Удаляем портал из списка
                     self.portals.pop(i)
+                    self.unindex_object(portal)
                     self.start_portal_removed = True
                     Logger().info("Стартовый портал успешно удалён!")
                     return  # Выходим после удаления
@@ -716,18 +1137,13 @@ class Level(ABC):
             Logger().warning("Стартовый портал не найден!")
 
     def update(self):
-        """Обновление состояния активных объектов"""
-        for obstacle in self.obstacles:
-            if obstacle.is_active:
-                obstacle.update()
-
-        for bonus in self.bonuses:
-            if bonus.is_active:
-                bonus.update()
-
-        for artifact in self.artifacts:
-            if artifact.is_active:
-                artifact.update()
+        """Обновление состояния активных объектов в области активности"""
+        self.tick += 1
+        left, right = self.get_activity_range()
+        # Сущности, которые были вне области активности, догоняют пропущенные шаги
+        self.entities.catch_up(self.tick - 1, left, right, self.buckets.update)
+        # Пилы и лифты меняют ячейки сетки коллизий
+        self.entities.run(self.tick, left, right, self.buckets.update)
 
         for portal in self.portals:
             portal.update()
@@ -737,57 +1153,82 @@ class Level(ABC):
                 for i, portal in enumerate(self.portals[:]):
                     if not portal.is_exit:
                         self.portals.pop(i)
+                        self.unindex_object(portal)
                         self.start_portal_removed = True
                         Logger().info("Стартовый портал удален по таймеру")
                         break
 
-    def draw(self, surface: pygame.Surface):
-        """Отрисовка уровня"""
-        # Фон
-        surface.blit(background_sprite, (0, 0))
-        Logger().debug(f"Фон: {background_sprite.get_size()} at (0, 0)")
-
-        # Отрисовка объектов
-        for platform in self.platforms:
-            platform.draw(surface)
+    def draw(self, surface: pygame.Surface, camera: Camera, display=None, alpha: float = 1.0):
+        """
+        Отрисовка видимой части уровня прямо на экран.
 
+        :param surface: Поверхность экрана
+        :param camera: Камера, задающая смещение и видимую область
+        :param display: DisplayUpdater, которому сообщаются области динамических объектов
+        :param alpha: Коэффициент интерполяции движущихся объектов между шагами симуляции
+        """
+        offset = camera.offset
+        view = camera.view_rect
+        # Область отсечения с запасом для объектов, выходящих за свой rect
+        cull_rect = view.inflate(DRAW_MARGIN * 2, DRAW_MARGIN * 2)
+
+        # Фон и неподвижная геометрия - blit 3-4 чанков, пересекающих видимую область
+        self.static_layer.draw(surface, camera)
+        Logger().debug("Статический слой: %s", view.topleft)
+
+        # Отрисовка динамических объектов, пересекающих видимую область
+        for obj in self.get_visible_dynamic_objects(cull_rect):
+            obj_offset = obj.get_interpolated_offset(offset, alpha)
+            obj.draw(surface, obj_offset)
+            if display is not None:
+                display.track(obj, obj.get_draw_rect(obj_offset), obj.get_draw_state())
+
+    def get_activity_range(self) -> Tuple[Optional[int], Optional[int]]:
+        """Полоса области активности по X (None, None - весь уровень)"""
+        if self.activity_area is None:
+            return None, None
+        return self.activity_area.left, self.activity_area.right
+
+    def get_visible_dynamic_objects(self, cull_rect: pygame.Rect):
+        """Активные нестатические объекты, пересекающие область (в порядке отрисовки)"""
         for obstacle in self.obstacles:
-            if obstacle.is_active:
-                obstacle.draw(surface)
-
-        for bonus in self.bonuses:
-            if bonus.is_active:
-                bonus.draw(surface)
+            if obstacle.is_active and not obstacle.is_static and cull_rect.colliderect(obstacle.rect):
+                yield obstacle
 
-        for artifact in self.artifacts:
-            if artifact.is_active:
-                artifact.draw(surface)
+        # Монеты и артефакты - только из ячеек видимой области, сколько бы их ни было на уровне
+        for collectible in self.query(cull_rect, "collectibles"):
+            if collectible.is_active and cull_rect.colliderect(collectible.rect):
+                yield collectible
 
         for portal in self.portals:
-            portal.draw(surface)
+            if cull_rect.colliderect(portal.rect):
+                yield portal
 
     def check_finish(self, player_rect: pygame.Rect) -> bool:
         """Проверка достижения финиша"""
-        finish_portal = next((p for p in self.portals if p.is_exit and p.visible), None)
+        finish_portal = next((p for p in self.get_view("triggers") if p.is_exit and p.visible), None)
         if finish_portal:
             return player_rect.colliderect(finish_portal.rect)
         return False
 
     def collect_bonuses(self, player_rect: pygame.Rect) -> int:
-        """Сбор бонусов игроком"""
+        """Сбор бонусов игроком (проверяются только бонусы рядом с ним)"""
         collected_points = 0
-        for bonus in self.bonuses[:]:  # Используем копию списка для безопасного удаления
-            if bonus.is_active and bonus.check_collision(player_rect):
+        for bonus in self.query(player_rect, "collectibles"):
+            if bonus.object_type is ObjectType.COIN and bonus.is_active and bonus.check_collision(player_rect):
                 collected_points += bonus.collect()
-                self.bonuses.remove(bonus)  # Удаляем собранный бонус
+                self.bonuses.remove(bonus)  # Удаляем собранный бонус за O(1)
+                self.unindex_object(bonus)
         return collected_points
 
     def collect_artifacts(self, player_rect: pygame.Rect) -> bool:
         """Сбор артефактов игроком"""
         collected = False
-        for artifact in self.artifacts:
-            if artifact.is_active and artifact.check_collision(player_rect):
+        for artifact in self.query(player_rect, "collectibles"):
+            if (artifact.object_type is ObjectType.ARTIFACT and artifact.is_active
+                    and artifact.check_collision(player_rect)):
                 artifact.collect()
+                self.unindex_object(artifact)
                 self.artifacts_collected += 1
                 collected = True
 
@@ -803,18 +1244,16 @@ class Level(ABC):
 
     def check_hazard_collision(self, player_rect: pygame.Rect) -> bool:
         """Проверка опасных столкновений (шипы, пилы)"""
-        for obstacle in self.obstacles:
-            if isinstance(obstacle, (Spike, CircularSaw)) and obstacle.check_collision(player_rect):
+        for obstacle in self.query(player_rect, "hazards"):
+            if obstacle.check_collision(player_rect):
                 return True
         return False
 
     def check_fall_into_pit(self, player_rect: pygame.Rect) -> bool:
-        """Альтернативная проверка с учетом центра игрока"""
-        for platform in self.platforms:
-            for hole in platform.holes:
-                # Проверяем, что центр игрока внутри люка
-                if hole.rect.collidepoint(player_rect.center):
-                    return False
+        """Альтернативная проверка с учетом центра игрока (люк под центром ищется по сетке занятости)"""
+        # Проверяем, что центр игрока внутри люка
+        if self.occupancy.point_in_hole(player_rect.center):
+            return False
 
 
     def check_player_fell(self, player_rect: pygame.Rect) -> bool:
@@ -827,43 +1266,19 @@ class Level(ABC):
 
     def get_all_game_objects(self) -> List[GameObject]:
         """
-        Возвращает все игровые объекты в виде одного списка.
+        Возвращает все игровые объекты уровня в виде одного списка.
 
-        :return: Список, содержащий все игровые объекты.
+        :return: Общий список всех корзин (собирается заново только после добавления или удаления объекта)
         """
-        # Объединяем все списки в один
-        all_objects = (
-                self.platforms +
-                self.obstacles +
-                self.bonuses +
-                self.artifacts +
-                self.portals
-        )
-        return all_objects
+        return self.get_view()
 
 
 class Level1(Level):
     """Первый уровень игры"""
 
-    def __init__(self, level_num: int = 1):
-        super().__init__(level_num)
+    def __init__(self, level_num: int = 1, seed: Optional[int] = None, snapshot: Optional[dict] = None):
+        super().__init__(level_num, seed, snapshot)
         self.exit_checked = False
-        self.used_x_positions = []  # Для хранения занятых позиций по X
-
-    def get_valid_x_position(self, width: int, min_distance: int = 300) -> int:  # Увеличено с 50 до 300
-        """Генерирует X-позицию с минимальным расстоянием от других объектов"""
-        max_attempts = 20
-        for _ in range(max_attempts):
-            x = random.randint(50, self.width - width - 50)
-
-            if all(abs(x - used_x) >= min_distance for used_x in self.used_x_positions):
-                self.used_x_positions.append(x)
-                return x
-
-        return random.randint(500, self.width - width - 500)
-
-        # Если не удалось найти позицию, возвращаем случайную
-        return random.randint(500, self.width - width - 500)
 
     def generate_level(self):
         """Генерация уровня с правильным размещением объектов"""
@@ -871,8 +1286,7 @@ class Level1(Level):
         self.height = SCREEN_HEIGHT
         self.artifacts_required = 1
         self.exit_checked = False
-        self.used_x_positions = []
-        self.used_positions = []
+        self.placement.clear()
         MIN_DISTANCE = 1000
 
         # Основные платформы
@@ -895,12 +1309,12 @@ class Level1(Level):
             upper: []
         }
         # Портал входа
-        start_zone = random.choice(zones)
+        start_zone = self.rng.choice(zones)
         zones.remove(start_zone)
-        start_x = random.randint(start_zone[0] + 100, start_zone[0] + 100)
+        start_x = self.rng.randint(start_zone[0] + 100, start_zone[0] + 100)
         start_portal = Portal((start_x, lower.rect.top - 100), False)
         portal_zone_width = 200  # Ширина защищенной зоны вокруг портала
-        self.used_positions.append((
+        self.placement.add(pygame.Rect(
             start_x - portal_zone_width // 2,
             lower.rect.top - 100 - portal_zone_width // 2,
             portal_zone_width,
@@ -915,13 +1329,20 @@ class Level1(Level):
             MIN_DISTANCE * 2
         )
 
+        # Портал выхода в другой зоне (до препятствий - он обязателен)
+        exit_zone = self.rng.choice([z for z in zones if z != start_zone])
+        finish_y = upper.rect.top - 100
+        finish_portal = Portal(self.get_valid_position(
+            (50, 100), (exit_zone[0] + 100, exit_zone[0] + 300), (finish_y, finish_y), required=True), True)
+        finish_portal.visible = False
+
         # Генерация HoleWithLift для среднего и верхнего уровня (по одному в разных зонах)
         for platform in [middle, upper]:
             available_zones = [z for z in zones if z not in used_zones[platform]]
             if available_zones:
                 for _ in range(2):
-                    zone = random.choice(available_zones)
-                    x = random.randint(zone[0] + 150, zone[1] - 270)  # 270 = 120 (ширина) + 150 (отступ)
+                    zone = self.rng.choice(available_zones)
+                    x = self.rng.randint(zone[0] + 150, zone[1] - 270)  # 270 = 120 (ширина) + 150 (отступ)
                     hole = HoleWithLift(
                         platform=platform,
                         width=120,
@@ -929,6 +1350,7 @@ class Level1(Level):
                         lift_height=40
                     )
                 platform.holes.append(hole)
+                self.placement.add(hole.rect)  # Над люком ничего не ставим
                 self.obstacles.append(hole.lift)
                 used_zones[platform].append(zone)
 
@@ -944,15 +1366,16 @@ class Level1(Level):
         available_zones = [z for z in zones if z not in used_zones[lower]]
         if len(available_zones) >= 2:
             for _ in range(2):
-                zone = random.choice(available_zones)
+                zone = self.rng.choice(available_zones)
                 available_zones.remove(zone)
-                x = random.randint(zone[0] + 150, zone[1] - 270)
+                x = self.rng.randint(zone[0] + 150, zone[1] - 270)
                 hole = Hole(
                     platform=lower,
                     width=120,
                     position_x=x,
                 )
                 lower.holes.append(hole)
+                self.placement.add(hole.rect)
 
             # Добавляем защитную зону вокруг портала
             portal_protected_zone = (
@@ -966,36 +1389,39 @@ class Level1(Level):
         platform_zones = zones.copy()
         for _ in range(2):
             if platform_zones:
-                zone = random.choice(platform_zones)
+                zone = self.rng.choice(platform_zones)
                 platform_zones.remove(zone)
-                x = random.randint(zone[0] + 100, zone[1] - 200)
-                height = random.randint(100, 200)
-                self.obstacles.append(
-                    StaticHorizontalPlatform((x, middle.rect.y - height), 200)                    )
+                position = self.get_valid_position((200, 20), (zone[0] + 100, zone[1] - 200),
+                                                   (middle.rect.y - 200, middle.rect.y - 100))
+                if position is not None:
+                    self.obstacles.append(StaticHorizontalPlatform(position, 200))
 
         # Генерация вертикальных стен (в разных зонах)
         wall_zones = zones.copy()
         for _ in range(1):
             if wall_zones:
-                zone = random.choice(wall_zones)
+                zone = self.rng.choice(wall_zones)
                 wall_zones.remove(zone)
-                x = random.randint(zone[0] + 50, zone[1] - 50)
-                height = random.randint(100, 200)
-                self.obstacles.append(
-                    StaticVerticalPlatform((x, middle.rect.y - height), height)
-                )
+                height = self.rng.randint(100, 200)
+                y = middle.rect.y - height
+                position = self.get_valid_position((30, 100), (zone[0] + 50, zone[1] - 50), (y, y))
+                if position is not None:
+                    self.obstacles.append(StaticVerticalPlatform(position, height))
 
         # Генерация шипов на платформах (по одному в разных зонах)
         for platform in [lower, middle, upper]:
             available_zones = [z for z in zones if z not in used_zones[platform]]
             if len(available_zones) >= 2:
                 for _ in range(2):
-                    zone = random.choice(available_zones)
+                    zone = self.rng.choice(available_zones)
                     available_zones.remove(zone)
-                    x = random.randint(zone[0] + 50, zone[1] - 50)
+                    y = platform.rect.y - 50
+                    position = self.get_valid_position((48, 48), (zone[0] + 50, zone[1] - 50), (y, y))
+                    if position is None:
+                        continue  # В зоне нет места - без этих шипов
                     # Генерация с увеличенным размером (1.5x)
                     self.obstacles.append(Spike(
-                        (x, platform.rect.y - 50),  # Позиция
+                        position,  # Позиция
                         True,  # На полу
                         scale=1.5  # Масштаб
                     ))
@@ -1004,107 +1430,124 @@ class Level1(Level):
         saw_zones = zones.copy()
         for _ in range(3):
             if saw_zones:
-                zone = random.choice(saw_zones)
+                zone = self.rng.choice(saw_zones)
                 saw_zones.remove(zone)
-                x = random.randint(zone[0] + 100, zone[1] - 100)
-                y = random.choice([middle.rect.y - 150, upper.rect.y - 200])
-                move_range = random.randint(80, 150)
-                self.obstacles.append(CircularSaw((x, y), move_range))
+                y = self.rng.choice([middle.rect.y - 150, upper.rect.y - 200])
+                move_range = self.rng.randint(80, 150)
+                position = self.get_saw_position((zone[0] + 100, zone[1] - 100), y, move_range)
+                if position is not None:
+                    self.obstacles.append(CircularSaw(position, move_range))
 
 
 
 
 
-        # Генерация бонусов (монет) с равномерным распределением
-        for platform in self.platforms:
-            coins_per_platform = 30
-            step = (self.width - 200) // coins_per_platform
-
-            for i in range(coins_per_platform):
-                x = 100 + i * step + random.randint(-30, 30)
-                y = platform.rect.y - random.randint(50, 150)
-                self.bonuses.append(Coin((x, y)))
-
-        # Генерация артефакта в свободной зоне
-        artifact_zone = random.choice(zones)
-        artifact_x = random.randint(artifact_zone[0] + 100, artifact_zone[1] - 100)
-        self.artifacts.append(Artifact((
-            artifact_x,
-            middle.rect.y - 50
-        )))
-
-        # Портал входа и выхода в разных зонах
-
-        exit_zone = random.choice([z for z in zones if z != start_zone])
-        finish_x = random.randint(exit_zone[0] + 100, exit_zone[0] + 300)
-        finish_portal = Portal((finish_x, upper.rect.top - 100), True)
-        finish_portal.visible = False
+        # Генерация артефакта в свободной зоне (обязателен - ставится и без свободного места)
+        artifact_zone = self.rng.choice(zones)
+        artifact_y = middle.rect.y - 50
+        self.artifacts.append(Artifact(self.get_valid_position(
+            (40, 40), (artifact_zone[0] + 100, artifact_zone[1] - 100), (artifact_y, artifact_y), required=True)))
 
         self.portals.extend([start_portal, finish_portal])
+        self.place_extra_objects()
+        self.place_coins()
+
+    def place_extra_objects(self):
+        """Дополнительные артефакты и пилы следующих уровней (расставляются до монет, чтобы им хватило места)"""
+        pass
+
+    def place_coins(self):
+        """
+        Монеты с равномерным распределением - в последнюю очередь, в место между остальными объектами.
+
+        Над каждой платформой ставятся все COINS_PER_PLATFORM монет: монета, которой не нашлось
+        места в её окне, сдвигается к ближайшему свободному месту над платформой, а если
+        нет и его - ставится в своё окно, как до сетки расстановки.
+        """
+        coin_size = Coin.get_hitbox_size()
+        step = (self.width - 200) // COINS_PER_PLATFORM
+        for platform in self.platforms:
+            y_range = (platform.rect.y - 150, platform.rect.y - 50)
+            for i in range(COINS_PER_PLATFORM):
+                x = 100 + i * step
+                position = self.get_valid_position(coin_size, (x - 30, x + 30), y_range, clearance=COIN_CLEARANCE)
+                if position is None:  # Окно занято шипами, пилой или порталом - сдвигаем монету
+                    position = self.placement.find_nearest(coin_size, x, (0, self.width - coin_size[0]), y_range,
+                                                           COIN_CLEARANCE)
+                if position is None:
+                    position = self.get_valid_position(coin_size, (x - 30, x + 30), y_range, required=True,
+                                                       attempts=0, clearance=COIN_CLEARANCE)
+                self.bonuses.append(Coin(position))
 
 
 class Level2(Level1):
     """Второй уровень игры (требуется 2 артефакта)"""
 
-    def __init__(self, level_num: int = 2):
-        super().__init__(level_num)
+    def __init__(self, level_num: int = 2, seed: Optional[int] = None, snapshot: Optional[dict] = None):
+        super().__init__(level_num, seed, snapshot)
 
     def generate_level(self):
         super().generate_level()
         self.artifacts_required = 2  # Явно указываем необходимое количество
 
-        # Добавляем второй артефакт
-        artifact_x = self.get_valid_x_position(40)
-        self.artifacts.append(Artifact((
-            artifact_x,
-            self.platforms[1].rect.y - 150  # Размещаем на другой высоте
-        )))
-        # Добавляем дополнительные пилы
-        for _ in range(1):
-            x = self.get_valid_x_position(50)
-            y = random.choice([self.platforms[0].rect.y - 180, self.platforms[2].rect.y - 250])
-            self.obstacles.append(CircularSaw((x, y), random.randint(100, 180)))
-
         # Увеличиваем скорость лифтов
         for obstacle in self.obstacles:
             if isinstance(obstacle, MovingPlatformVertical):
                 obstacle.speed = 3
 
+    def place_extra_objects(self):
+        super().place_extra_objects()
+        # Добавляем второй артефакт
+        artifact_y = self.platforms[1].rect.y - 150  # Размещаем на другой высоте
+        self.artifacts.append(Artifact(self.get_valid_position(
+            (40, 40), (50, self.width - 90), (artifact_y, artifact_y), required=True)))
+        # Добавляем дополнительные пилы
+        for _ in range(1):
+            y = self.rng.choice([self.platforms[0].rect.y - 180, self.platforms[2].rect.y - 250])
+            move_range = self.rng.randint(100, 180)
+            position = self.get_saw_position((50, self.width - 100), y, move_range)
+            if position is None:
+                break  # Места не осталось - без лишней пилы
+            self.obstacles.append(CircularSaw(position, move_range))
+
 
 class Level3(Level2):
     """Третий уровень игры (требуется 3 артефакта)"""
 
-    def __init__(self, level_num: int = 3):
-        super().__init__(level_num)
+    def __init__(self, level_num: int = 3, seed: Optional[int] = None, snapshot: Optional[dict] = None):
+        super().__init__(level_num, seed, snapshot)
 
     def generate_level(self):
         super().generate_level()
         self.artifacts_required = 3
 
-        # Добавляем третий артефакт
-        artifact_x = self.get_valid_x_position(40)
-        self.artifacts.append(Artifact((
-            artifact_x,
-            self.platforms[0].rect.y - 100  # Размещаем на нижнем уровне
-        )))
-
-        # Еще больше пил с увеличенным диапазоном движения
-        for _ in range(1):
-            x = self.get_valid_x_position(50)
-            y = random.choice([p.rect.y - random.randint(150, 300) for p in self.platforms])
-            self.obstacles.append(CircularSaw((x, y), random.randint(150, 250)))
-
         # Максимальная скорость лифтов
         for obstacle in self.obstacles:
             if isinstance(obstacle, MovingPlatformVertical):
                 obstacle.speed = 4
 
+    def place_extra_objects(self):
+        super().place_extra_objects()
+        # Добавляем третий артефакт
+        artifact_y = self.platforms[0].rect.y - 100  # Размещаем на нижнем уровне
+        self.artifacts.append(Artifact(self.get_valid_position(
+            (40, 40), (50, self.width - 90), (artifact_y, artifact_y), required=True)))
+
+        # Еще больше пил с увеличенным диапазоном движения
+        for _ in range(1):
+            y = self.rng.choice([p.rect.y - self.rng.randint(150, 300) for p in self.platforms])
+            move_range = self.rng.randint(150, 250)
+            position = self.get_saw_position((50, self.width - 100), y, move_range)
+            if position is None:
+                break
+            self.obstacles.append(CircularSaw(position, move_range))
+
 
 class DebugLevel(Level):
     """Отладочный уровень для тестирования"""
 
-    def __init__(self, level_num: int = 0):
-        super().__init__(level_num)
+    def __init__(self, level_num: int = 0, seed: Optional[int] = None, snapshot: Optional[dict] = None):
+        super().__init__(level_num, seed, snapshot)
 
     def generate_level(self):
         """Генерация отладочного уровня"""
@@ -1143,54 +1586,365 @@ class DebugLevel(Level):
         self.portals.append(Portal((120, SCREEN_HEIGHT - 175), False))
 
 
+
+class LevelChunk:
+    """Участок бесконечного уровня: его объекты строятся и убираются вместе"""
+
+    def __init__(self, index: int):
+        """
+        :param index: Порядковый номер участка (0 - стартовый)
+        """
+        self.index = index
+        self.left = index * ENDLESS_CHUNK_WIDTH  # Левая граница участка
+        self.right = self.left + ENDLESS_CHUNK_WIDTH  # Правая граница участка
+        self.platforms: List[Platform] = []
+        self.obstacles: List[Obstacle] = []
+        self.bonuses: List[Bonus] = []
+        self.artifacts: List[Artifact] = []
+        self.portals: List[Portal] = []
+
+    def get_static_objects(self) -> List[GameObject]:
+        """Неподвижные объекты участка (для статического слоя)"""
+        return self.platforms + [obstacle for obstacle in self.obstacles if obstacle.is_static]
+
+    def get_all_game_objects(self) -> List[GameObject]:
+        return self.platforms + self.obstacles + self.bonuses + self.artifacts + self.portals
+
+
+class EndlessLevel(Level):
+    """
+    Бесконечный забег: уровень строится участками фиксированной ширины впереди камеры.
+
+    Участки далеко позади камеры убираются, а их объекты возвращаются в пулы,
+    поэтому память и работа за кадр не зависят от пройденного пути. Границы
+    уровня (bounds) двигаются вместе с окном живых участков. Финиша нет -
+    игра идёт до потери всех жизней, артефакты дают только очки.
+    """
+
+    cacheable = False  # Раскладка достраивается по ходу игры - снимком не сохраняется
+
+    def __init__(self, level_num: int = ENDLESS_LEVEL, seed: Optional[int] = None, snapshot: Optional[dict] = None):
+        # Пулы объектов, которых в участках больше всего
+        self.platform_pool = ObjectPool(lambda position: Platform(position, ENDLESS_CHUNK_WIDTH))
+        self.coin_pool = ObjectPool(Coin)
+        self.spike_pool = ObjectPool(Spike)
+        self.saw_pool = ObjectPool(CircularSaw)
+        self.chunks: Deque[LevelChunk] = deque()  # Живые участки слева направо
+        self.distance = 0  # Самая дальняя точка, до которой дошла камера (по центру)
+        super().__init__(level_num, seed, snapshot)
+
+    def generate_level(self):
+        """Стартовые участки: видимая область и запас впереди"""
+        self.height = SCREEN_HEIGHT
+        self.artifacts_required = 0
+        while not self.chunks or self.chunks[-1].right < SCREEN_WIDTH + ENDLESS_LOOKAHEAD:
+            self.spawn_chunk()
+
+    def to_snapshot(self) -> dict:
+        raise ValueError("Бесконечный уровень не сохраняется снимком")
+
+    def load_snapshot(self, snapshot: dict):
+        raise ValueError("Бесконечный уровень не восстанавливается из снимка")
+
+    @property
+    def bounds(self) -> Tuple[int, int]:
+        return self.chunks[0].left, self.chunks[-1].right
+
+    def set_view(self, view: pygame.Rect):
+        """Достраивает участки впереди видимой области и убирает оставшиеся далеко позади"""
+        super().set_view(view)
+        self.distance = max(self.distance, view.centerx)
+
+        changed = False
+        while self.chunks[-1].right < view.right + ENDLESS_LOOKAHEAD:
+            chunk = self.spawn_chunk()
+            self.index_objects(chunk.get_all_game_objects())
+            self.static_layer.add_objects(chunk.get_static_objects())
+            self.static_layer.width = self.width
+            changed = True
+
+        while len(self.chunks) > 1 and self.chunks[0].right <= view.left - ENDLESS_KEEP_BEHIND:
+            self.retire_chunk(self.chunks.popleft())
+            changed = True
+
+        if changed:
+            self.rebuild_occupancy()  # Сетка покрывает только живые участки
+
+    def get_respawn_position(self, start_pos: Position) -> Position:
+        """Начало самого левого живого участка (стартовый портал к этому времени может быть уже убран)"""
+        first = self.chunks[0]
+        if first.index == 0:
+            return start_pos
+        return first.left + 130, first.platforms[0].rect.top - 150
+
+    def spawn_chunk(self) -> LevelChunk:
+        """Строит следующий участок и добавляет его объекты в списки уровня"""
+        chunk = LevelChunk(self.chunks[-1].index + 1 if self.chunks else 0)
+        self.generate_chunk(chunk)
+        self.chunks.append(chunk)
+
+        self.platforms.extend(chunk.platforms)
+        self.obstacles.extend(chunk.obstacles)
+        self.bonuses.extend(chunk.bonuses)
+        self.artifacts.extend(chunk.artifacts)
+        self.portals.extend(chunk.portals)
+        self.width = chunk.right
+        return chunk
+
+    def retire_chunk(self, chunk: LevelChunk):
+        """Убирает участок из уровня и возвращает его объекты в пулы"""
+        retired = set(chunk.get_all_game_objects())
+        for obj in retired:
+            self.unindex_object(obj)
+        self.static_layer.remove_objects(chunk.get_static_objects())
+
+        self.platforms = [obj for obj in self.platforms if obj not in retired]
+        self.obstacles = [obj for obj in self.obstacles if obj not in retired]
+        for bonus in chunk.bonuses:
+            self.bonuses.discard(bonus)  # Собранные монеты участка уже удалены
+        self.artifacts = [obj for obj in self.artifacts if obj not in retired]
+        self.portals = [obj for obj in self.portals if obj not in retired]
+
+        for platform in chunk.platforms:
+            self.platform_pool.release(platform)
+        for bonus in chunk.bonuses:
+            self.coin_pool.release(bonus)
+        for obstacle in chunk.obstacles:
+            if isinstance(obstacle, Spike):
+                self.spike_pool.release(obstacle)
+            elif isinstance(obstacle, CircularSaw):
+                self.saw_pool.release(obstacle)
+
+    def generate_chunk(self, chunk: LevelChunk):
+        """Раскладка участка: три платформы, препятствия (сложнее с каждым участком) и монеты"""
+        rng = self.rng
+        lower, middle, upper = [self.platform_pool.acquire((chunk.left, y)) for y in
+                                (SCREEN_HEIGHT - 150, SCREEN_HEIGHT - 450, SCREEN_HEIGHT - 750)]
+        chunk.platforms.extend((lower, middle, upper))
+
+        if chunk.index == 0:
+            # Стартовый участок без препятствий
+            chunk.portals.append(Portal((chunk.left + 100, lower.rect.top - 100), False))
+        else:
+            self.generate_hazards(chunk, min(1.0, chunk.index / 20))
+
+        # Монеты над каждой платформой
+        coins_per_platform = 8
+        step = (ENDLESS_CHUNK_WIDTH - 160) // coins_per_platform
+        for platform in chunk.platforms:
+            for i in range(coins_per_platform):
+                x = chunk.left + 80 + i * step + rng.randint(-30, 30)
+                y = platform.rect.y - rng.randint(50, 150)
+                chunk.bonuses.append(self.coin_pool.acquire((x, y)))
+
+    def generate_hazards(self, chunk: LevelChunk, difficulty: float):
+        """
+        Ямы, лифты, шипы и пилы участка (начало участка остаётся свободным - там появляется герой).
+
+        Все препятствия и артефакт занимают X на своей платформе (SpacingLine) не ближе
+        ENDLESS_HAZARD_SPACING друг к другу; балка и пила относятся к платформе, над которой висят.
+        Препятствие, которому не хватило места, пропускается; артефакт ставится раньше них и всегда.
+
+        :param difficulty: Сложность от 0.0 до 1.0 - растёт с номером участка
+        """
+        rng = self.rng
+        lower, middle, upper = chunk.platforms
+        x_range = (chunk.left + ENDLESS_SAFE_ZONE, chunk.right - 200)
+        spacing = {platform: SpacingLine() for platform in chunk.platforms}  # Занятые X на каждой платформе
+
+        # Яма в нижней платформе
+        if rng.random() < 0.3 + 0.4 * difficulty:
+            x = spacing[lower].find_position(rng, x_range, ENDLESS_HAZARD_SPACING)
+            if x is not None:
+                lower.holes.append(Hole(lower, 120, x - chunk.left))
+
+        # Люки с лифтами в средней и верхней платформах
+        for platform in (middle, upper):
+            if rng.random() < 0.5:
+                x = spacing[platform].find_position(rng, x_range, ENDLESS_HAZARD_SPACING)
+                if x is None:
+                    continue
+                hole = HoleWithLift(platform, 120, x - chunk.left, 40)
+                hole.lift.speed = 2 + round(2 * difficulty)
+                platform.holes.append(hole)
+                chunk.obstacles.append(hole.lift)
+
+        # Артефакт на каждом пятом участке - до остальных препятствий, чтобы ему хватило места
+        if chunk.index % 5 == 0:
+            artifact_range = (x_range[0], chunk.right - 100)
+            x = spacing[middle].find_position(rng, artifact_range, ENDLESS_HAZARD_SPACING)
+            if x is None:
+                x = rng.randint(*artifact_range)
+            chunk.artifacts.append(Artifact((x, middle.rect.y - 50)))
+
+        # Шипы на платформах
+        for _ in range(1 + round(2 * difficulty)):
+            platform = rng.choice(chunk.platforms)
+            x = spacing[platform].find_position(rng, x_range, ENDLESS_HAZARD_SPACING)
+            if x is not None:
+                chunk.obstacles.append(self.spike_pool.acquire((x, platform.rect.y - 50)))
+
+        # Балка над средней платформой
+        if rng.random() < 0.3:
+            x = spacing[middle].find_position(rng, x_range, ENDLESS_HAZARD_SPACING)
+            if x is not None:
+                chunk.obstacles.append(StaticHorizontalPlatform((x, middle.rect.y - rng.randint(100, 200)), 200))
+
+        # Дисковая пила над средней или верхней платформой
+        if rng.random() < 0.2 + 0.5 * difficulty:
+            platform, y = rng.choice([(middle, middle.rect.y - 150), (upper, upper.rect.y - 200)])
+            x = spacing[platform].find_position(rng, (x_range[0], chunk.right - 100), ENDLESS_HAZARD_SPACING)
+            if x is not None:
+                chunk.obstacles.append(self.saw_pool.acquire((x, y), rng.randint(80, 150)))
+
+
 class LevelManager:
     # Классы уровней (теперь это атрибут класса)
     level_classes = {
         1: Level1,
         2: Level2,
         3: Level3,
-        0: DebugLevel  # Отладочный уровень
+        0: DebugLevel,  # Отладочный уровень
+        ENDLESS_LEVEL: EndlessLevel  # Бесконечный забег
     }
 
-    def __init__(self, debug_mode=False):
-        """Инициализация менеджера уровней"""
-        self.current_level_num = 0 if debug_mode else 1  # 0 - debug, 1 - первый уровень
+    # Фоновый поток, в котором заранее строится следующий уровень (общий для всех менеджеров)
+    _executor: Optional[ThreadPoolExecutor] = None
+
+    def __init__(self, debug_mode=False, seed: Optional[int] = None, prefetch: bool = True, endless: bool = False,
+                 persist_snapshots: bool = True):
+        """
+        Инициализация менеджера уровней.
+
+        :param debug_mode: Начать с отладочного уровня
+        :param seed: Зерно генерации (None - уровни каждый раз разные)
+        :param prefetch: Строить следующий уровень в фоне, пока идёт текущий
+        :param endless: Бесконечный забег вместо обычных уровней
+        :param persist_snapshots: Сохранять снимки уровней на диск (False - только в памяти процесса,
+                                  для случайного зерна, которое больше не повторится)
+        """
+        self.seed = seed
+        self.persist_snapshots = persist_snapshots
+        self.prefetch = prefetch
+        self.endless = endless
+        self.pending: Dict[int, Future] = {}  # Номер уровня -> уровень, который строится в фоне
+        self.current_level_num = self.get_start_level_num(debug_mode)
         self.total_score = 0
         self.total_artifacts = 0
         self.game_over = False
         self.current_level = self.create_level(self.current_level_num)
+        self.prefetch_next_level()
 
     def create_level(self, level_num: int) -> Level:
-        """Создает уровень по номеру"""
+        """Создает уровень по номеру (при заданном зерне - из снимка, если он уже есть)"""
         level_class = self.level_classes.get(level_num, Level1)  # По умолчанию Level1
-        return level_class(level_num)
+        if self.seed is None:
+            return level_class(level_num)
+        if not level_class.cacheable:
+            return level_class(level_num, self.get_level_seed(level_num))
+
+        level_seed = self.get_level_seed(level_num)
+        snapshot = level_snapshots.load(level_num, level_seed)
+        if snapshot is not None and snapshot["class"] == level_class.__name__:
+            return level_class(level_num, level_seed, snapshot=snapshot)
+
+        level = level_class(level_num, level_seed)
+        try:
+            level_snapshots.save(level_num, level_seed, level.to_snapshot(), self.persist_snapshots)
+        except ValueError as e:
+            Logger().warning("Снимок уровня %s не сохранён: %s", level_num, e)
+        return level
+
+    def get_level_seed(self, level_num: int) -> int:
+        """Зерно уровня: зависит только от зерна игры и номера уровня"""
+        return self.seed * 1000 + level_num
+
+    @property
+    def is_endless(self) -> bool:
+        """Идёт бесконечный забег"""
+        return self.current_level_num == ENDLESS_LEVEL
+
+    def get_start_level_num(self, debug_mode: bool) -> int:
+        """Номер первого уровня игры: 0 - debug, ENDLESS_LEVEL - бесконечный забег, 1 - первый уровень"""
+        if debug_mode:
+            return 0
+        return ENDLESS_LEVEL if self.endless else 1
+
+    def get_next_level_num(self) -> Optional[int]:
+        """Номер уровня после текущего (None - текущий последний)"""
+        if self.is_endless:
+            return None
+        level_num = 1 if self.current_level_num == 0 else self.current_level_num  # После debug - как после первого
+        return level_num + 1 if level_num < 3 else None
+
+    def prefetch_next_level(self):
+        """
+        Начинает строить следующий уровень в фоновом потоке.
+
+        Спрайты, их варианты (SPRITE_VARIANTS) и атласы поворотов загружаются и строятся
+        здесь, в главном потоке; фоновый поток генерирует раскладку и создаёт объекты
+        на готовых поверхностях. Вариант, которого нет в SPRITE_VARIANTS, фоновый поток
+        масштабирует сам - вне блокировки реестра, так что отрисовка его не ждёт.
+        """
+        level_num = self.get_next_level_num()
+        if not self.prefetch or level_num is None or level_num in self.pending:
+            return
+        preload()
+        if LevelManager._executor is None:
+            LevelManager._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="LevelBuilder")
+        self.pending[level_num] = LevelManager._executor.submit(self.create_level, level_num)
+
+    def take_level(self, level_num: int) -> Level:
+        """
+        Готовый уровень из фона или, если его там нет, построенный сейчас.
+
+        Если фоновая сборка ещё не началась, она отменяется и уровень строится синхронно;
+        если уже идёт - дожидаемся её (это быстрее, чем начинать заново).
+        """
+        future = self.pending.pop(level_num, None)
+        if future is not None and (future.done() or not future.cancel()):
+            try:
+                return future.result()
+            except Exception as e:
+                Logger().error("Фоновая сборка уровня %s не удалась: %s", level_num, e)
+        return self.create_level(level_num)
+
+    def cancel_prefetch(self):
+        """Отменяет фоновые сборки (после сброса они не нужны)"""
+        for future in self.pending.values():
+            future.cancel()
+        self.pending.clear()
 
     def set_debug_level(self):
         """Переключает на отладочный уровень, сохраняя состояние"""
+        self.cancel_prefetch()
         self.current_level_num = 0
         self.current_level = self.create_level(0)
         self.game_over = False
+        self.prefetch_next_level()
 
     def reset(self, debug_mode=False):
         """Сбрасывает менеджер уровней"""
-        self.current_level_num = 0 if debug_mode else 1
+        self.cancel_prefetch()
+        self.current_level_num = self.get_start_level_num(debug_mode)
         self.total_score = 0
         self.total_artifacts = 0
         self.game_over = False
         self.current_level = self.create_level(self.current_level_num)
+        self.prefetch_next_level()
 
     def next_level(self) -> bool:
-        """Переходит на следующий уровень"""
-        if self.current_level_num == 0:  # Если текущий уровень - debug
-            self.current_level_num = 1  # Переключаем на обычный уровень
-
-        if self.current_level_num < 3:
-            self.total_score += self.current_level.score
-            self.total_artifacts += self.current_level.artifacts_collected
-            self.current_level_num += 1
-            self.current_level = self.create_level(self.current_level_num)
-            return True
-        return False
+        """Переходит на следующий уровень (обычно уже построенный в фоне)"""
+        level_num = self.get_next_level_num()
+        if level_num is None:
+            return False
+
+        self.total_score += self.current_level.score
+        self.total_artifacts += self.current_level.artifacts_collected
+        self.current_level_num = level_num
+        self.current_level = self.take_level(level_num)
+        self.prefetch_next_level()
+        return True
 
     def update(self, player_rect=None):
         """Обновляет текущий уровень"""
@@ -1200,9 +1954,9 @@ class LevelManager:
                 if self.current_level.check_player_fell(player_rect):
                     self.game_over = True
 
-    def draw(self, surface: pygame.Surface):
+    def draw(self, surface: pygame.Surface, camera: Camera, display=None, alpha: float = 1.0):
         """Отрисовывает текущий уровень"""
-        self.current_level.draw(surface)
+        self.current_level.draw(surface, camera, display, alpha)
 
         # Отображаем режим debug
         if self.current_level_num == 0:
@@ -38,9 +38,10 @@ class MainMenu:
         self.background = load_sprite("menu_background.jpg", (20, 30, 15))
         self.buttons = [
             Button((100, 300), "Начать игру", "start"),
-            Button((100, 400), "Отладочный уровень", "debug"),
-            Button((100, 500), "Разработчики", "credits"),
-            Button((100, 600), "Выход", "quit")
+            Button((100, 400), "Бесконечный забег", "endless"),
+            Button((100, 500), "Отладочный уровень", "debug"),
+            Button((100, 600), "Разработчики", "credits"),
+            Button((100, 700), "Выход", "quit")
         ]
         self.current_button_index = 0
         self.buttons[self.current_button_index].is_active = True
@@ -0,0 +1,141 @@
+import pygame
+from array import array
+from typing import Dict, Iterable, List, Tuple
+
+Position = Tuple[int, int]  # Точка (x, y)
+
+EMPTY = -1  # В клетке нет неподвижных опор
+SHARED = -2  # В клетке несколько опор (их номера - в shared)
+
+
+class OccupancyGrid:
+    """
+    Растр неподвижной геометрии уровня (платформы, стены, балки и люки в платформах).
+
+    Строится один раз после генерации уровня (и заново, если геометрия меняется).
+    Каждая клетка хранит номер опоры, которая её занимает, поэтому поиск опор рядом
+    с прямоугольником - чтение нескольких срезов массива. Клетки лежат по столбцам:
+    область поиска у героя высокая и узкая, столбец клеток - один срез. Люки растрируются
+    отдельно: у каждой платформы с люками есть маска столбцов шириной в пиксель
+    (номер люка + 1, 0 - не люк), так что «над каким люком этот X» - одно обращение
+    к массиву. Подвижные объекты (лифты, пилы) в сетку не попадают и проверяются
+    как объекты.
+    """
+
+    def __init__(self, solids: Iterable, area: pygame.Rect, tile_size: int = 32):
+        """
+        :param solids: Неподвижные опоры в порядке регистрации на уровне (у платформ - люки в holes)
+        :param area: Область уровня, которую покрывает сетка (расширяется до всех опор)
+        :param tile_size: Размер клетки в пикселях
+        """
+        self.solids: List = list(solids)
+        self.tile_size = tile_size
+
+        area = area.unionall([solid.rect for solid in self.solids]) if self.solids else area.copy()
+        self.left = area.left
+        self.top = area.top
+        self.cols = max(1, -(-area.width // tile_size))
+        self.rows = max(1, -(-area.height // tile_size))
+        self.cells = array("h", [EMPTY]) * (self.cols * self.rows)
+        self.shared: Dict[int, List[int]] = {}  # Клетка -> номера опор (по возрастанию)
+        self.hole_masks: Dict[object, Tuple[int, array]] = {}  # Платформа -> (X начала маски, маска)
+        self.hole_cells: Dict[int, List] = {}  # Клетка -> люки, которые её задевают
+
+        for number, solid in enumerate(self.solids):
+            self._rasterize(number, solid)
+
+    def __len__(self) -> int:
+        return len(self.solids)
+
+    def query(self, rect: pygame.Rect) -> List:
+        """Опоры в клетках под прямоугольником в порядке регистрации (кандидаты для точной проверки)"""
+        found = set()
+        cells = self.cells
+        x0, y0, x1, y1 = self._cell_range(rect)
+        # Столбец клеток - срез массива, его номера собираются без цикла по клеткам
+        for column in range(x0 * self.rows, x1 * self.rows + 1, self.rows):
+            found.update(cells[column + y0:column + y1 + 1])
+        found.discard(EMPTY)
+        if SHARED in found:
+            found.discard(SHARED)
+            shared = self.shared
+            for column in range(x0 * self.rows, x1 * self.rows + 1, self.rows):
+                for cell in range(column + y0, column + y1 + 1):
+                    if cells[cell] == SHARED:
+                        found.update(shared[cell])
+        if not found:
+            return []
+        solids = self.solids
+        return [solids[number] for number in sorted(found)]
+
+    def hole_at(self, platform, x: int):
+        """
+        Люк платформы, над которым лежит столбец x (границы люка включительно), или None.
+
+        Если столбец попадает в несколько люков - первый из platform.holes.
+        """
+        entry = self.hole_masks.get(platform)
+        if entry is None:
+            return None
+        start, mask = entry
+        i = x - start
+        if 0 <= i < len(mask) and mask[i]:
+            return platform.holes[mask[i] - 1]
+        return None
+
+    def point_in_hole(self, point: Position) -> bool:
+        """Лежит ли точка внутри какого-нибудь люка"""
+        x, y = point
+        tx = (x - self.left) // self.tile_size
+        ty = (y - self.top) // self.tile_size
+        if not (0 <= tx < self.cols and 0 <= ty < self.rows):
+            return False
+        return any(hole.rect.collidepoint(x, y) for hole in self.hole_cells.get(tx * self.rows + ty, ()))
+
+    def _cell_range(self, rect: pygame.Rect) -> Tuple[int, int, int, int]:
+        """Клетки под прямоугольником (x0, y0, x1, y1), включительно и в пределах сетки"""
+        size = self.tile_size
+        return (max(0, (rect.left - self.left) // size),
+                max(0, (rect.top - self.top) // size),
+                min(self.cols - 1, (rect.right - 1 - self.left) // size),
+                min(self.rows - 1, (rect.bottom - 1 - self.top) // size))
+
+    def _rasterize(self, number: int, solid):
+        cells = self.cells
+        x0, y0, x1, y1 = self._cell_range(solid.rect)
+        width = x1 - x0 + 1
+        for row in range(y0, y1 + 1):
+            # Строка клеток опоры - срез с шагом rows; свободная строка заполняется одним присваиванием
+            strip = slice(x0 * self.rows + row, x1 * self.rows + row + 1, self.rows)
+            if cells[strip].count(EMPTY) == width:
+                cells[strip] = array("h", [number]) * width
+                continue
+            for cell in range(strip.start, strip.stop, strip.step):
+                current = cells[cell]
+                if current == EMPTY:
+                    cells[cell] = number
+                elif current == SHARED:
+                    self.shared[cell].append(number)
+                else:
+                    cells[cell] = SHARED
+                    self.shared[cell] = [current, number]
+
+        holes = getattr(solid, "holes", None)
+        if not holes:
+            return
+
+        # Маска столбцов: покрывает платформу и все её люки (правая граница люка включительно)
+        start = min(solid.rect.left, min(hole.rect.left for hole in holes))
+        end = max(solid.rect.right, max(hole.rect.right for hole in holes))
+        mask = array("H", [0]) * (end - start + 1)
+        # Первый люк списка перекрывает следующие - растрируем с конца
+        for hole_number in range(len(holes), 0, -1):
+            hole_rect = holes[hole_number - 1].rect
+            mask[hole_rect.left - start:hole_rect.right - start + 1] = array("H", [hole_number]) * (hole_rect.width + 1)
+        self.hole_masks[solid] = (start, mask)
+
+        for hole in holes:
+            hx0, hy0, hx1, hy1 = self._cell_range(hole.rect)
+            for column in range(hx0 * self.rows, hx1 * self.rows + 1, self.rows):
+                for cell in range(column + hy0, column + hy1 + 1):
+                    self.hole_cells.setdefault(cell, []).append(hole)
@@ -0,0 +1,64 @@
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+State = Tuple[int, int]  # Состояние движения (смещение, направление)
+
+
+class PeriodicTrajectory:
+    """
+    Траектория периодического движения (пила, лифт), пройденная один раз.
+
+    Из любого состояния на траектории состояние через n шагов берётся из списка
+    без пошагового моделирования - так замороженный вдали от камеры объект
+    при возвращении в область активности оказывается ровно там, где был бы.
+    """
+
+    def __init__(self, step: Callable[[State], State], start: State):
+        """
+        :param step: Один шаг движения: состояние -> следующее состояние
+        :param start: Состояние, с которого проходится траектория
+        """
+        self.states: List[State] = []
+        self.index: Dict[State, int] = {}  # Состояние -> номер шага на траектории
+        state = start
+        while state not in self.index:
+            self.index[state] = len(self.states)
+            self.states.append(state)
+            state = step(state)
+        self.cycle_start = self.index[state]  # С этого шага движение повторяется
+        self.period = len(self.states) - self.cycle_start
+
+    def advance(self, state: State, steps: int) -> Optional[State]:
+        """
+        Состояние через steps шагов.
+
+        :return: None, если состояния нет на траектории
+        """
+        i = self.index.get(state)
+        if i is None:
+            return None
+        i += steps
+        if i >= len(self.states):
+            i = self.cycle_start + (i - self.cycle_start) % self.period
+        return self.states[i]
+
+
+# Траектории по параметрам движения (скорость, размах...): одинаковые пилы и лифты делят одну траекторию
+_trajectories: Dict[Hashable, PeriodicTrajectory] = {}
+
+
+def advance_periodic(key: Hashable, step: Callable[[State], State], state: State, steps: int) -> State:
+    """
+    Состояние периодического движения через steps шагов (траектория строится один раз на key).
+
+    :param key: Параметры движения, от которых зависит step
+    :param step: Один шаг движения
+    :param state: Текущее состояние
+    :param steps: Сколько шагов пропустить
+    """
+    trajectory = _trajectories.get(key)
+    result = trajectory.advance(state, steps) if trajectory is not None else None
+    if result is None:
+        # Состояния нет на траектории (другая фаза) - проходим траекторию от него
+        trajectory = _trajectories[key] = PeriodicTrajectory(step, state)
+        result = trajectory.advance(state, steps)
+    return result
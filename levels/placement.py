@@ -0,0 +1,248 @@
+import bisect
+import random
+import pygame
+from typing import Dict, List, Optional, Tuple
+
+Position = Tuple[int, int]  # Позиция объекта (x, y)
+Size = Tuple[int, int]  # Размер объекта (ширина, высота)
+
+
+class PlacementGrid:
+    """
+    Занятые области уровня в равномерной сетке - для расстановки объектов без наложений.
+
+    Каждая область хранится расширенной на clearance с каждой стороны; новая область
+    подходит, если её расширенный прямоугольник не пересекает ни одну из сохранённых.
+    Мелким объектам (монетам) можно передать свой, меньший отступ: зазор между двумя
+    объектами - сумма их отступов.
+    Проверка смотрит только ячейки под прямоугольником, поэтому не зависит от числа
+    уже расставленных объектов.
+    """
+
+    def __init__(self, cell_size: int = 128, clearance: int = 50):
+        """
+        :param cell_size: Размер ячейки сетки в пикселях
+        :param clearance: Отступ вокруг каждого объекта (минимальный зазор между объектами - 2 * clearance)
+        """
+        self.cell_size = cell_size
+        self.clearance = clearance
+        self.cells: Dict[Tuple[int, int], List[pygame.Rect]] = {}
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def fits(self, rect: pygame.Rect, clearance: Optional[int] = None) -> bool:
+        """Не пересекается ли область (с отступом clearance, по умолчанию - отступом сетки) с уже занятыми"""
+        if clearance is None:
+            clearance = self.clearance
+        padded = rect.inflate(clearance * 2, clearance * 2)
+        cells = self.cells
+        for cell in self._cells(padded):
+            used = cells.get(cell)
+            if used and padded.collidelist(used) != -1:
+                return False
+        return True
+
+    def add(self, rect: pygame.Rect, clearance: Optional[int] = None):
+        """Помечает область занятой (с отступом clearance, по умолчанию - отступом сетки)"""
+        if clearance is None:
+            clearance = self.clearance
+        padded = rect.inflate(clearance * 2, clearance * 2)
+        for cell in self._cells(padded):
+            self.cells.setdefault(cell, []).append(padded)
+        self.count += 1
+
+    def find_position(self, rng: random.Random, size: Size, x_range: Tuple[int, int], y_range: Tuple[int, int],
+                      attempts: int = 100, clearance: Optional[int] = None) -> Optional[Position]:
+        """
+        Свободная позиция для объекта размера size и занимает её.
+
+        Сначала - случайные попытки (как при обычной выборке с отказами), затем полный
+        перебор узлов сетки в случайном порядке: если место есть, оно будет найдено.
+
+        :param rng: Генератор случайных чисел уровня
+        :param size: Размер объекта
+        :param x_range: Допустимый диапазон x левого верхнего угла (включительно)
+        :param y_range: Допустимый диапазон y левого верхнего угла (включительно)
+        :param attempts: Число случайных попыток до полного перебора
+        :param clearance: Отступ вокруг объекта (по умолчанию - отступ сетки)
+        :return: Позиция или None, если свободного места нет
+        """
+        width, height = size
+        for _ in range(attempts):
+            x = rng.randint(*x_range)
+            y = rng.randint(*y_range)
+            if self._try_place(x, y, width, height, clearance):
+                return x, y
+
+        step = max(1, self.cell_size // 4)
+        candidates = [(x, y)
+                      for x in range(x_range[0], x_range[1] + 1, step)
+                      for y in range(y_range[0], y_range[1] + 1, step)]
+        rng.shuffle(candidates)
+        for x, y in candidates:
+            if self._try_place(x, y, width, height, clearance):
+                return x, y
+        return None
+
+    def find_nearest(self, size: Size, x: int, x_range: Tuple[int, int], y_range: Tuple[int, int],
+                     clearance: Optional[int] = None, step: int = 8) -> Optional[Position]:
+        """
+        Свободная позиция, ближайшая по x к заданной, и занимает её.
+
+        Нужна, чтобы сдвинуть объект, которому не нашлось места в его окне, а не терять его.
+        Для каждой высоты из y_range (с шагом step) занятые области один раз переводятся
+        в запрещённые отрезки x, и ближайший свободный x берётся сразу, без перебора точек.
+
+        :param size: Размер объекта
+        :param x: Желаемый x левого верхнего угла
+        :param x_range: Допустимый диапазон x левого верхнего угла (включительно)
+        :param y_range: Допустимый диапазон y левого верхнего угла (включительно)
+        :param clearance: Отступ вокруг объекта (по умолчанию - отступ сетки)
+        :param step: Шаг перебора высот в пикселях
+        :return: Позиция или None, если свободного места нет
+        """
+        width, height = size
+        if clearance is None:
+            clearance = self.clearance
+        x = min(max(x, x_range[0]), x_range[1])
+
+        # Все занятые области в полосе, которую может задеть объект (одна область лежит в нескольких ячейках)
+        band = pygame.Rect(x_range[0] - clearance, y_range[0] - clearance,
+                           x_range[1] - x_range[0] + width + 2 * clearance,
+                           y_range[1] - y_range[0] + height + 2 * clearance)
+        used = {}
+        for cell in self._cells(band):
+            for rect in self.cells.get(cell, ()):
+                used[id(rect)] = rect
+        used = list(used.values())
+
+        best = None
+        for y in range(y_range[0], y_range[1] + 1, step):
+            top, bottom = y - clearance, y + height + clearance
+            # Запрещённые x левого угла: объект с отступом пересекает область (как colliderect)
+            blocked = sorted((rect.left - clearance - width + 1, rect.right + clearance - 1)
+                             for rect in used if top < rect.bottom and bottom > rect.top)
+            candidate = self._nearest_free(x, x_range, blocked)
+            if candidate is not None and (best is None or abs(candidate - x) < abs(best[0] - x)):
+                best = candidate, y
+                if candidate == x:
+                    break
+        if best is not None:
+            self.add(pygame.Rect(best, size), clearance)
+        return best
+
+    def clear(self):
+        self.cells.clear()
+        self.count = 0
+
+    def _try_place(self, x: int, y: int, width: int, height: int, clearance: Optional[int] = None) -> bool:
+        """fits + add за один проход по ячейкам (горячий путь расстановки)"""
+        if clearance is None:
+            clearance = self.clearance
+        padded = pygame.Rect(x - clearance, y - clearance, width + clearance * 2, height + clearance * 2)
+        cells = self.cells
+        covered = self._cells(padded)
+        for cell in covered:
+            used = cells.get(cell)
+            if used and padded.collidelist(used) != -1:
+                return False
+        for cell in covered:
+            used = cells.get(cell)
+            if used is None:
+                cells[cell] = [padded]
+            else:
+                used.append(padded)
+        self.count += 1
+        return True
+
+    @staticmethod
+    def _nearest_free(x: int, x_range: Tuple[int, int], blocked: List[Tuple[int, int]]) -> Optional[int]:
+        """Ближайшая к x точка диапазона x_range вне отсортированных запрещённых отрезков [start, end]"""
+        merged = []
+        for start, end in blocked:
+            if merged and start <= merged[-1][1] + 1:
+                if end > merged[-1][1]:
+                    merged[-1][1] = end
+            else:
+                merged.append([start, end])
+        for start, end in merged:
+            if start <= x <= end:
+                left, right = start - 1, end + 1
+                options = [value for value in (left, right) if x_range[0] <= value <= x_range[1]]
+                return min(options, key=lambda value: abs(value - x)) if options else None
+        return x
+
+    def _cells(self, rect: pygame.Rect) -> List[Tuple[int, int]]:
+        size = self.cell_size
+        rows = range(rect.top // size, (rect.bottom - 1) // size + 1)
+        return [(cx, cy) for cx in range(rect.left // size, (rect.right - 1) // size + 1) for cy in rows]
+
+
+class SpacingLine:
+    """
+    Занятые координаты по одной оси с минимальным расстоянием между ними.
+
+    Координаты хранятся отсортированными: проверка соседей - двоичный поиск,
+    а при нехватке места свободные участки перечисляются за один проход.
+    """
+
+    def __init__(self):
+        self.positions: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def fits(self, x: int, min_distance: int) -> bool:
+        """Расстояние от x до ближайших занятых координат не меньше min_distance"""
+        i = bisect.bisect_left(self.positions, x)
+        if i > 0 and x - self.positions[i - 1] < min_distance:
+            return False
+        if i < len(self.positions) and self.positions[i] - x < min_distance:
+            return False
+        return True
+
+    def add(self, x: int):
+        bisect.insort(self.positions, x)
+
+    def find_position(self, rng: random.Random, x_range: Tuple[int, int], min_distance: int,
+                      attempts: int = 20) -> Optional[int]:
+        """
+        Свободная координата в диапазоне x_range (включительно) и занимает её.
+
+        Сначала - случайные попытки, затем равномерный выбор среди всех свободных
+        участков: если место есть, оно будет найдено.
+
+        :return: Координата или None, если свободного места нет
+        """
+        for _ in range(attempts):
+            x = rng.randint(*x_range)
+            if self.fits(x, min_distance):
+                self.add(x)
+                return x
+
+        # Свободные участки [start, end] между занятыми координатами
+        free = []
+        start = x_range[0]
+        for used in self.positions + [x_range[1] + min_distance]:
+            end = min(used - min_distance, x_range[1])
+            if end >= start:
+                free.append((start, end))
+            start = max(start, used + min_distance)
+        if not free:
+            return None
+
+        total = sum(end - start + 1 for start, end in free)
+        offset = rng.randrange(total)
+        for start, end in free:
+            length = end - start + 1
+            if offset < length:
+                x = start + offset
+                self.add(x)
+                return x
+            offset -= length
+        return None
+
+    def clear(self):
+        self.positions.clear()
@@ -0,0 +1,44 @@
+from typing import Callable, Generic, List, TypeVar
+
+T = TypeVar("T")
+
+
+class ObjectPool(Generic[T]):
+    """
+    Пул переиспользуемых игровых объектов одного вида.
+
+    Объекты, вернувшиеся в пул, выдаются снова через reset(*args) вместо
+    создания новых - так уровень, который постоянно строит и убирает
+    объекты, не нагружает сборщик мусора и не пересоздаёт спрайты.
+    """
+
+    def __init__(self, factory: Callable[..., T], max_size: int = 256):
+        """
+        :param factory: Создаёт новый объект из тех же аргументов, что принимает его reset()
+        :param max_size: Сколько свободных объектов держать (лишние отдаются сборщику мусора)
+        """
+        self.factory = factory
+        self.max_size = max_size
+        self.free: List[T] = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, *args) -> T:
+        """Объект из пула (или новый, если пул пуст)"""
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args)
+            self.reused += 1
+            return obj
+        self.created += 1
+        return self.factory(*args)
+
+    def release(self, obj: T):
+        """Возвращает объект в пул"""
+        if len(self.free) < self.max_size:
+            self.free.append(obj)
+
+    @property
+    def stats(self) -> dict:
+        """Счётчики пула: создано, переиспользовано и свободно сейчас"""
+        return {"created": self.created, "reused": self.reused, "free": len(self.free)}
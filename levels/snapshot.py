@@ -0,0 +1,107 @@
+import gzip
+import json
+import os
+import threading
+from typing import Dict, Optional
+
+from custom_logging import Logger
+
+# Версия формата и генератора: при изменении генерации уровней увеличить - старые снимки перестанут читаться
+SNAPSHOT_VERSION = 4
+
+
+class LevelSnapshotCache:
+    """
+    Кэш снимков раскладки уровней (Level.to_snapshot) по номеру уровня и зерну.
+
+    Снимки хранятся в памяти процесса (рестарт уровня не трогает диск) и,
+    если зерно задано явно (повтор записи, замеры), в каталоге на диске
+    в виде gzip JSON. На диске остаются только max_files последних снимков.
+    """
+
+    def __init__(self, directory: str, max_files: int = 64):
+        """
+        :param directory: Каталог для снимков (создаётся при первой записи)
+        :param max_files: Сколько последних снимков хранить на диске
+        """
+        self.directory = directory
+        self.max_files = max_files
+        self.memory: Dict[str, dict] = {}  # Имя файла -> снимок
+        self.lock = threading.RLock()  # Снимки сохраняет и фоновый поток сборки уровней
+
+    def get_filename(self, level_num: int, seed: int) -> str:
+        return f"level_{level_num}_{seed}.json.gz"
+
+    def load(self, level_num: int, seed: int) -> Optional[dict]:
+        """Снимок уровня или None, если его нет (или он устарел/повреждён)"""
+        with self.lock:
+            return self._load(level_num, seed)
+
+    def _load(self, level_num: int, seed: int) -> Optional[dict]:
+        filename = self.get_filename(level_num, seed)
+        snapshot = self.memory.get(filename)
+        if snapshot is not None:
+            return snapshot
+
+        path = os.path.join(self.directory, filename)
+        if not os.path.exists(path):
+            return None
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            Logger().warning("Не удалось прочитать снимок уровня %s: %s", path, e)
+            return None
+        if data.get("version") != SNAPSHOT_VERSION:
+            return None
+
+        snapshot = data["level"]
+        self.memory[filename] = snapshot
+        return snapshot
+
+    def save(self, level_num: int, seed: int, snapshot: dict, persist: bool = True):
+        """
+        Сохраняет снимок в памяти и на диске (ошибки записи не мешают игре).
+
+        :param persist: Записать снимок и на диск. Снимки уровней со случайным зерном
+                        больше никогда не читаются - их держим только в памяти
+        """
+        with self.lock:
+            self._save(level_num, seed, snapshot, persist)
+
+    def _save(self, level_num: int, seed: int, snapshot: dict, persist: bool):
+        filename = self.get_filename(level_num, seed)
+        self.memory[filename] = snapshot
+        if not persist:
+            return
+
+        path = os.path.join(self.directory, filename)
+        temp_path = path + ".tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with gzip.open(temp_path, "wt", encoding="utf-8") as f:
+                json.dump({"version": SNAPSHOT_VERSION, "level": snapshot}, f, separators=(",", ":"))
+            os.replace(temp_path, path)  # Недописанный файл никогда не читается как снимок
+            self._prune()
+        except OSError as e:
+            Logger().warning("Не удалось сохранить снимок уровня %s: %s", path, e)
+
+    def clear(self):
+        """Очищает кэш в памяти (файлы на диске остаются)"""
+        with self.lock:
+            self.memory.clear()
+
+    def _prune(self):
+        """Удаляет самые старые снимки сверх max_files"""
+        files = [os.path.join(self.directory, name) for name in os.listdir(self.directory)
+                 if name.endswith(".json.gz")]
+        if len(files) <= self.max_files:
+            return
+        files.sort(key=os.path.getmtime)
+        for path in files[:len(files) - self.max_files]:
+            os.remove(path)
+
+
+# Единый кэш снимков на весь процесс (каталог - в корне игры, а не в текущем каталоге)
+level_snapshots = LevelSnapshotCache(
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache", "levels"))
@@ -0,0 +1,112 @@
+import pygame
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+CellBounds = Tuple[int, int, int, int]  # Диапазон ячеек (x0, y0, x1, y1), включительно
+
+
+class SpatialHash:
+    """
+    Равномерная сетка для быстрого поиска объектов рядом с прямоугольником (broadphase).
+
+    Статические объекты регистрируются один раз, движущиеся - обновляются через update()
+    (ячейки пересчитываются, только если объект перешёл в другие ячейки).
+    Результаты запроса идут в порядке регистрации объектов.
+    """
+
+    def __init__(self, cell_size: int = 128):
+        """
+        :param cell_size: Размер ячейки сетки в пикселях
+        """
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], Set] = {}  # Ячейка -> объекты в ней
+        self.bounds: Dict[Hashable, CellBounds] = {}  # Объект -> занимаемые ячейки
+        self.order: Dict[Hashable, int] = {}  # Объект -> порядковый номер регистрации
+        self.next_order = 0
+
+    def __len__(self) -> int:
+        return len(self.bounds)
+
+    def __contains__(self, obj) -> bool:
+        return obj in self.bounds
+
+    def insert(self, obj):
+        """Регистрирует объект с атрибутом rect"""
+        if obj in self.bounds:
+            return
+        bounds = self._cell_bounds(obj.rect)
+        self.bounds[obj] = bounds
+        self.order[obj] = self.next_order
+        self.next_order += 1
+        self._add_to_cells(obj, bounds)
+
+    def remove(self, obj):
+        """Убирает объект из сетки (если он там есть)"""
+        bounds = self.bounds.pop(obj, None)
+        if bounds is None:
+            return
+        del self.order[obj]
+        self._remove_from_cells(obj, bounds)
+
+    def update(self, obj):
+        """Пересчитывает ячейки объекта после его перемещения"""
+        old_bounds = self.bounds.get(obj)
+        if old_bounds is None:
+            return
+        new_bounds = self._cell_bounds(obj.rect)
+        if new_bounds != old_bounds:
+            self._remove_from_cells(obj, old_bounds)
+            self._add_to_cells(obj, new_bounds)
+            self.bounds[obj] = new_bounds
+
+    def query(self, rect: pygame.Rect) -> List:
+        """Объекты из ячеек, которые пересекает прямоугольник (кандидаты для точной проверки)"""
+        return sorted(self.find(rect), key=self.order.__getitem__)
+
+    def find(self, rect: pygame.Rect, found: Optional[Set] = None) -> Set:
+        """
+        То же, что query, но без сортировки.
+
+        :param found: Множество, в которое добавляются объекты (для поиска сразу в нескольких сетках)
+        """
+        x0, y0, x1, y1 = self._cell_bounds(rect)
+        if found is None:
+            found = set()
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+        return found
+
+    def clear(self):
+        """Удаляет все объекты"""
+        self.cells.clear()
+        self.bounds.clear()
+        self.order.clear()
+
+    def _cell_bounds(self, rect: pygame.Rect) -> CellBounds:
+        size = self.cell_size
+        return (rect.left // size, rect.top // size,
+                (rect.right - 1) // size, (rect.bottom - 1) // size)
+
+    def _add_to_cells(self, obj, bounds: CellBounds):
+        x0, y0, x1, y1 = bounds
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    cells[(cx, cy)] = {obj}
+                else:
+                    cell.add(obj)
+
+    def _remove_from_cells(self, obj, bounds: CellBounds):
+        x0, y0, x1, y1 = bounds
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = self.cells.get((cx, cy))
+                if cell is not None:
+                    cell.discard(obj)
+                    if not cell:
+                        del self.cells[(cx, cy)]
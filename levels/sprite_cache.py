@@ -0,0 +1,44 @@
+import pygame
+from typing import Dict, List, Tuple
+
+# Кадр атласа: повёрнутый спрайт и смещение его левого верхнего угла относительно центра
+RotatedFrame = Tuple[pygame.Surface, Tuple[int, int]]
+
+
+class RotationAtlas:
+    """Общий кэш заранее повёрнутых кадров спрайтов (пилы, артефакты)"""
+
+    def __init__(self):
+        self._frames: Dict[Tuple[pygame.Surface, int], List[RotatedFrame]] = {}
+
+    def get_frames(self, sprite: pygame.Surface, step: int) -> List[RotatedFrame]:
+        """
+        Возвращает все кадры поворота спрайта с заданным шагом (строит их один раз).
+
+        :param sprite: Исходный спрайт
+        :param step: Шаг угла поворота в градусах (360 должно делиться на шаг)
+        :return: Список из 360 // step кадров
+        """
+        key = (sprite, step)
+        frames = self._frames.get(key)
+        if frames is None:
+            frames = []
+            for angle in range(0, 360, step):
+                rotated = pygame.transform.rotate(sprite, angle)
+                width, height = rotated.get_size()
+                frames.append((rotated, (-(width // 2), -(height // 2))))
+            self._frames[key] = frames
+        return frames
+
+    def get(self, sprite: pygame.Surface, angle: int, step: int) -> RotatedFrame:
+        """Кадр для угла angle (угол кратен шагу)"""
+        frames = self.get_frames(sprite, step)
+        return frames[(angle // step) % len(frames)]
+
+    def clear(self):
+        """Освобождает все построенные кадры"""
+        self._frames.clear()
+
+
+# Единый атлас на весь процесс: кадры строятся один раз на спрайт, а не на объект
+rotation_atlas = RotationAtlas()
@@ -0,0 +1,138 @@
+import pygame
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+
+
+class StaticLayer:
+    """
+    Кэш неподвижной геометрии уровня (фон, платформы, люки, стены, шипы).
+
+    Геометрия лениво рисуется в вертикальные полосы-чанки фиксированной ширины,
+    которые хранятся в ограниченном LRU-кэше. Память не зависит от ширины уровня.
+    """
+
+    def __init__(self, height: int, background: pygame.Surface, chunk_width: int = 512, capacity: int = 8,
+                 width: Optional[int] = None):
+        """
+        Инициализация кэша статического слоя.
+
+        :param height: Высота слоя (высота уровня)
+        :param background: Фон, который подкладывается под статические объекты (повторяется по X)
+        :param chunk_width: Ширина одного чанка в пикселях
+        :param capacity: Максимальное количество чанков в памяти
+        :param width: Ширина уровня - за её пределами чанки заранее не строятся (None - без ограничения справа)
+        """
+        self.height = height
+        self.width = width
+        self.background = background
+        self.chunk_width = chunk_width
+        self.capacity = max(1, capacity)
+        self.chunks: "OrderedDict[int, pygame.Surface]" = OrderedDict()  # Индекс чанка -> поверхность
+        self.objects_by_chunk: Dict[int, List] = {}  # Индекс чанка -> статические объекты в нём
+
+        # Счётчики для подбора размера чанка и ёмкости кэша
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def set_objects(self, static_objects: Iterable):
+        """Задаёт набор статических объектов и сбрасывает все построенные чанки"""
+        self.objects_by_chunk = {}
+        for obj in static_objects:
+            for index in self._chunk_range(obj.rect.left, obj.rect.right):
+                self.objects_by_chunk.setdefault(index, []).append(obj)
+        self.invalidate()
+
+    def add_objects(self, static_objects: Iterable):
+        """Добавляет статические объекты и сбрасывает только чанки, на которые они попали"""
+        for obj in static_objects:
+            for index in self._chunk_range(obj.rect.left, obj.rect.right):
+                self.objects_by_chunk.setdefault(index, []).append(obj)
+                self.chunks.pop(index, None)
+
+    def remove_objects(self, static_objects: Iterable):
+        """Убирает статические объекты и сбрасывает только чанки, на которых они были"""
+        for obj in static_objects:
+            for index in self._chunk_range(obj.rect.left, obj.rect.right):
+                objects = self.objects_by_chunk.get(index)
+                if objects is None:
+                    continue
+                if obj in objects:
+                    objects.remove(obj)
+                if not objects:
+                    del self.objects_by_chunk[index]
+                self.chunks.pop(index, None)
+
+    def invalidate(self):
+        """Сбрасывает все чанки; они будут перестроены при следующей отрисовке"""
+        self.chunks.clear()
+
+    def invalidate_rect(self, rect: pygame.Rect):
+        """Сбрасывает только чанки, пересекающие прямоугольник (в координатах уровня)"""
+        for index in self._chunk_range(rect.left, rect.right):
+            self.chunks.pop(index, None)
+
+    def get_chunk(self, index: int) -> pygame.Surface:
+        """Возвращает чанк из кэша, при промахе строит его и вытесняет самый старый"""
+        chunk = self.chunks.get(index)
+        if chunk is not None:
+            self.hits += 1
+            self.chunks.move_to_end(index)
+            return chunk
+
+        self.misses += 1
+        chunk = self._build_chunk(index)
+        self.chunks[index] = chunk
+        while len(self.chunks) > self.capacity:
+            self.chunks.popitem(last=False)
+            self.evictions += 1
+        return chunk
+
+    def draw(self, surface: pygame.Surface, camera):
+        """Выводит чанки, пересекающие видимую область, и достраивает соседний чанк по ходу камеры"""
+        view = camera.view_rect
+        offset_x, offset_y = camera.offset
+        visible = self._chunk_range(view.left, view.right)
+        for index in visible:
+            surface.blit(self.get_chunk(index), (index * self.chunk_width + offset_x, offset_y))
+
+        # Не больше одного нового чанка за кадр, чтобы не было рывков (только в пределах уровня)
+        last = (self.width - 1) // self.chunk_width if self.width is not None else visible.stop
+        for index in (visible.stop, visible.start - 1):
+            if 0 <= index <= last and index not in self.chunks:
+                self.get_chunk(index)
+                break
+
+    @property
+    def stats(self) -> dict:
+        """Счётчики кэша: попадания, промахи, вытеснения и текущий размер"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "chunks": len(self.chunks),
+            "capacity": self.capacity,
+            "chunk_width": self.chunk_width,
+        }
+
+    def _chunk_range(self, left: int, right: int) -> range:
+        """Индексы чанков, покрывающих отрезок [left, right) по X"""
+        return range(left // self.chunk_width, (right - 1) // self.chunk_width + 1)
+
+    def _build_chunk(self, index: int) -> pygame.Surface:
+        """Рисует фон и статические объекты одного чанка"""
+        chunk_x = index * self.chunk_width
+        chunk = pygame.Surface((self.chunk_width, self.height))
+        if pygame.display.get_surface() is not None:
+            chunk = chunk.convert()  # Формат экрана - самый быстрый blit
+
+        # Фон повторяется по горизонтали
+        bg_width = self.background.get_width()
+        x = -(chunk_x % bg_width)
+        while x < self.chunk_width:
+            chunk.blit(self.background, (x, 0))
+            x += bg_width
+
+        for obj in self.objects_by_chunk.get(index, ()):
+            obj.draw(chunk, (-chunk_x, 0))
+        return chunk
@@ -1,15 +1,23 @@
+import argparse
+import atexit
 import pygame
 import sys
+import time
+from typing import Optional
 
 from custom_logging import Logger
 
 # Инициализация логгера
 Logger().initialize()
 
-from levels.levels import LevelManager, LEVEL_WIDTH, SCREEN_WIDTH, SCREEN_HEIGHT
+from levels.levels import SCREEN_WIDTH, SCREEN_HEIGHT, preload
 from levels.menu import MainMenu, FinalMenu
-from Characters.Hero.hero import Hero
 from levels.audio import SoundManager  # класс управления звуками
+from game.config import GameConfig
+from game.display import DisplayUpdater
+from game.session import GameSession
+from game.profiler import profiler
+from game.replay import InputRecorder, InputPlayer
 
 # Инициализация Pygame
 pygame.init()
@@ -33,6 +41,15 @@ font = pygame.font.SysFont('Arial', 24)
 large_font = pygame.font.SysFont('Arial', 72)  # Для Game Over текста
 
 
+def show_loading_screen():
+    """Показывает экран загрузки, пока загружаются спрайты уровней"""
+    screen.fill(DARK_GREEN)
+    text = font.render("Загрузка...", True, WHITE)
+    screen.blit(text, (SCREEN_WIDTH // 2 - text.get_width() // 2, SCREEN_HEIGHT // 2 - text.get_height() // 2))
+    pygame.display.flip()
+    preload()
+
+
 def wait_for_key_release(key):
     while True:
         for event in pygame.event.get():
@@ -40,206 +57,260 @@ def wait_for_key_release(key):
                 return
 
 
+def draw_hud(session: GameSession, display: DisplayUpdater):
+    """Уровень, счёт, артефакты и жизни в левом верхнем углу"""
+    level_manager = session.level_manager
+    level = session.level
+    info_y = 20
+    player_lives, player_init_lives = session.player.get_lives()
+    if level_manager.is_endless:
+        level_text = f"Забег: {level.distance // 100} м"
+    else:
+        level_text = f"Уровень: {level_manager.current_level_num}/3"
+    for text in [
+        level_text,
+        f"Счет: {level_manager.total_score + level.score}",
+        f"Артефакты: {level.artifacts_collected}/{level.artifacts_required}",
+        f"Жизни: {player_lives}/{player_init_lives}",
+    ]:
+        text_rect = screen.blit(font.render(text, True, WHITE), (20, info_y))
+        display.track(("hud", info_y), text_rect, text)
+        info_y += 30
+
+    if level.completed:
+        text = font.render(f"Level {level_manager.current_level_num} completed!", True, WHITE)
+        screen.blit(text, (SCREEN_WIDTH // 2 - text.get_width() // 2, SCREEN_HEIGHT // 2 - 20))
+
+
+def dump_profile():
+    """Сохраняет замеры профилировщика при выходе"""
+    if profiler.dump(GameConfig.PROFILE_DUMP):
+        Logger().info("Замеры профилировщика сохранены в %s", GameConfig.PROFILE_DUMP)
+
+
+def start_session(debug_mode: bool, record_path: Optional[str] = None, endless: bool = False) -> GameSession:
+    """Начинает новую игру (с записью ввода, если задан record_path)"""
+    session = GameSession(debug_mode=debug_mode, sound_manager=sound_manager, endless=endless)
+    if record_path:
+        session.recorder = InputRecorder(session.seed, debug_mode, GameConfig.SIMULATION_RATE, endless)
+    return session
+
+
+def end_session(session: Optional[GameSession], record_path: Optional[str] = None):
+    """Завершает игру: сохраняет запись ввода"""
+    if session is not None and session.recorder is not None and record_path:
+        session.recorder.save(record_path, session.get_state())
+        Logger().info("Запись ввода сохранена в %s (%s шагов)", record_path, session.recorder.ticks)
+
+
+def quit_game(session: Optional[GameSession] = None, record_path: Optional[str] = None):
+    end_session(session, record_path)
+    pygame.quit()
+    sys.exit()
+
+
+def draw_game(session: GameSession, alpha: float, display: DisplayUpdater):
+    """Кадр игры: уровень, герой, HUD и экраны паузы/конца игры"""
+    level = session.level
+    # Пауза, конец игры и завершённый уровень - неподвижные экраны
+    display.set_scene(("game", id(level), id(session.player), session.get_render_camera(alpha).offset,
+                       session.paused, session.game_over, level.completed, profiler.show_overlay))
+    if not display.needs_redraw(static=session.frozen):
+        return
+
+    screen.fill(DARK_GREEN)
+    with profiler.scope("draw"):
+        session.draw(screen, alpha, display)
+
+    # UI
+    with profiler.scope("hud"):
+        draw_hud(session, display)
+
+    # Game Over/Pause экран
+    if session.game_over or session.paused:
+        s = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        s.fill((0, 0, 0, 180))
+        screen.blit(s, (0, 0))
+
+        line1 = "GAME OVER" if session.game_over else "ПАУЗА"
+        line1_color = RED if session.game_over else GREEN
+        line2 = "Нажмите R для рестарта" if session.game_over else "Нажмите P чтобы продолжить"
+
+        game_over_text = large_font.render(line1, True, line1_color)
+        restart_text = font.render(line2, True, WHITE)
+        screen.blit(game_over_text,
+                    (SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, SCREEN_HEIGHT // 2 - 50))
+        screen.blit(restart_text, (SCREEN_WIDTH // 2 - restart_text.get_width() // 2, SCREEN_HEIGHT // 2 + 50))
+
+    overlay_rect = profiler.draw_overlay(screen, font)
+    if overlay_rect is not None:
+        display.mark(overlay_rect)  # Цифры меняются каждый кадр
+    with profiler.scope("present"):
+        display.present()
+
+
+def run_replay(path: str, uncapped: bool = False):
+    """
+    Воспроизводит запись ввода шаг в шаг.
+
+    :param path: Файл записи (--record)
+    :param uncapped: Без ограничения частоты - шаг симуляции и кадр так быстро, как получится
+    """
+    player = InputPlayer.load(path)
+    GameConfig.SIMULATION_RATE = player.simulation_rate
+    session = GameSession(debug_mode=player.debug_mode, seed=player.seed, endless=player.endless)
+    display = DisplayUpdater(GameConfig.DIRTY_RECTS)
+    clock = pygame.time.Clock()
+    step_ms = 1000.0 / GameConfig.SIMULATION_RATE
+    accumulator = 0.0
+    start = time.perf_counter()
+    frames = 0
+
+    while not player.finished(session.tick_count) and not session.finished:
+        frame_ms = clock.tick(0 if uncapped else GameConfig.RENDER_FPS)
+        if profiler.enabled:
+            profiler.add("frame", frame_ms)
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                return
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                profiler.toggle_overlay()
+
+        accumulator = step_ms if uncapped else accumulator + min(frame_ms, GameConfig.MAX_FRAME_TIME)
+        while accumulator >= step_ms and not player.finished(session.tick_count) and not session.finished:
+            tick = session.tick_count
+            for command in player.commands_for(tick):
+                session.handle_command(command)
+            session.apply_input(player.keys_for(tick))
+            session.tick()
+            accumulator -= step_ms
+
+        draw_game(session, accumulator / step_ms, display)
+        frames += 1
+
+    elapsed = time.perf_counter() - start
+    print(f"Воспроизведено шагов: {session.tick_count}, кадров: {frames}, "
+          f"время: {elapsed:.2f} с ({session.tick_count / elapsed:.1f} шагов/с)")
+    if player.final_state is not None:
+        state = session.get_state()
+        if state == player.final_state:
+            print("Состояние совпало с записью")
+        else:
+            print(f"Состояние разошлось с записью: {state} != {player.final_state}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="NO EXIT")
+    parser.add_argument("--record", metavar="FILE", help="Записать ввод каждой игры в файл")
+    parser.add_argument("--replay", metavar="FILE", help="Воспроизвести запись ввода")
+    parser.add_argument("--uncapped", action="store_true", help="Воспроизводить без ограничения частоты кадров")
+    return parser.parse_args()
+
+
 def main():
+    args = parse_args()
+    show_loading_screen()
+    profiler.enabled = GameConfig.PROFILING
+    atexit.register(dump_profile)
+
+    if args.replay:
+        run_replay(args.replay, args.uncapped)
+        return
+
     # Инициализация меню
     current_menu = MainMenu()
     in_menu = True
-    debug_mode = False
 
     # Игровые переменные
     clock = pygame.time.Clock()
-    level_manager = None
-    player = None
-    start_pos = [0, 0]
-    camera_offset = [0, 0]
-    game_over = False
-    paused = False
+    session = None
+    display = DisplayUpdater(GameConfig.DIRTY_RECTS)
+
+    # Фиксированный шаг симуляции: время кадра копится и расходуется шагами step_ms
+    step_ms = 1000.0 / GameConfig.SIMULATION_RATE
+    accumulator = 0.0
 
     while True:
-        # Обработка событий
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+        frame_ms = clock.tick(0 if GameConfig.UNTHROTTLED else GameConfig.RENDER_FPS)
+        if profiler.enabled:
+            profiler.add("frame", frame_ms)
 
-            if in_menu:
-                action = current_menu.handle_event(event)
-                if action == "start":
-                    in_menu = False
-                    debug_mode = False
-                    # Инициализация игры
-                    level_manager = LevelManager(debug_mode=debug_mode)
-                    start_portal = next((p for p in level_manager.current_level.portals if not p.is_finish), None)
-                    start_pos = (start_portal.rect.x + 30, start_portal.rect.y - 50) if start_portal else (
-                        100, SCREEN_HEIGHT - 150)
-                    player = Hero(start_pos)
-                    level_manager.current_level.remove_start_portal()
-                elif action == "debug":
-                    in_menu = False
-                    debug_mode = True
-                    # Инициализация debug режима
-                    level_manager = LevelManager(debug_mode=True)
-                    start_portal = next((p for p in level_manager.current_level.portals if not p.is_finish), None)
-                    start_pos = (start_portal.rect.x + 30, start_portal.rect.y - 50) if start_portal else (
-                        100, SCREEN_HEIGHT - 150)
-                    player = Hero(start_pos)
-                    level_manager.current_level.remove_start_portal()
-                elif action == "credits":
-                    current_menu.credits_shown = True
-                elif action == "main_menu":
-                    current_menu = MainMenu()
-                elif action == "quit":
-                    pygame.quit()
-                    sys.exit()
-            else:
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        in_menu = True
+        # Обработка событий
+        with profiler.scope("input"):
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    quit_game(None if in_menu else session, args.record)
+
+                if in_menu:
+                    action = current_menu.handle_event(event)
+                    if action in ("start", "debug", "endless"):
+                        in_menu = False
+                        # Инициализация игры (debug режима или бесконечного забега)
+                        session = start_session(debug_mode=action == "debug", record_path=args.record,
+                                                endless=action == "endless")
+                        accumulator = 0.0
+                    elif action == "credits":
+                        current_menu.credits_shown = True
+                    elif action == "main_menu":
                         current_menu = MainMenu()
-                    elif event.key == pygame.K_F1:
-                        debug_mode = not debug_mode
-                        level_manager.reset(debug_mode=debug_mode)
-                        start_portal = next((p for p in level_manager.current_level.portals if not p.is_finish), None)
-                        start_pos = (start_portal.rect.x + 30, start_portal.rect.y - 50) if start_portal else (
-                            100, SCREEN_HEIGHT - 150)
-                        player = Hero(start_pos)
-                    elif event.key == pygame.K_SPACE and level_manager.current_level.completed:
-                        if not level_manager.next_level():
-                            current_menu = FinalMenu()
+                    elif action == "quit":
+                        quit_game()
+                else:
+                    if event.type == pygame.KEYDOWN:
+                        if event.key == pygame.K_ESCAPE:
+                            end_session(session, args.record)
                             in_menu = True
-                        else:
-                            start_portal = next((p for p in level_manager.current_level.portals if not p.is_finish),
-                                                None)
-                            start_pos = (start_portal.rect.x + 30, start_portal.rect.y - 50) if start_portal else (
-                                100, SCREEN_HEIGHT - 150)
-                            player = Hero(start_pos)
-                    elif event.key == pygame.K_r and game_over:
-                        level_manager.reset()
-                        start_portal = next((p for p in level_manager.current_level.portals if not p.is_finish), None)
-                        start_pos = (start_portal.rect.x + 30, start_portal.rect.y - 50) if start_portal else (
-                            100, SCREEN_HEIGHT - 150)
-                        player = Hero(start_pos)
-                        level_manager.current_level.portal_remove_timer = None
-                        level_manager.current_level.remove_start_portal()
-                        game_over = False
+                            current_menu = MainMenu()
+                        elif event.key == pygame.K_F1:
+                            session.handle_command("toggle_debug")
+                        elif event.key == pygame.K_F3:
+                            profiler.toggle_overlay()
+                        elif event.key == pygame.K_SPACE:
+                            session.handle_command("next_level")
+                        elif event.key == pygame.K_r:
+                            session.handle_command("restart")
+
+                    if session.finished:
+                        end_session(session, args.record)
+                        current_menu = FinalMenu()
+                        in_menu = True
+                        break
 
         # Отрисовка
         if in_menu:
-            current_menu.draw(screen)
+            display.set_scene(("menu", id(current_menu), current_menu.current_button_index, current_menu.credits_shown))
+            if display.needs_redraw(static=True):
+                current_menu.draw(screen)
+                display.present()
         else:
             # Управление игрой
             keys = pygame.key.get_pressed()
 
-            if keys[pygame.K_s]:
-                player.sit_down()
-            elif player.is_sitting():
-                player.stand_up(level_manager.current_level.get_all_game_objects())
-
-            if keys[pygame.K_a]:
-                player.move(-1)
-            elif keys[pygame.K_d]:
-                player.move(1)
-            else:
-                player.move(0)
-
-            if keys[pygame.K_SPACE] and player.on_ground:
-                sound_manager.play_sound('jump')
-                player.jump()
-
             if keys[pygame.K_p]:
-                paused = not paused
+                session.handle_command("pause")
                 wait_for_key_release(pygame.K_p)
+                clock.tick()  # Время ожидания отпускания клавиши не идёт в симуляцию
 
-            if not level_manager.current_level.completed and not game_over and not paused:
-                # Обновление игры
-                level_manager.update(player_rect=player.rect)
-                player.update()
-                player.apply_physics(level_manager.current_level.get_all_game_objects(), LEVEL_WIDTH, SCREEN_HEIGHT)
-
-                if player.rect.top > SCREEN_HEIGHT:
-                    game_over = True
-
-                if not level_manager.current_level.start_portal_removed:
-                    level_manager.current_level.remove_start_portal()
-
-                # Обработка столкновений
-                if (level_manager.current_level.check_hazard_collision(player.rect) or
-                        level_manager.current_level.check_fall_into_pit(player.rect)):
-                    sound_manager.play_sound('death')
-                    player.lose_life()
-                    if not player.is_live():
-                        game_over = True
-                    player.teleport(start_pos)
-
-                # Сбор бонусов
-                collected_points = level_manager.current_level.collect_bonuses(player.rect)
-                if collected_points:
-                    sound_manager.play_sound('coin')
-                level_manager.current_level.score += collected_points
-
-                if level_manager.current_level.collect_artifacts(player.rect):
-                    pass
-
-                if level_manager.current_level.check_finish(player.rect):
-                    level_manager.current_level.completed = True
-                    level_manager.current_level.completion_time = pygame.time.get_ticks()
-
-                camera_offset[0] = SCREEN_WIDTH // 2 - player.rect.centerx
-                camera_offset[0] = max(min(camera_offset[0], 0), SCREEN_WIDTH - LEVEL_WIDTH)
-            elif level_manager.current_level.completed and not game_over:
-                if pygame.time.get_ticks() - level_manager.current_level.completion_time > 3000:
-                    if not level_manager.next_level():
-                        current_menu = FinalMenu()
-                        in_menu = True
-                    else:
-                        start_portal = next((p for p in level_manager.current_level.portals if not p.is_finish), None)
-                        start_pos = (start_portal.rect.x + 30, start_portal.rect.y - 50) if start_portal else (
-                            100, SCREEN_HEIGHT - 150)
-                        player.teleport(start_pos)
+            # Шаги симуляции за прошедшее время
+            if GameConfig.UNTHROTTLED:
+                accumulator = step_ms
+            else:
+                accumulator += min(frame_ms, GameConfig.MAX_FRAME_TIME)
+            while accumulator >= step_ms:
+                session.apply_input(keys)
+                session.tick()
+                accumulator -= step_ms
+                if session.finished:
+                    end_session(session, args.record)
+                    current_menu = FinalMenu()
+                    in_menu = True
+                    break
+            if in_menu:
+                continue
 
             # Отрисовка игры
-            screen.fill(DARK_GREEN)
-            level_surface = pygame.Surface((LEVEL_WIDTH, SCREEN_HEIGHT))
-            level_manager.current_level.draw(level_surface)
-            screen.blit(level_surface, camera_offset)
-
-            if player:
-                player.draw(screen, camera_offset)
-
-            # UI
-            info_y = 20
-            player_lives, player_init_lives = player.get_lives()
-            for text in [
-                f"Уровень: {level_manager.current_level_num}/3",
-                f"Счет: {level_manager.total_score + level_manager.current_level.score}",
-                f"Артефакты: {level_manager.current_level.artifacts_collected}/{level_manager.current_level.artifacts_required}",
-                f"Жизни: {player_lives}/{player_init_lives}",
-            ]:
-                screen.blit(font.render(text, True, WHITE), (20, info_y))
-                info_y += 30
-
-            if level_manager.current_level.completed:
-                text = font.render(f"Level {level_manager.current_level_num} completed!", True, WHITE)
-                screen.blit(text, (SCREEN_WIDTH // 2 - text.get_width() // 2, SCREEN_HEIGHT // 2 - 20))
-
-            # Game Over/Pause экран
-            if game_over or paused:
-                s = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                s.fill((0, 0, 0, 180))
-                screen.blit(s, (0, 0))
-
-                line1 = "GAME OVER" if game_over else "ПАУЗА"
-                line1_color = RED if game_over else GREEN
-                line2 = "Нажмите R для рестарта" if game_over else "Нажмите P чтобы продолжить"
-
-                game_over_text = large_font.render(line1, True, line1_color)
-                restart_text = font.render(line2, True, WHITE)
-                screen.blit(game_over_text,
-                            (SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, SCREEN_HEIGHT // 2 - 50))
-                screen.blit(restart_text, (SCREEN_WIDTH // 2 - restart_text.get_width() // 2, SCREEN_HEIGHT // 2 + 50))
-
-        pygame.display.flip()
-        clock.tick(60)
+            draw_game(session, accumulator / step_ms, display)
 
 
 if __name__ == "__main__":
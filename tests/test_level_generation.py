@@ -0,0 +1,59 @@
+import os
+import sys
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pygame
+
+from custom_logging import Logger
+from levels.levels import Level1, Level2, Level3, COINS_PER_PLATFORM, SCREEN_WIDTH, SCREEN_HEIGHT, preload
+
+SEEDS = range(20)
+
+
+class CoinPlacementTest(unittest.TestCase):
+    """Сетка расстановки не должна терять монеты: над каждой платформой - все COINS_PER_PLATFORM"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.cwd = os.getcwd()
+        os.chdir(ROOT)  # Пути к ресурсам относительные
+        if not Logger.is_initialized():
+            Logger().initialize()
+        pygame.init()
+        pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        preload()
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+        os.chdir(cls.cwd)
+
+    def test_every_platform_gets_all_coins(self):
+        for level_class in (Level1, Level2, Level3):
+            for seed in SEEDS:
+                level = level_class(seed=seed)
+                for platform in level.platforms:
+                    with self.subTest(level=level_class.__name__, seed=seed, platform=platform.rect.y):
+                        coins = [coin for coin in level.bonuses
+                                 if platform.rect.y - 150 <= coin.rect.y <= platform.rect.y - 50]
+                        self.assertEqual(len(coins), COINS_PER_PLATFORM)
+
+    def test_coins_do_not_overlap_other_objects(self):
+        for level_class in (Level1, Level2, Level3):
+            for seed in SEEDS:
+                level = level_class(seed=seed)
+                others = [obj.rect for obj in level.obstacles + level.artifacts + level.portals
+                          if obj not in level.platforms]
+                for coin in level.bonuses:
+                    with self.subTest(level=level_class.__name__, seed=seed, coin=coin.rect):
+                        self.assertEqual(coin.rect.collidelist(others), -1)
+
+
+if __name__ == "__main__":
+    unittest.main()